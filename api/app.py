@@ -167,14 +167,16 @@ def create_app():
             # Query parameters
             start_date = request.args.get('start_date')
             end_date = request.args.get('end_date')
+            dataset = request.args.get('dataset')
             offset = int(request.args.get('offset', 0))
             limit = int(request.args.get('limit', 100))
 
             backend = OptimizedGraphBackend()
 
-            # Use time window filter if dates provided
+            # Use time window filter if dates provided (scans only the
+            # overlapping partitions on a partitioned store)
             if start_date and end_date:
-                events = backend.get_events_by_timewindow(start_date, end_date, limit=limit)
+                events = backend.get_events_by_timewindow(start_date, end_date, limit=limit, dataset=dataset)
             else:
                 # Use pagination for all events
                 result = backend.get_events_paginated(offset=offset, limit=limit)
@@ -657,7 +659,6 @@ def create_app():
                    target.entityId as targetId, target.name as targetName
             ORDER BY e.date
             """
-            events = analyzer.backend.execute_query(events_query, {'endDate': end_date})
 
             # Get evolution links between events up to end_date
             evolution_query = """
@@ -671,10 +672,6 @@ def create_app():
                    r.emotional as emotional
             ORDER BY r.score DESC
             """
-            evolution_links = analyzer.backend.execute_query(
-                evolution_query,
-                {'endDate': end_date, 'minScore': min_score}
-            )
 
             # Get all entities (they exist throughout the timeline)
             entities_query = """
@@ -683,7 +680,6 @@ def create_app():
                    ent.type as type, ent.description as description
             ORDER BY ent.name
             """
-            entities = analyzer.backend.execute_query(entities_query)
 
             # Get risks associated with events up to end_date
             risks_query = """
@@ -698,7 +694,14 @@ def create_app():
                    e.entityId as targetEntityId, e.name as targetEntityName
             ORDER BY r.score DESC
             """
-            risks = analyzer.backend.execute_query(risks_query, {'endDate': end_date})
+
+            # The four queries are independent: run them concurrently
+            events, evolution_links, entities, risks = analyzer.backend.execute_queries([
+                (events_query, {'endDate': end_date}),
+                (evolution_query, {'endDate': end_date, 'minScore': min_score}),
+                (entities_query, None),
+                (risks_query, {'endDate': end_date})
+            ])
 
             analyzer.close()
 
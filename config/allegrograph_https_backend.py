@@ -3,13 +3,217 @@ AllegroGraph HTTPS REST API Backend
 
 Uses HTTPS (port 443) instead of direct TCP (port 10035)
 Works when port 10035 is blocked by firewall
+
+Bulk writes go through BulkWriter, which buffers N-Triples lines and
+POSTs them in batches over the shared keep-alive session
+(config.sparql_session):
+
+    with ag.bulk_writer(batch_size=5000) as writer:
+        writer.add('feekg:evt_1', 'feekg:eventType', 'feekg:DebtDefault')
+        writer.add('feekg:evt_1', 'feekg:date', '2021-12-01', datatype=XSD_DATE)
+    print(writer.summary())
 """
 
-import requests
+import re
+import time
 import os
-from typing import Dict, List, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote
 
+from config.sparql_session import get_session
+
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+XSD_STRING = f'{XSD}string'
+XSD_DATE = f'{XSD}date'
+FEEKG_NS = 'http://feekg.org/ontology#'
+
+# Prefixed names expanded in subjects, predicates and objects
+PREFIXES = {
+    'feekg': FEEKG_NS,
+    'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+    'xsd': XSD
+}
+
+# Objects matching this are written as IRIs, everything else as literals
+_IRI_PATTERN = re.compile(r'^(?:https?|urn|mailto|file):[^\s<>"{}|^`\\]*$')
+# Any absolute IRI (scheme:rest), accepted for subjects and predicates
+_ABSOLUTE_IRI_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:[^\s<>"{}|^`\\]*$')
+
+
+def _escape_literal(text: str) -> str:
+    """Escape a string for an N-Triples literal"""
+    return (text
+            .replace('\\', '\\\\')
+            .replace('"', '\\"')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r')
+            .replace('\t', '\\t'))
+
+
+def _expand_prefixed(value: str) -> Optional[str]:
+    """<IRI> for a feekg:/rdf:/rdfs:/xsd: prefixed name, else None"""
+    prefix, _, local = value.partition(':')
+    if prefix in PREFIXES and not local.startswith('//'):
+        return f"<{PREFIXES[prefix]}{local}>"
+    return None
+
+
+def ntriples_iri(value: str) -> str:
+    """
+    N-Triples form of a subject or predicate
+
+    Accepts <IRI>, _:blank, feekg:/rdf:/rdfs:/xsd: prefixed names and
+    absolute IRIs of any scheme; raises ValueError for anything else
+    (a literal there would make the server reject the whole batch).
+    """
+    if isinstance(value, str):
+        if value.startswith('<') and value.endswith('>') or value.startswith('_:'):
+            return value
+        expanded = _expand_prefixed(value)
+        if expanded:
+            return expanded
+        if _ABSOLUTE_IRI_PATTERN.match(value):
+            return f"<{value}>"
+    raise ValueError(f"Not an IRI or blank node: {value!r}")
+
+
+def ntriples_term(value, datatype: Optional[str] = None, lang: Optional[str] = None) -> str:
+    """
+    N-Triples form of an object
+
+    Strings that look like absolute IRIs (http:, https:, urn:, ...), are
+    feekg:/rdf:/rdfs:/xsd: prefixed names or are already wrapped in <>
+    become IRIs and _:x stays a blank node; other strings become plain
+    literals. bool, int, float, Decimal, date and datetime become typed
+    literals. Passing datatype or lang always makes a literal
+    (datatype=XSD_STRING for text that looks like an IRI).
+    """
+    if datatype is None and lang is None:
+        if isinstance(value, str):
+            if value.startswith('<') and value.endswith('>'):
+                return value
+            if value.startswith('_:') or _IRI_PATTERN.match(value):
+                return value if value.startswith('_:') else f"<{value}>"
+            expanded = _expand_prefixed(value)
+            if expanded:
+                return expanded
+        elif isinstance(value, bool):
+            value, datatype = str(value).lower(), f'{XSD}boolean'
+        elif isinstance(value, int):
+            datatype = f'{XSD}integer'
+        elif isinstance(value, (float, Decimal)):
+            datatype = f'{XSD}double' if isinstance(value, float) else f'{XSD}decimal'
+        elif isinstance(value, datetime):
+            value, datatype = value.isoformat(), f'{XSD}dateTime'
+        elif isinstance(value, date):
+            value, datatype = value.isoformat(), XSD_DATE
+
+    literal = f'"{_escape_literal(str(value))}"'
+    if lang:
+        return f"{literal}@{lang}"
+    if datatype and datatype != XSD_STRING:
+        return f"{literal}^^<{datatype}>"
+    return literal
+
+
+class BulkWriter:
+    """
+    Buffered N-Triples writer for AllegroGraphHTTPSBackend
+
+    Lines are POSTed when batch_size triples are buffered or max_delay
+    seconds have passed since the last flush (checked on add), and once
+    more when the with block exits. A failed batch is reported and
+    counted, not retried.
+    """
+
+    def __init__(self, backend: 'AllegroGraphHTTPSBackend', batch_size: int = 5000, max_delay: float = 5.0):
+        """
+        Args:
+            backend: Backend whose session and statements endpoint to use
+            batch_size: Triples per POST
+            max_delay: Seconds a buffered triple may wait for its batch to fill
+        """
+        self.backend = backend
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max_delay
+
+        self.lines: List[str] = []
+        self.last_flush = time.perf_counter()
+        self.started = None
+
+        self.stats = {'triples': 0, 'failed': 0, 'requests': 0, 'bytes': 0, 'post_seconds': 0.0, 'seconds': 0.0}
+
+    def __enter__(self) -> 'BulkWriter':
+        self.started = time.perf_counter()
+        self.last_flush = self.started
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            # Leave the store as of the last completed batch
+            self.lines = []
+        self.stats['seconds'] = time.perf_counter() - self.started
+        return False
+
+    def add(self, subject: str, predicate: str, obj, datatype: Optional[str] = None, lang: Optional[str] = None):
+        """
+        Buffer one triple
+
+        subject and predicate must be IRIs (see ntriples_iri, ValueError
+        otherwise); see ntriples_term for how obj is serialized.
+        """
+        self.lines.append(
+            f"{ntriples_iri(subject)} {ntriples_iri(predicate)} {ntriples_term(obj, datatype, lang)} .\n"
+        )
+        if len(self.lines) >= self.batch_size or time.perf_counter() - self.last_flush >= self.max_delay:
+            self.flush()
+
+    def add_many(self, triples: Iterable[Tuple]):
+        """Buffer (subject, predicate, object[, datatype[, lang]]) tuples"""
+        for triple in triples:
+            self.add(*triple)
+
+    def flush(self) -> bool:
+        """POST the buffered triples; returns False if the batch was rejected"""
+        self.last_flush = time.perf_counter()
+        if not self.lines:
+            return True
+
+        payload = ''.join(self.lines).encode('utf-8')
+        count = len(self.lines)
+        self.lines = []
+
+        start = time.perf_counter()
+        ok = self.backend.post_ntriples(payload)
+        self.last_flush = time.perf_counter()
+
+        self.stats['requests'] += 1
+        self.stats['post_seconds'] += self.last_flush - start
+        if ok:
+            self.stats['triples'] += count
+            self.stats['bytes'] += len(payload)
+        else:
+            self.stats['failed'] += count
+        return ok
+
+    @property
+    def triples_per_second(self) -> float:
+        seconds = self.stats['seconds'] or (time.perf_counter() - self.started if self.started else 0.0)
+        return self.stats['triples'] / seconds if seconds else 0.0
+
+    def summary(self) -> str:
+        text = (f"{self.stats['triples']:,} triples in {self.stats['requests']} requests "
+                f"({self.stats['bytes'] / 1024:,.0f} KB), {self.stats['seconds']:.2f}s "
+                f"→ {self.triples_per_second:,.0f} triples/s")
+        if self.stats['failed']:
+            text += f", {self.stats['failed']:,} failed"
+        return text
+
 
 class AllegroGraphHTTPSBackend:
     """
@@ -34,10 +238,13 @@ class AllegroGraphHTTPSBackend:
 
         self.auth = (self.user, self.password)
 
+        # Shared keep-alive session (config.sparql_session)
+        self.session = get_session()
+
     def test_connection(self) -> bool:
         """Test if AllegroGraph is accessible via HTTPS"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.repos_url,
                 auth=self.auth,
                 timeout=5
@@ -50,7 +257,7 @@ class AllegroGraphHTTPSBackend:
     def list_repositories(self) -> List[str]:
         """List all repositories"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.repos_url,
                 auth=self.auth,
                 timeout=10
@@ -77,7 +284,7 @@ class AllegroGraphHTTPSBackend:
     def create_repository(self) -> bool:
         """Create the repository"""
         try:
-            response = requests.put(
+            response = self.session.put(
                 self.repo_url,
                 auth=self.auth,
                 timeout=10
@@ -90,7 +297,7 @@ class AllegroGraphHTTPSBackend:
     def get_triple_count(self) -> int:
         """Get number of triples in repository"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.repo_url}/size",
                 auth=self.auth,
                 timeout=10
@@ -100,31 +307,57 @@ class AllegroGraphHTTPSBackend:
         except Exception:
             return 0
 
-    def add_triple(self, subject: str, predicate: str, obj: str):
-        """
-        Add a single RDF triple
-
-        Args:
-            subject: Subject URI
-            predicate: Predicate URI
-            obj: Object (URI or literal)
-        """
-        # N-Triples format
-        triple = f"<{subject}> <{predicate}> <{obj}> .\n"
-
+    def post_ntriples(self, payload: bytes, timeout: int = 60) -> bool:
+        """POST an N-Triples payload to the statements endpoint"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.statements_url,
-                data=triple.encode('utf-8'),
+                data=payload,
                 headers={'Content-Type': 'text/plain'},
                 auth=self.auth,
-                timeout=10
+                timeout=timeout
             )
             return response.status_code in [200, 201, 204]
         except Exception as e:
-            print(f"Add triple failed: {e}")
+            print(f"Add triples failed: {e}")
             return False
 
+    def add_triple(self, subject: str, predicate: str, obj, datatype: Optional[str] = None, lang: Optional[str] = None):
+        """
+        Add a single RDF triple
+
+        Use bulk_writer() or add_triples() for more than a handful of
+        triples; this is one request per call.
+
+        Args:
+            subject: Subject URI
+            predicate: Predicate URI
+            obj: Object (URI or literal, see ntriples_term)
+            datatype: Literal datatype URI
+            lang: Literal language tag
+        """
+        triple = f"{ntriples_iri(subject)} {ntriples_iri(predicate)} {ntriples_term(obj, datatype, lang)} .\n"
+        return self.post_ntriples(triple.encode('utf-8'), timeout=10)
+
+    def bulk_writer(self, batch_size: int = 5000, max_delay: float = 5.0) -> BulkWriter:
+        """Buffered writer for many triples (use as a context manager)"""
+        return BulkWriter(self, batch_size=batch_size, max_delay=max_delay)
+
+    def add_triples(self, triples: Iterable[Tuple], batch_size: int = 5000) -> Dict:
+        """
+        Add many triples through a BulkWriter
+
+        Args:
+            triples: (subject, predicate, object[, datatype[, lang]]) tuples
+            batch_size: Triples per POST
+
+        Returns:
+            Writer stats (triples, failed, requests, bytes, seconds)
+        """
+        with self.bulk_writer(batch_size=batch_size) as writer:
+            writer.add_many(triples)
+        return writer.stats
+
     def upload_turtle(self, turtle_content: str) -> bool:
         """
         Upload Turtle RDF data
@@ -136,7 +369,7 @@ class AllegroGraphHTTPSBackend:
             True if successful
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.statements_url,
                 data=turtle_content.encode('utf-8'),
                 headers={'Content-Type': 'application/x-turtle'},
@@ -169,7 +402,7 @@ class AllegroGraphHTTPSBackend:
             Query results as dict
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.repo_url,
                 params={'query': query},
                 headers={'Accept': 'application/sparql-results+json'},
@@ -184,7 +417,7 @@ class AllegroGraphHTTPSBackend:
     def clear_repository(self) -> bool:
         """Delete all triples from repository"""
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 self.statements_url,
                 auth=self.auth,
                 timeout=30
@@ -0,0 +1,233 @@
+"""
+Concurrent SPARQL Queries over asyncio
+
+Pages built from several independent SPARQL queries (graph stats, the
+visualizer's entity/event/relationship queries) send them together, so
+they wait for the slowest query instead of the sum of all of them:
+
+- AsyncSPARQLClient.query / gather for asyncio code
+- query_all / AsyncSPARQLClient.gather_sync for synchronous callers
+  (run on a shared background event loop with one keep-alive pool)
+- At most max_concurrency queries in flight per gather
+  (SPARQL_MAX_CONCURRENCY, default 8)
+- Same pool size, timeouts and compression as config/sparql_session.py,
+  and the same timing hooks
+
+Uses httpx. Without it the sync wrappers fall back to a thread pool over
+the shared requests session (same results, same concurrency cap).
+
+Usage:
+    from config.async_sparql import query_all
+
+    results = query_all(repo_url, {'events': events_query, 'entities': entities_query},
+                        auth=(user, password))
+    results['events']['results']['bindings']
+
+    # inside asyncio code
+    async with AsyncSPARQLClient(repo_url, auth=(user, password)) as client:
+        events, entities = await client.gather([events_query, entities_query])
+"""
+
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from config.sparql_session import SPARQL_JSON, Timeout, record_timing, sparql_query
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+Queries = Union[Sequence[str], Mapping[str, str]]
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_client: Optional['httpx.AsyncClient'] = None
+
+
+def _default_concurrency() -> int:
+    return int(os.getenv('SPARQL_MAX_CONCURRENCY', 8))
+
+
+def _new_http_client() -> 'httpx.AsyncClient':
+    pool_size = int(os.getenv('SPARQL_POOL_SIZE', 10))
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        timeout=httpx.Timeout(
+            float(os.getenv('SPARQL_READ_TIMEOUT', 30)),
+            connect=float(os.getenv('SPARQL_CONNECT_TIMEOUT', 10))
+        ),
+        headers={'Accept-Encoding': 'gzip, deflate'}
+    )
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop (daemon thread) behind the sync wrappers, started on first use"""
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='sparql-async', daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coroutine):
+    """Run a coroutine on the background loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coroutine, _background_loop()).result()
+
+
+def _http_timeout(timeout: Optional[Timeout]):
+    if timeout is None:
+        return httpx.USE_CLIENT_DEFAULT
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class AsyncSPARQLClient:
+    """SPARQL queries to one endpoint, run concurrently with a cap"""
+
+    def __init__(
+        self,
+        endpoint: str,
+        auth: Optional[Tuple[str, str]] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[Timeout] = None
+    ):
+        """
+        Args:
+            endpoint: Repository / query endpoint URL
+            auth: (user, password) for basic auth
+            max_concurrency: Queries in flight per gather (default SPARQL_MAX_CONCURRENCY or 8)
+            timeout: Override the default (connect, read) timeouts
+        """
+        self.endpoint = endpoint
+        self.auth = auth
+        self.max_concurrency = max(1, max_concurrency or _default_concurrency())
+        self.timeout = timeout
+        self._client: Optional['httpx.AsyncClient'] = None
+
+    async def __aenter__(self) -> 'AsyncSPARQLClient':
+        if httpx is None:
+            raise ImportError("AsyncSPARQLClient requires httpx (pip install httpx)")
+        self._client = _new_http_client()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _http(self) -> 'httpx.AsyncClient':
+        global _client
+        if self._client is not None:
+            return self._client
+        if httpx is None:
+            raise ImportError("AsyncSPARQLClient requires httpx (pip install httpx)")
+        if asyncio.get_running_loop() is not _loop:
+            raise RuntimeError("Use 'async with AsyncSPARQLClient(...)' inside your own event loop")
+        if _client is None:
+            _client = _new_http_client()
+        return _client
+
+    async def query(self, query: str, accept: str = SPARQL_JSON, method: str = 'GET') -> Dict:
+        """
+        Run one query
+
+        Returns:
+            Parsed JSON results (raises httpx.HTTPStatusError on HTTP errors)
+        """
+        http = self._http()
+        headers = {'Accept': accept}
+        timeout = _http_timeout(self.timeout)
+        if method.upper() == 'POST':
+            response = await http.post(self.endpoint, data={'query': query}, headers=headers,
+                                       auth=self.auth, timeout=timeout)
+        else:
+            response = await http.get(self.endpoint, params={'query': query}, headers=headers,
+                                      auth=self.auth, timeout=timeout)
+        record_timing(response.request.method, str(response.url), response.status_code,
+                      response.elapsed.total_seconds())
+        response.raise_for_status()
+        return response.json()
+
+    async def gather(self, queries: Queries, return_exceptions: bool = False) -> Union[List, Dict[str, Any]]:
+        """
+        Run queries concurrently, at most max_concurrency at a time
+
+        Args:
+            queries: List of queries, or {name: query}
+            return_exceptions: Put a failed query's exception in its slot
+                instead of raising it (as asyncio.gather)
+
+        Returns:
+            Results in the same shape as `queries` (list or {name: result})
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(query: str):
+            async with semaphore:
+                return await self.query(query)
+
+        texts = list(queries.values()) if isinstance(queries, Mapping) else list(queries)
+        results = await asyncio.gather(*(bounded(query) for query in texts), return_exceptions=return_exceptions)
+        if isinstance(queries, Mapping):
+            return dict(zip(queries, results))
+        return list(results)
+
+    def query_sync(self, query: str) -> Dict:
+        """query() for synchronous callers"""
+        return self.gather_sync([query])[0]
+
+    def gather_sync(self, queries: Queries, return_exceptions: bool = False) -> Union[List, Dict[str, Any]]:
+        """gather() for synchronous callers"""
+        if httpx is None:
+            return self._gather_threaded(queries, return_exceptions)
+        return run_sync(self.gather(queries, return_exceptions))
+
+    def _gather_threaded(self, queries: Queries, return_exceptions: bool) -> Union[List, Dict[str, Any]]:
+        def run(query: str):
+            try:
+                return sparql_query(self.endpoint, query, auth=self.auth, timeout=self.timeout).json()
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        texts = list(queries.values()) if isinstance(queries, Mapping) else list(queries)
+        if not texts:
+            return {} if isinstance(queries, Mapping) else []
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(texts))) as pool:
+            results = list(pool.map(run, texts))
+        if isinstance(queries, Mapping):
+            return dict(zip(queries, results))
+        return results
+
+
+def query_all(
+    endpoint: str,
+    queries: Queries,
+    auth: Optional[Tuple[str, str]] = None,
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False
+) -> Union[List, Dict[str, Any]]:
+    """
+    Run independent queries against one endpoint concurrently (synchronous)
+
+    Args:
+        endpoint: Repository / query endpoint URL
+        queries: List of queries, or {name: query}
+        auth: (user, password) for basic auth
+        max_concurrency: Queries in flight at once
+        return_exceptions: Return failures in place instead of raising
+
+    Returns:
+        Parsed JSON results in the same shape as `queries`
+    """
+    client = AsyncSPARQLClient(endpoint, auth=auth, max_concurrency=max_concurrency)
+    return client.gather_sync(queries, return_exceptions=return_exceptions)
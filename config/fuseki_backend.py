@@ -2,13 +2,28 @@
 Apache Jena Fuseki Backend for FE-EKG
 
 Free, open-source RDF database with full SPARQL support.
-Easier to set up than AllegroGraph.
+Easier to set up than AllegroGraph, and a local stand-in for
+AllegroGraph bulk-load benchmarks (see
+scripts/utils/benchmark_rdf_upload.py --fuseki).
+
+Bulk inserts:
+- insert_triples(): SPARQL UPDATE, triples grouped into INSERT DATA
+  blocks of at most batch_bytes
+- stream_triples(): Graph Store Protocol, one POST of N-Triples streamed
+  with chunked transfer encoding (Fuseki's fastest load path)
+
+Both take (subject, predicate, object[, is_literal]) tuples like
+insert_triple() and go through the shared keep-alive session
+(config.sparql_session).
 """
 
-import requests
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from config.allegrograph_https_backend import XSD_STRING, ntriples_iri, ntriples_term
+from config.sparql_session import get_session
+
 
 class FusekiBackend:
     """
@@ -17,13 +32,19 @@ class FusekiBackend:
     Connects to a Fuseki server running locally or remotely
     """
 
-    def __init__(self, base_url: str = 'http://localhost:3030', dataset: str = 'feekg'):
+    def __init__(
+        self,
+        base_url: str = 'http://localhost:3030',
+        dataset: str = 'feekg',
+        auth: Optional[Tuple[str, str]] = None
+    ):
         """
         Initialize Fuseki connection
 
         Args:
             base_url: Fuseki server URL (default: http://localhost:3030)
             dataset: Dataset name (default: feekg)
+            auth: (user, password) if the dataset is protected
         """
         self.base_url = base_url.rstrip('/')
         self.dataset = dataset
@@ -34,10 +55,22 @@ class FusekiBackend:
         # FE-EKG namespace
         self.FEEKG = "http://feekg.org/ontology#"
 
+        # Prefixes expanded in insert_triple(s) terms
+        self.prefixes = {
+            'feekg': self.FEEKG,
+            'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+            'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+            'xsd': 'http://www.w3.org/2001/XMLSchema#'
+        }
+
+        # Shared keep-alive session (config.sparql_session)
+        self.auth = auth
+        self.session = get_session()
+
     def test_connection(self) -> bool:
         """Test if Fuseki server is accessible"""
         try:
-            response = requests.get(f"{self.base_url}/$/ping", timeout=5)
+            response = self.session.get(f"{self.base_url}/$/ping", auth=self.auth, timeout=5)
             return response.status_code == 200
         except Exception:
             return False
@@ -55,10 +88,11 @@ class FusekiBackend:
         try:
             with open(file_path, 'rb') as f:
                 headers = {'Content-Type': 'text/turtle'}
-                response = requests.post(
+                response = self.session.post(
                     self.data_endpoint,
                     data=f,
                     headers=headers,
+                    auth=self.auth,
                     timeout=30
                 )
                 return response.status_code in [200, 201, 204]
@@ -71,10 +105,11 @@ class FusekiBackend:
         try:
             with open(file_path, 'rb') as f:
                 headers = {'Content-Type': 'application/rdf+xml'}
-                response = requests.post(
+                response = self.session.post(
                     self.data_endpoint,
                     data=f,
                     headers=headers,
+                    auth=self.auth,
                     timeout=30
                 )
                 return response.status_code in [200, 201, 204]
@@ -98,10 +133,11 @@ class FusekiBackend:
                 'Accept': self._get_accept_header(output_format)
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.sparql_endpoint,
                 data={'query': query},
                 headers=headers,
+                auth=self.auth,
                 timeout=30
             )
 
@@ -126,10 +162,11 @@ class FusekiBackend:
             True if successful
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.update_endpoint,
                 data={'update': update},
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                auth=self.auth,
                 timeout=30
             )
             return response.status_code in [200, 201, 204]
@@ -147,20 +184,135 @@ class FusekiBackend:
             obj: Object (URI or literal)
             is_literal: True if object is a literal, False if URI
         """
+        return self.insert_triples([(subject, predicate, obj, is_literal)])['failed'] == 0
+
+    def _term(self, term, is_literal: bool = False) -> str:
+        """N-Triples form of a prefixed name, IRI or literal"""
         if is_literal:
-            obj_str = f'"{obj}"'
-        else:
-            obj_str = obj
+            return ntriples_term(term, datatype=XSD_STRING) if isinstance(term, str) else ntriples_term(term)
+        if isinstance(term, str):
+            prefix, _, local = term.partition(':')
+            if prefix in self.prefixes and not local.startswith('//'):
+                return f"<{self.prefixes[prefix]}{local}>"
+        return ntriples_term(term)
+
+    def _iri(self, term: str) -> str:
+        """N-Triples form of a subject or predicate (ValueError if not an IRI)"""
+        if isinstance(term, str):
+            prefix, _, local = term.partition(':')
+            if prefix in self.prefixes and not local.startswith('//'):
+                return f"<{self.prefixes[prefix]}{local}>"
+        return ntriples_iri(term)
+
+    def _ntriples_lines(self, triples: Iterable[Tuple]) -> Iterator[str]:
+        for triple in triples:
+            subject, predicate, obj = triple[:3]
+            is_literal = triple[3] if len(triple) > 3 else False
+            yield f"{self._iri(subject)} {self._iri(predicate)} {self._term(obj, is_literal)} .\n"
+
+    def insert_triples(
+        self,
+        triples: Iterable[Tuple],
+        batch_bytes: int = 256 << 10,
+        graph: Optional[str] = None
+    ) -> Dict:
+        """
+        Insert triples with SPARQL UPDATE, one INSERT DATA block per batch
 
-        update = f"""
-        PREFIX feekg: <{self.FEEKG}>
+        Args:
+            triples: (subject, predicate, object[, is_literal]) tuples
+            batch_bytes: Maximum size of one update request
+            graph: Named graph IRI (default graph if None)
 
-        INSERT DATA {{
-            {subject} {predicate} {obj_str} .
-        }}
+        Returns:
+            Stats: triples, failed, requests, bytes, seconds
         """
+        stats = {'triples': 0, 'failed': 0, 'requests': 0, 'bytes': 0, 'seconds': 0.0}
+        opening = f"INSERT DATA {{ GRAPH <{graph}> {{\n" if graph else "INSERT DATA {\n"
+        closing = "} }" if graph else "}"
+        start = time.perf_counter()
+
+        def send(lines: List[str]):
+            update = opening + ''.join(lines) + closing
+            ok = self.execute_update(update)
+            stats['requests'] += 1
+            stats['triples' if ok else 'failed'] += len(lines)
+            stats['bytes'] += len(update.encode('utf-8'))
+
+        lines, size = [], 0
+        for line in self._ntriples_lines(triples):
+            if lines and size + len(line) > batch_bytes:
+                send(lines)
+                lines, size = [], 0
+            lines.append(line)
+            size += len(line)
+        if lines:
+            send(lines)
+
+        stats['seconds'] = time.perf_counter() - start
+        return stats
+
+    def stream_triples(
+        self,
+        triples: Iterable[Tuple],
+        graph: Optional[str] = None,
+        chunk_bytes: int = 64 << 10
+    ) -> Dict:
+        """
+        Add triples through the Graph Store Protocol in one streamed POST
 
-        return self.execute_update(update)
+        The N-Triples body is generated while it is sent (chunked transfer
+        encoding), so memory use does not grow with the number of triples.
+
+        Args:
+            triples: (subject, predicate, object[, is_literal]) tuples
+            graph: Named graph IRI (default graph if None)
+            chunk_bytes: Approximate size of each transfer chunk
+
+        Returns:
+            Stats: triples, failed, requests, bytes, seconds
+        """
+        stats = {'triples': 0, 'failed': 0, 'requests': 1, 'bytes': 0, 'seconds': 0.0}
+        start = time.perf_counter()
+
+        def body() -> Iterator[bytes]:
+            lines, size = [], 0
+            for line in self._ntriples_lines(triples):
+                lines.append(line)
+                size += len(line)
+                if size >= chunk_bytes:
+                    yield self._chunk(lines, stats)
+                    lines, size = [], 0
+            if lines:
+                yield self._chunk(lines, stats)
+
+        try:
+            response = self.session.post(
+                self.data_endpoint if graph else f"{self.data_endpoint}?default",
+                params={'graph': graph} if graph else None,
+                data=body(),
+                headers={'Content-Type': 'application/n-triples'},
+                auth=self.auth,
+                timeout=300
+            )
+            ok = response.status_code in [200, 201, 204]
+            if not ok:
+                print(f"Upload failed: HTTP {response.status_code}: {response.text[:200]}")
+        except Exception as e:
+            print(f"Upload failed: {e}")
+            ok = False
+
+        if not ok:
+            stats['failed'], stats['triples'] = stats['triples'], 0
+        stats['seconds'] = time.perf_counter() - start
+        return stats
+
+    @staticmethod
+    def _chunk(lines: List[str], stats: Dict) -> bytes:
+        chunk = ''.join(lines).encode('utf-8')
+        stats['triples'] += len(lines)
+        stats['bytes'] += len(chunk)
+        return chunk
 
     def clear_dataset(self) -> bool:
         """Clear all data from the dataset"""
@@ -5,6 +5,7 @@ Supports both AllegroGraph (RDF) and Neo4j (Property Graph).
 
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -43,6 +44,36 @@ class GraphBackend(ABC):
         """Execute query (SPARQL or Cypher)"""
         pass
 
+    def execute_queries(self, queries, max_concurrency=None, return_exceptions=False):
+        """
+        Execute independent queries concurrently.
+
+        Takes as long as the slowest query instead of their sum.
+
+        Args:
+            queries: Query strings or (query, params) pairs
+            max_concurrency: Queries in flight at once (default SPARQL_MAX_CONCURRENCY or 8)
+            return_exceptions: Put a failed query's exception in its slot instead of raising
+
+        Returns:
+            List of execute_query results, in the order of `queries`
+        """
+        queries = [query if isinstance(query, tuple) else (query, None) for query in queries]
+        if not queries:
+            return []
+
+        def run(query_params):
+            try:
+                return self.execute_query(*query_params)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        workers = min(max_concurrency or int(os.getenv('SPARQL_MAX_CONCURRENCY', 8)), len(queries))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            return list(pool.map(run, queries))
+
     @abstractmethod
     def add_triple(self, subject, predicate, obj):
         """Add a single triple/relationship"""
@@ -57,7 +88,9 @@ class GraphBackend(ABC):
 class Neo4jBackend(GraphBackend):
     """Neo4j implementation of graph backend"""
 
-    def __init__(self):
+    def __init__(self, batch_size=None):
+        self.batch_size = batch_size or int(os.getenv('NEO4J_BATCH_SIZE', 1000))
+        self.failed_rows = 0  # rows write_batches could not write (all calls)
         self.uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
         self.user = os.getenv('NEO4J_USER', 'neo4j')
         self.password = os.getenv('NEO4J_PASS', 'feekg2024')
@@ -135,10 +168,89 @@ class Neo4jBackend(GraphBackend):
         with self.driver.session(database=self.database) as session:
             session.run(query, {'subject': subject, 'obj': obj})
 
-    def add_triples(self, triples):
-        """Add multiple triples"""
+    @staticmethod
+    def _write_batch(tx, query, rows):
+        tx.run(query, rows=rows).consume()
+        return len(rows)
+
+    def write_batches(self, query, rows, batch_size=None):
+        """
+        Run a write query over rows in batches.
+
+        The query receives each batch as $rows and should start with
+        `UNWIND $rows AS row`. Every batch is one transaction (retried by
+        the driver on transient errors).
+
+        A batch rejected by the server (ClientError, e.g. an unparseable
+        date in one row) is rewritten row by row, so only the bad rows are
+        lost. Any other failure skips that batch. Either way the failures
+        are logged, counted in self.failed_rows, and the remaining batches
+        are still written.
+
+        Returns:
+            int: Number of rows written
+        """
+        from neo4j.exceptions import ClientError
+
+        batch_size = batch_size or self.batch_size
+        written = 0
+        failed = 0
+        logged = 0
+
+        def log_failure(count, error):
+            nonlocal logged
+            if logged < 5:
+                print(f"   ⚠️  {count} row(s) failed: {error}")
+            logged += 1
+
+        with self.driver.session(database=self.database) as session:
+            def write(batch):
+                nonlocal written, failed
+                try:
+                    written += session.execute_write(self._write_batch, query, batch)
+                    return
+                except ClientError as e:
+                    if len(batch) == 1:
+                        log_failure(1, e)
+                        failed += 1
+                        return
+                except Exception as e:
+                    log_failure(len(batch), e)
+                    failed += len(batch)
+                    return
+                for row in batch:
+                    write([row])
+
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    write(batch)
+                    batch = []
+            if batch:
+                write(batch)
+
+        if failed:
+            print(f"   ⚠️  {failed} of {written + failed} rows not written")
+            self.failed_rows += failed
+        return written
+
+    def add_triples(self, triples, batch_size=None):
+        """Add multiple triples (one UNWIND query per relationship type and batch)"""
+        by_predicate = {}
         for subj, pred, obj in triples:
-            self.add_triple(subj, pred, obj)
+            by_predicate.setdefault(pred, []).append({'subject': subj, 'obj': obj})
+
+        written = 0
+        for predicate, rows in by_predicate.items():
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (s {{id: row.subject}})
+            MATCH (o {{id: row.obj}})
+            MERGE (s)-[:{predicate}]->(o)
+            """
+            written += self.write_batches(query, rows, batch_size)
+        return written
 
 
 class AllegroGraphBackend(GraphBackend):
@@ -217,6 +329,28 @@ class AllegroGraphBackend(GraphBackend):
             rows.append(row)
         return rows
 
+    def execute_queries(self, queries, max_concurrency=None, return_exceptions=False):
+        """
+        Execute independent SPARQL queries concurrently over HTTP
+        (config/async_sparql.py), rows formatted as execute_query's
+        """
+        from config.async_sparql import query_all
+
+        if not self.conn:
+            raise RuntimeError("Not connected")
+
+        texts = [query[0] if isinstance(query, tuple) else query for query in queries]
+        endpoint = f"{self.url.rstrip('/')}/catalogs/{self.catalog}/repositories/{self.repo}"
+        results = query_all(endpoint, texts, auth=(self.user, self.password),
+                            max_concurrency=max_concurrency, return_exceptions=return_exceptions)
+        return [
+            result if isinstance(result, Exception) else [
+                {var: _sparql_json_value(binding.get(var)) for var in result['head']['vars']}
+                for binding in result['results']['bindings']
+            ]
+            for result in results
+        ]
+
     def add_triple(self, subject, predicate, obj):
         """Add single triple"""
         if not self.conn:
@@ -230,6 +364,23 @@ class AllegroGraphBackend(GraphBackend):
         self.conn.addTriples(triples)
 
 
+def _sparql_json_value(term):
+    """SPARQL JSON result term as str() of the franz value (<iri>, "lit"^^<type>, ...)"""
+    if term is None:
+        return None
+    value = term['value']
+    if term['type'] == 'uri':
+        return f"<{value}>"
+    if term['type'] == 'bnode':
+        return f"_:{value}"
+    value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+    if 'xml:lang' in term:
+        return f'"{value}"@{term["xml:lang"]}'
+    if 'datatype' in term:
+        return f'"{value}"^^<{term["datatype"]}>'
+    return f'"{value}"'
+
+
 def get_backend():
     """
     Factory function to get the configured backend.
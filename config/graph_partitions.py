@@ -0,0 +1,129 @@
+"""
+Named-Graph Partitioning by Dataset and Time Period
+
+Loaders can write each source file into its own set of named graphs
+instead of the repository's default graph:
+
+    http://feekg.org/graph/<dataset>/entities      entities of the file
+    http://feekg.org/graph/<dataset>/<period>      events of one year
+                                                   (2008) or quarter
+                                                   (2008-Q3), plus the
+                                                   evolution links that
+                                                   start at those events
+
+<dataset> is the file name without extension (lehman_v4_deduped).
+AllegroGraph's default graph is the union of all graphs, so unrestricted
+queries see partitioned data unchanged; time-window queries can name only
+the overlapping partitions (FROM NAMED / GRAPH), and a partition can be
+dropped and reloaded on its own.
+
+Usage:
+    from config.graph_partitions import GraphPartitioner, graphs_in_window
+
+    partitioner = GraphPartitioner.for_file('data/capital_iq_processed/lehman_v4_deduped.json', 'quarter')
+    partitioner.event_graph(event)   # http://feekg.org/graph/lehman_v4_deduped/2008-Q3
+
+    graphs_in_window(all_graphs, '2008-09-01', '2008-09-30')
+"""
+
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+GRAPH_NS = 'http://feekg.org/graph/'
+PARTITION_SCHEMES = ('year', 'quarter')
+ENTITY_PARTITION = 'entities'
+UNDATED_PARTITION = 'undated'
+
+_PERIOD_PATTERN = re.compile(r'^(\d{4})(?:-Q([1-4]))?$')
+
+
+class GraphPartitioner:
+    """Named graph IRIs for one dataset"""
+
+    def __init__(self, dataset: str, scheme: str = 'quarter'):
+        """
+        Args:
+            dataset: Dataset name (used in the graph IRIs)
+            scheme: 'year' or 'quarter'
+        """
+        if scheme not in PARTITION_SCHEMES:
+            raise ValueError(f"Unknown partition scheme: {scheme} (expected one of {PARTITION_SCHEMES})")
+        self.dataset = re.sub(r'[^A-Za-z0-9_.-]', '_', dataset)
+        self.scheme = scheme
+
+    @classmethod
+    def for_file(cls, file_path: str, scheme: str = 'quarter') -> 'GraphPartitioner':
+        """Partitioner named after a source file (lehman_v4_deduped.json → lehman_v4_deduped)"""
+        return cls(os.path.splitext(os.path.basename(file_path.rstrip('/')))[0], scheme)
+
+    def period(self, date: Optional[str]) -> str:
+        """Partition period of a YYYY-MM-DD date ('2008' or '2008-Q3')"""
+        if not date or not re.match(r'^\d{4}-\d{2}', str(date)):
+            return UNDATED_PARTITION
+        date = str(date)
+        if self.scheme == 'year':
+            return date[:4]
+        return f"{date[:4]}-Q{(int(date[5:7]) - 1) // 3 + 1}"
+
+    def graph(self, period: str) -> str:
+        return f"{GRAPH_NS}{self.dataset}/{period}"
+
+    def entity_graph(self) -> str:
+        return self.graph(ENTITY_PARTITION)
+
+    def event_graph(self, event: Dict) -> str:
+        return self.graph(self.period(event.get('date')))
+
+    def link_graph(self, link: Dict) -> str:
+        """Links live with their source event"""
+        return self.graph(self.period(link.get('from_date')))
+
+
+def parse_graph(graph: str) -> Optional[Tuple[str, str]]:
+    """(dataset, period) of a partition graph IRI, or None for other graphs"""
+    if not graph.startswith(GRAPH_NS):
+        return None
+    dataset, _, period = graph[len(GRAPH_NS):].rpartition('/')
+    if not dataset:
+        return None
+    return dataset, period
+
+
+def period_bounds(period: str) -> Optional[Tuple[str, str]]:
+    """First and last day (YYYY-MM-DD) of a period, or None for non-dated partitions"""
+    match = _PERIOD_PATTERN.match(period)
+    if not match:
+        return None
+    year, quarter = match.group(1), match.group(2)
+    if quarter is None:
+        return f"{year}-01-01", f"{year}-12-31"
+    first_month = (int(quarter) - 1) * 3 + 1
+    last_day = {1: '03-31', 2: '06-30', 3: '09-30', 4: '12-31'}[int(quarter)]
+    return f"{year}-{first_month:02d}-01", f"{year}-{last_day}"
+
+
+def graphs_in_window(
+    graphs: Iterable[str],
+    start_date: str,
+    end_date: str,
+    dataset: Optional[str] = None
+) -> List[str]:
+    """
+    Event partitions overlapping [start_date, end_date] (YYYY-MM-DD)
+
+    Args:
+        graphs: Graph IRIs present in the store
+        start_date: Window start
+        end_date: Window end
+        dataset: Only partitions of this dataset
+    """
+    selected = []
+    for graph in graphs:
+        parsed = parse_graph(graph)
+        if parsed is None or (dataset and parsed[0] != dataset):
+            continue
+        bounds = period_bounds(parsed[1])
+        if bounds and bounds[0] <= end_date[:10] and bounds[1] >= start_date[:10]:
+            selected.append(graph)
+    return sorted(selected)
@@ -7,7 +7,8 @@ Can work alongside Neo4j or as standalone backend.
 
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 from franz.openrdf.connect import ag_connect
 from franz.openrdf.vocabulary.rdf import RDF
 from franz.openrdf.vocabulary.xmlschema import XMLSchema
@@ -19,10 +20,21 @@ class RDFBackend:
     RDF/SPARQL backend using AllegroGraph
 
     Converts FE-EKG entities, events, and risks to RDF triples
+
+    The create_* methods buffer statements and send them with addTriples
+    in batches of batch_size (one request per batch instead of one per
+    property). Call flush() to send a partial batch; close(), queries,
+    exports and stats flush first. Inside bulk_load() every flush is also
+    committed as one transaction.
     """
 
-    def __init__(self):
-        """Initialize AllegroGraph connection"""
+    def __init__(self, batch_size: int = 1000):
+        """
+        Initialize AllegroGraph connection
+
+        Args:
+            batch_size: Buffered statements per addTriples request
+        """
         self.ag_url = os.getenv('AG_URL', 'https://qa-agraph.nelumbium.ai/')
         self.ag_user = os.getenv('AG_USER', 'sadmin')
         self.ag_pass = os.getenv('AG_PASS')
@@ -37,6 +49,13 @@ class RDFBackend:
 
         self.conn = None
 
+        # Buffered writes
+        self.batch_size = max(1, batch_size)
+        self.pending: List[Tuple] = []
+        self.statements_written = 0
+        self.in_transaction = False
+        self._terms: Dict[str, object] = {}
+
     def connect(self):
         """Establish connection to AllegroGraph using HTTPS (port 443)"""
         try:
@@ -48,6 +67,7 @@ class RDFBackend:
                 host=self.ag_url,  # Full URL with :443
                 password=self.ag_pass
             )
+            self._terms = {}
             print(f"✅ Connected to AllegroGraph: {self.ag_repo}")
             print(f"✅ Triple count: {self.conn.size()}")
             return True
@@ -56,10 +76,80 @@ class RDFBackend:
             return False
 
     def close(self):
-        """Close connection"""
+        """Flush buffered statements and close connection"""
         if self.conn:
+            self.flush()
             self.conn.close()
 
+    # ------------------------------------------------------------------
+    # Buffered writes
+    # ------------------------------------------------------------------
+
+    def _term(self, name: str):
+        """FE-EKG predicate/class URI, created once per connection"""
+        uri = self._terms.get(name)
+        if uri is None:
+            uri = self._terms[name] = self.conn.createURI(f"{self.FEEKG}{name}")
+        return uri
+
+    def _add(self, subject, predicate, obj):
+        """Buffer one statement; sends a batch once batch_size are pending"""
+        self.pending.append((subject, predicate, obj))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Send buffered statements with one addTriples call
+
+        Commits when a transaction session is open (see bulk_load).
+
+        Returns:
+            Number of statements sent
+        """
+        if not self.pending:
+            return 0
+        if not self.conn:
+            raise ConnectionError("Not connected to AllegroGraph")
+
+        count = len(self.pending)
+        self.conn.addTriples(self.pending)
+        if self.in_transaction:
+            self.conn.commit()
+        self.pending = []
+        self.statements_written += count
+        return count
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Transaction session for bulk create_* calls
+
+        Each batch is committed as it is flushed; on an exception the
+        uncommitted statements are rolled back and discarded.
+
+        Usage:
+            with backend.bulk_load():
+                for event in events:
+                    backend.create_event_triple(event)
+        """
+        if not self.conn:
+            raise ConnectionError("Not connected to AllegroGraph")
+
+        self.flush()
+        self.conn.openSession(autocommit=False)
+        self.in_transaction = True
+        try:
+            yield self
+            self.flush()
+        except Exception:
+            self.pending = []
+            self.conn.rollback()
+            raise
+        finally:
+            self.in_transaction = False
+            self.conn.closeSession()
+
     def create_event_triple(self, event: Dict):
         """
         Convert event to RDF triples
@@ -74,35 +164,25 @@ class RDFBackend:
         event_uri = self.conn.createURI(f"{self.FEEKG}{event_id}")
 
         # Type triple
-        self.conn.add(event_uri, RDF.TYPE, self.conn.createURI(f"{self.FEEKG}Event"))
+        self._add(event_uri, RDF.TYPE, self._term('Event'))
 
         # Properties
-        self.conn.add(event_uri,
-                     self.conn.createURI(f"{self.FEEKG}eventType"),
-                     self.conn.createLiteral(event['type']))
+        self._add(event_uri, self._term('eventType'), self.conn.createLiteral(event['type']))
 
-        self.conn.add(event_uri,
-                     self.conn.createURI(f"{self.FEEKG}date"),
-                     self.conn.createLiteral(event['date'], datatype=XMLSchema.DATE))
+        self._add(event_uri, self._term('date'), self.conn.createLiteral(event['date'], datatype=XMLSchema.DATE))
 
         if 'description' in event:
-            self.conn.add(event_uri,
-                         self.conn.createURI(f"{self.FEEKG}description"),
-                         self.conn.createLiteral(event['description']))
+            self._add(event_uri, self._term('description'), self.conn.createLiteral(event['description']))
 
         # Actor relationship
         if 'actor' in event:
             actor_uri = self.conn.createURI(f"{self.FEEKG}{event['actor']}")
-            self.conn.add(event_uri,
-                         self.conn.createURI(f"{self.FEEKG}hasActor"),
-                         actor_uri)
+            self._add(event_uri, self._term('hasActor'), actor_uri)
 
         # Target relationship
         if 'target' in event:
             target_uri = self.conn.createURI(f"{self.FEEKG}{event['target']}")
-            self.conn.add(event_uri,
-                         self.conn.createURI(f"{self.FEEKG}hasTarget"),
-                         target_uri)
+            self._add(event_uri, self._term('hasTarget'), target_uri)
 
     def create_entity_triple(self, entity: Dict):
         """Convert entity to RDF triples"""
@@ -113,21 +193,15 @@ class RDFBackend:
         entity_uri = self.conn.createURI(f"{self.FEEKG}{entity_id}")
 
         # Type
-        self.conn.add(entity_uri, RDF.TYPE, self.conn.createURI(f"{self.FEEKG}Entity"))
+        self._add(entity_uri, RDF.TYPE, self._term('Entity'))
 
         # Properties
-        self.conn.add(entity_uri,
-                     self.conn.createURI(f"{self.FEEKG}name"),
-                     self.conn.createLiteral(entity['name']))
+        self._add(entity_uri, self._term('name'), self.conn.createLiteral(entity['name']))
 
-        self.conn.add(entity_uri,
-                     self.conn.createURI(f"{self.FEEKG}entityType"),
-                     self.conn.createLiteral(entity['type']))
+        self._add(entity_uri, self._term('entityType'), self.conn.createLiteral(entity['type']))
 
         if 'sector' in entity:
-            self.conn.add(entity_uri,
-                         self.conn.createURI(f"{self.FEEKG}sector"),
-                         self.conn.createLiteral(entity['sector']))
+            self._add(entity_uri, self._term('sector'), self.conn.createLiteral(entity['sector']))
 
     def create_risk_triple(self, risk: Dict):
         """Convert risk to RDF triples"""
@@ -138,27 +212,19 @@ class RDFBackend:
         risk_uri = self.conn.createURI(f"{self.FEEKG}{risk_id}")
 
         # Type
-        self.conn.add(risk_uri, RDF.TYPE, self.conn.createURI(f"{self.FEEKG}Risk"))
+        self._add(risk_uri, RDF.TYPE, self._term('Risk'))
 
         # Properties
-        self.conn.add(risk_uri,
-                     self.conn.createURI(f"{self.FEEKG}riskType"),
-                     self.conn.createLiteral(risk['type']))
+        self._add(risk_uri, self._term('riskType'), self.conn.createLiteral(risk['type']))
 
-        self.conn.add(risk_uri,
-                     self.conn.createURI(f"{self.FEEKG}score"),
-                     self.conn.createLiteral(risk['score'], datatype=XMLSchema.FLOAT))
+        self._add(risk_uri, self._term('score'), self.conn.createLiteral(risk['score'], datatype=XMLSchema.FLOAT))
 
-        self.conn.add(risk_uri,
-                     self.conn.createURI(f"{self.FEEKG}severity"),
-                     self.conn.createLiteral(risk['severity']))
+        self._add(risk_uri, self._term('severity'), self.conn.createLiteral(risk['severity']))
 
         # Target entity relationship
         if 'targetEntity' in risk:
             entity_uri = self.conn.createURI(f"{self.FEEKG}{risk['targetEntity']}")
-            self.conn.add(risk_uri,
-                         self.conn.createURI(f"{self.FEEKG}targetsEntity"),
-                         entity_uri)
+            self._add(risk_uri, self._term('targetsEntity'), entity_uri)
 
     def create_evolution_triple(self, from_event: str, to_event: str, score: float, metadata: Dict):
         """
@@ -177,9 +243,7 @@ class RDFBackend:
         to_uri = self.conn.createURI(f"{self.FEEKG}{to_event}")
 
         # Main evolution relationship
-        self.conn.add(from_uri,
-                     self.conn.createURI(f"{self.FEEKG}evolvesTo"),
-                     to_uri)
+        self._add(from_uri, self._term('evolvesTo'), to_uri)
 
         # RDF doesn't support properties on relationships directly
         # Use reification or named graph
@@ -187,19 +251,15 @@ class RDFBackend:
         edge_uri = self.conn.createURI(f"{self.FEEKG}{edge_id}")
 
         # Reification pattern
-        self.conn.add(edge_uri, RDF.TYPE, self.conn.createURI(f"{self.FEEKG}EvolutionLink"))
-        self.conn.add(edge_uri, self.conn.createURI(f"{self.FEEKG}fromEvent"), from_uri)
-        self.conn.add(edge_uri, self.conn.createURI(f"{self.FEEKG}toEvent"), to_uri)
-        self.conn.add(edge_uri,
-                     self.conn.createURI(f"{self.FEEKG}score"),
-                     self.conn.createLiteral(score, datatype=XMLSchema.FLOAT))
+        self._add(edge_uri, RDF.TYPE, self._term('EvolutionLink'))
+        self._add(edge_uri, self._term('fromEvent'), from_uri)
+        self._add(edge_uri, self._term('toEvent'), to_uri)
+        self._add(edge_uri, self._term('score'), self.conn.createLiteral(score, datatype=XMLSchema.FLOAT))
 
         # Add component scores
         for key, value in metadata.items():
             if isinstance(value, (int, float)):
-                self.conn.add(edge_uri,
-                             self.conn.createURI(f"{self.FEEKG}{key}"),
-                             self.conn.createLiteral(float(value), datatype=XMLSchema.FLOAT))
+                self._add(edge_uri, self._term(key), self.conn.createLiteral(float(value), datatype=XMLSchema.FLOAT))
 
     def query_sparql(self, query: str) -> List[Dict]:
         """
@@ -214,6 +274,7 @@ class RDFBackend:
         if not self.conn:
             raise ConnectionError("Not connected to AllegroGraph")
 
+        self.flush()
         result = self.conn.prepareTupleQuery(query=query).evaluate()
 
         results = []
@@ -232,6 +293,7 @@ class RDFBackend:
         if not self.conn:
             raise ConnectionError("Not connected to AllegroGraph")
 
+        self.flush()
         with open(output_file, 'w') as f:
             # Write prefixes
             f.write(f"@prefix feekg: <{self.FEEKG}> .\n")
@@ -254,6 +316,7 @@ class RDFBackend:
         if not self.conn:
             raise ConnectionError("Not connected to AllegroGraph")
 
+        self.flush()
         return {
             'total_triples': self.conn.size(),
             'repository': self.ag_repo,
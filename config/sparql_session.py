@@ -0,0 +1,172 @@
+"""
+Shared HTTP Transport for SPARQL Clients
+
+One process-wide requests.Session used by every SPARQL/REST client
+(query backends, loaders, analyzers), so repeated queries to the cloud
+AllegroGraph reuse keep-alive connections instead of paying TCP and TLS
+setup per request:
+
+- Connection pool sized by SPARQL_POOL_SIZE (default 10 per host)
+- Default (connect, read) timeouts from SPARQL_CONNECT_TIMEOUT and
+  SPARQL_READ_TIMEOUT (10s / 30s) when a call passes no timeout
+- Accept-Encoding: gzip, deflate, so result sets come back compressed
+- Timing hooks called after every request (method, URL, status, seconds)
+
+Credentials stay with each client: pass auth= per request (the shared
+session itself has none).
+
+Usage:
+    from config.sparql_session import get_session, sparql_query, RequestStats, add_timing_hook
+
+    stats = RequestStats()
+    add_timing_hook(stats)
+    response = sparql_query(repo_url, query, auth=(user, password))
+    print(stats.summary())
+"""
+
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SPARQL_JSON = 'application/sparql-results+json'
+
+Timeout = Union[float, Tuple[float, float]]
+TimingHook = Callable[[str, str, int, float], None]
+
+_lock = threading.Lock()
+_session: Optional['SPARQLSession'] = None
+_timing_hooks: List[TimingHook] = []
+
+
+class SPARQLSession(requests.Session):
+    """requests.Session with a sized keep-alive pool and default timeouts"""
+
+    def __init__(self, pool_size: int = 10, timeout: Timeout = (10, 30)):
+        super().__init__()
+        self.timeout = timeout
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        self.headers['Accept-Encoding'] = 'gzip, deflate'
+        self.hooks['response'].append(_run_timing_hooks)
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().request(method, url, **kwargs)
+
+
+def _run_timing_hooks(response: requests.Response, *args, **kwargs):
+    # response.elapsed: request sent → response headers parsed
+    record_timing(response.request.method, response.url, response.status_code, response.elapsed.total_seconds())
+
+
+def record_timing(method: str, url: str, status: int, seconds: float):
+    """Pass one request's timing to the hooks (for clients outside the shared session)"""
+    for hook in list(_timing_hooks):
+        hook(method, url, status, seconds)
+
+
+def configure(
+    pool_size: Optional[int] = None,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None
+) -> SPARQLSession:
+    """
+    (Re)create the shared session
+
+    Arguments default to SPARQL_POOL_SIZE, SPARQL_CONNECT_TIMEOUT and
+    SPARQL_READ_TIMEOUT. Clients holding the previous session keep using it.
+    """
+    global _session
+    session = SPARQLSession(
+        pool_size=pool_size or int(os.getenv('SPARQL_POOL_SIZE', 10)),
+        timeout=(
+            connect_timeout or float(os.getenv('SPARQL_CONNECT_TIMEOUT', 10)),
+            read_timeout or float(os.getenv('SPARQL_READ_TIMEOUT', 30))
+        )
+    )
+    with _lock:
+        previous, _session = _session, session
+    if previous is not None:
+        previous.close()
+    return session
+
+
+def get_session() -> SPARQLSession:
+    """The shared session (created on first use)"""
+    with _lock:
+        session = _session
+    return session if session is not None else configure()
+
+
+def add_timing_hook(hook: TimingHook):
+    """Call hook(method, url, status, seconds) after every request"""
+    _timing_hooks.append(hook)
+
+
+def remove_timing_hook(hook: TimingHook):
+    if hook in _timing_hooks:
+        _timing_hooks.remove(hook)
+
+
+def sparql_query(
+    endpoint: str,
+    query: str,
+    auth: Optional[Tuple[str, str]] = None,
+    accept: str = SPARQL_JSON,
+    timeout: Optional[Timeout] = None,
+    method: str = 'GET'
+) -> requests.Response:
+    """
+    Run a SPARQL query over the shared session
+
+    Args:
+        endpoint: Repository / query endpoint URL
+        query: SPARQL query
+        auth: (user, password) for basic auth
+        accept: Result format
+        timeout: Override the session's default timeouts
+        method: GET (query string) or POST (form-encoded, for long queries)
+
+    Returns:
+        The response, already checked with raise_for_status()
+    """
+    session = get_session()
+    headers = {'Accept': accept}
+    if method.upper() == 'POST':
+        response = session.post(endpoint, data={'query': query}, headers=headers, auth=auth, timeout=timeout)
+    else:
+        response = session.get(endpoint, params={'query': query}, headers=headers, auth=auth, timeout=timeout)
+    response.raise_for_status()
+    return response
+
+
+class RequestStats:
+    """Timing hook that aggregates request count and latency"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.seconds = 0.0
+            self.slowest = 0.0
+            self.statuses: Dict[int, int] = {}
+
+    def __call__(self, method: str, url: str, status: int, seconds: float):
+        with self.lock:
+            self.requests += 1
+            self.seconds += seconds
+            self.slowest = max(self.slowest, seconds)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def summary(self) -> str:
+        mean_ms = self.seconds / self.requests * 1000 if self.requests else 0.0
+        return (f"{self.requests} requests, {self.seconds:.2f}s total, "
+                f"mean {mean_ms:.0f} ms, slowest {self.slowest * 1000:.0f} ms")
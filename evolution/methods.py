@@ -12,8 +12,8 @@ Implements evolution relationship scoring between events:
 
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Set
-from collections import Counter
+from typing import List, Dict, Tuple, Set, Iterator
+from collections import Counter, deque
 
 
 class EventEvolutionScorer:
@@ -378,6 +378,117 @@ def _compute_event_pair_batch(args):
     return links
 
 
+# Per-process state for iter_evolution_links workers (set once by the
+# pool initializer instead of pickling the events with every task)
+_WORKER_EVENTS: List[Dict] = []
+_WORKER_SCORER = None
+
+
+def _init_row_worker(sorted_events: List[Dict], entities: List[Dict]):
+    global _WORKER_EVENTS, _WORKER_SCORER
+    _WORKER_EVENTS = sorted_events
+    _WORKER_SCORER = EventEvolutionScorer(sorted_events, entities)
+
+
+def _compute_row_range(start: int, stop: int, threshold: float) -> List[Dict]:
+    """Links for the pairs (i, j > i) of rows start..stop-1 of the sorted events"""
+    return _score_rows(_WORKER_SCORER, _WORKER_EVENTS, start, stop, threshold)
+
+
+def _score_rows(scorer: 'EventEvolutionScorer', sorted_events: List[Dict],
+                start: int, stop: int, threshold: float) -> List[Dict]:
+    links = []
+    for i in range(start, stop):
+        evt_a = sorted_events[i]
+        for evt_b in sorted_events[i + 1:]:
+            score, components = scorer.compute_evolution_score(evt_a, evt_b)
+
+            if score >= threshold:
+                links.append({
+                    'from': evt_a['eventId'],
+                    'to': evt_b['eventId'],
+                    'score': score,
+                    'components': components,
+                    'from_date': evt_a['date'],
+                    'to_date': evt_b['date'],
+                    'from_type': evt_a['type'],
+                    'to_type': evt_b['type'],
+                })
+    return links
+
+
+def _row_ranges(n: int, pairs_per_range: int) -> Iterator[Tuple[int, int]]:
+    """Split rows 0..n-1 into ranges of roughly pairs_per_range pairs each"""
+    start, pairs = 0, 0
+    for i in range(n):
+        pairs += n - 1 - i
+        if pairs >= pairs_per_range:
+            yield start, i + 1
+            start, pairs = i + 1, 0
+    if start < n:
+        yield start, n
+
+
+def iter_evolution_links(events: List[Dict], entities: List[Dict],
+                         threshold: float = 0.2,
+                         max_workers: int = None,
+                         pairs_per_task: int = 20000) -> Iterator[Dict]:
+    """
+    Stream evolution links as they are scored
+
+    Same links, in the same order, as compute_all_evolution_links, but
+    yielded as each block of rows finishes so consumers (e.g. uploads) can
+    start before scoring ends. Scoring runs in a process pool that is
+    started when this function is called; at most max_workers * 2 tasks
+    are in flight, so finished links never pile up ahead of a slow
+    consumer.
+
+    Args:
+        events: List of events from JSON
+        entities: List of entities from JSON
+        threshold: Minimum score to create link (paper uses 0.2)
+        max_workers: Scoring processes (default: CPU count, capped at 8;
+            0 = score in the consuming thread)
+        pairs_per_task: Approximate event pairs per pool task
+
+    Returns:
+        Iterator of evolution link dicts with scores
+    """
+    from multiprocessing import Pool, cpu_count
+
+    sorted_events = sorted(events, key=lambda e: e['date'])
+    n = len(sorted_events)
+    ranges = list(_row_ranges(n, pairs_per_task))
+
+    if max_workers is None:
+        max_workers = min(cpu_count(), 8)
+
+    if max_workers == 0 or n * (n - 1) // 2 < 1000:
+        scorer = EventEvolutionScorer(sorted_events, entities)
+
+        def serial():
+            for start, stop in ranges:
+                yield from _score_rows(scorer, sorted_events, start, stop, threshold)
+        return serial()
+
+    # Created eagerly: forking before the caller starts its own threads
+    pool = Pool(max_workers, initializer=_init_row_worker, initargs=(sorted_events, entities))
+
+    def parallel():
+        pending = deque()
+        try:
+            for start, stop in ranges:
+                pending.append(pool.apply_async(_compute_row_range, (start, stop, threshold)))
+                if len(pending) >= max_workers * 2:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+        finally:
+            pool.terminate()
+            pool.join()
+    return parallel()
+
+
 def compute_all_evolution_links(events: List[Dict], entities: List[Dict],
                                threshold: float = 0.2,
                                use_parallel: bool = True,
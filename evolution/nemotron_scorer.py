@@ -9,6 +9,7 @@ Uses NVIDIA Nemotron LLM for:
 """
 
 import os
+import sys
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -17,6 +18,10 @@ from openai import OpenAI
 
 # Load .env from project root (override shell env)
 project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from llm.instrumentation import llm_metrics
+
 env_path = project_root / '.env'
 load_dotenv(dotenv_path=env_path, override=True)
 
@@ -93,14 +98,7 @@ Event Description:
 Return ONLY a JSON object with this format:
 {{"type": "event_type", "confidence": 0.95, "reasoning": "brief explanation"}}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=150
-        )
-
-        result_text = response.choices[0].message.content.strip()
+        result_text = self._chat('classify_event_type', prompt, temperature=0.1, max_tokens=150)
 
         # Parse JSON response
         try:
@@ -153,14 +151,7 @@ Assess the causal relationship on a scale of 0.0 to 1.0:
 Return ONLY a JSON object:
 {{"causality_score": 0.85, "explanation": "Brief reasoning (max 50 words)"}}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2,
-            max_tokens=200
-        )
-
-        result_text = response.choices[0].message.content.strip()
+        result_text = self._chat('causal_score', prompt, temperature=0.2, max_tokens=200)
 
         try:
             # Extract JSON
@@ -199,14 +190,7 @@ Similarity Scale:
 
 Return ONLY a number between 0.0 and 1.0 (e.g., 0.75)"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=10
-        )
-
-        result_text = response.choices[0].message.content.strip()
+        result_text = self._chat('semantic_similarity', prompt, temperature=0.1, max_tokens=10)
 
         try:
             score = float(result_text)
@@ -238,14 +222,7 @@ Provide a risk assessment as JSON:
   "key_risks": ["risk1", "risk2", "risk3"]
 }}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2,
-            max_tokens=200
-        )
-
-        result_text = response.choices[0].message.content.strip()
+        result_text = self._chat('risk_level', prompt, temperature=0.2, max_tokens=200)
 
         try:
             if "```json" in result_text:
@@ -262,6 +239,25 @@ Provide a risk assessment as JSON:
                 "key_risks": []
             }
 
+    def _chat(self, site: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Run a single-turn chat completion and record it in llm_metrics"""
+        with llm_metrics.track(f'nemotron_scorer.{site}', self.model) as call:
+            # Raw response: exposes the SDK's built-in retries (retries_taken; 0 on older SDKs)
+            raw = self.client.chat.completions.with_raw_response.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            call['retries'] = getattr(raw, 'retries_taken', 0)
+            response = raw.parse()
+
+            if response.usage is not None:
+                call['prompt_tokens'] = response.usage.prompt_tokens
+                call['completion_tokens'] = response.usage.completion_tokens
+
+        return response.choices[0].message.content.strip()
+
     def _parse_date(self, date_str: str):
         """Helper to parse date strings"""
         from datetime import datetime
@@ -11,18 +11,21 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from evolution.methods import compute_all_evolution_links
 from config.graph_backend import get_connection
+from ingestion.event_store import load_event_data
 
 
 def run_evolution_analysis(json_path='data/evergrande_crisis.json',
                            threshold=0.2,
-                           update_db=True):
+                           update_db=True,
+                           batch_size=1000):
     """
     Run evolution analysis and optionally update database
 
     Args:
-        json_path: Path to Evergrande data JSON
+        json_path: Path to Evergrande data JSON (or *.evstore event store)
         threshold: Minimum score for evolution link (default 0.2 from paper)
         update_db: Whether to update Neo4j with new links
+        batch_size: Links per batched EVOLVES_TO write
 
     Returns:
         List of evolution links with scores
@@ -37,8 +40,7 @@ def run_evolution_analysis(json_path='data/evergrande_crisis.json',
     # Load data
     print("\n1️⃣  Loading Evergrande data...")
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        data = load_event_data(json_path)
 
         events = data['events']
         entities = data['entities']
@@ -122,24 +124,23 @@ def run_evolution_analysis(json_path='data/evergrande_crisis.json',
 
             # Add new enhanced links
             print("   ➕ Adding enhanced evolution links...")
-            added = 0
-
-            for link in links:
-                query = """
-                MATCH (e1:Event {eventId: $from})
-                MATCH (e2:Event {eventId: $to})
-                MERGE (e1)-[r:EVOLVES_TO]->(e2)
-                SET r.score = $score,
-                    r.temporal = $temporal,
-                    r.entity_overlap = $entity_overlap,
-                    r.semantic = $semantic,
-                    r.topic = $topic,
-                    r.causality = $causality,
-                    r.emotional = $emotional,
-                    r.type = 'enhanced'
-                """
-
-                params = {
+            query = """
+            UNWIND $rows AS row
+            MATCH (e1:Event {eventId: row.from})
+            MATCH (e2:Event {eventId: row.to})
+            MERGE (e1)-[r:EVOLVES_TO]->(e2)
+            SET r.score = row.score,
+                r.temporal = row.temporal,
+                r.entity_overlap = row.entity_overlap,
+                r.semantic = row.semantic,
+                r.topic = row.topic,
+                r.causality = row.causality,
+                r.emotional = row.emotional,
+                r.type = 'enhanced'
+            """
+
+            added = backend.write_batches(query, (
+                {
                     'from': link['from'],
                     'to': link['to'],
                     'score': link['score'],
@@ -150,9 +151,8 @@ def run_evolution_analysis(json_path='data/evergrande_crisis.json',
                     'causality': link['components']['causality'],
                     'emotional': link['components']['emotional'],
                 }
-
-                backend.execute_query(query, params)
-                added += 1
+                for link in links
+            ), batch_size)
 
             print(f"   ✅ Added {added} enhanced evolution links")
 
@@ -225,12 +225,15 @@ if __name__ == "__main__":
                        help='Minimum evolution score (default: 0.2)')
     parser.add_argument('--no-update', action='store_true',
                        help='Do not update database (analysis only)')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                       help='Links per batched Cypher write (default: 1000)')
 
     args = parser.parse_args()
 
     links = run_evolution_analysis(
         threshold=args.threshold,
-        update_db=not args.no_update
+        update_db=not args.no_update,
+        batch_size=args.batch_size
     )
 
     sys.exit(0 if links else 1)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Parallel, Resumable RDF Batch Uploader
+
+POSTs RDF batches (Turtle by default) to a statements endpoint:
+- Bounded worker pool over one pooled HTTP session (keep-alive)
+- At most workers * 2 batches in flight, so lazily generated batches
+  are never all held in memory
+- Retries timeouts, connection errors and 5xx with exponential backoff
+  (4xx is not retried)
+- Checkpoint file of acknowledged batch hashes: rerunning an interrupted
+  load skips every batch the server already acknowledged (finish() drops
+  it once a load completes without failed batches)
+- Optional retry pass over failed batches at the end
+- Safe to call upload() from several threads at once (e.g. event and
+  evolution link stages of a pipelined load sharing one checkpoint)
+- Pre-compressed payloads (Content-Encoding) and chunked transfer encoding
+
+Usage:
+    from ingestion.batch_uploader import BatchUploader
+
+    uploader = BatchUploader(statements_url, auth=(user, password), workers=4,
+                             checkpoint_file='data/upload_checkpoints/FEEKG.json')
+    report = uploader.upload(loader.iter_turtle_batches(data), total=batch_count)
+    print(report['uploaded'], report['skipped'], report['failed'])
+"""
+
+import os
+import json
+import time
+import hashlib
+import requests
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+DEFAULT_CHECKPOINT_DIR = 'data/upload_checkpoints'
+
+
+class BatchUploader:
+    """Concurrent batch POSTs with checkpointed acknowledgements"""
+
+    def __init__(
+        self,
+        url: str,
+        auth: Optional[Tuple[str, str]] = None,
+        content_type: str = 'text/turtle',
+        workers: int = 4,
+        checkpoint_file: Optional[str] = None,
+        max_retries: int = 3,
+        timeout: int = 120,
+        session: Optional[requests.Session] = None,
+        content_encoding: Optional[str] = None,
+        stream_chunk_size: Optional[int] = None
+    ):
+        """
+        Args:
+            url: Statements endpoint
+            auth: (user, password) for basic auth
+            content_type: Content-Type of every batch
+            workers: Concurrent uploads
+            checkpoint_file: JSON file of acknowledged batch hashes (None = no resume)
+            max_retries: Attempts per batch
+            timeout: Per-request timeout in seconds
+            session: Existing session to reuse, e.g. the shared SPARQL
+                session (default: a new pooled session); auth is sent per
+                request, so a shared session never holds credentials
+            content_encoding: Content-Encoding of every batch (e.g. 'gzip' for
+                pre-compressed payloads)
+            stream_chunk_size: Send bodies in pieces of this size with chunked
+                transfer encoding (default: one Content-Length body)
+        """
+        self.url = url
+        self.content_type = content_type
+        self.workers = max(1, workers)
+        self.checkpoint_file = checkpoint_file
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.headers = self.request_headers(content_type, content_encoding)
+        self.stream_chunk_size = stream_chunk_size
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.auth = auth
+        self.session = session
+
+        self.lock = threading.Lock()
+        self.acknowledged = self._load_checkpoint()
+        self.failed_batches = 0
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self) -> set:
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return set()
+        with open(self.checkpoint_file, 'r') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('url') != self.url:
+            # Checkpoint belongs to another repository
+            return set()
+        return set(checkpoint.get('acknowledged', []))
+
+    def _save_checkpoint(self):
+        if not self.checkpoint_file:
+            return
+        output_dir = os.path.dirname(self.checkpoint_file)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        tmp_path = self.checkpoint_file + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'url': self.url,
+                'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'acknowledged': sorted(self.acknowledged)
+            }, f)
+        os.replace(tmp_path, self.checkpoint_file)
+
+    def reset_checkpoint(self):
+        """Forget acknowledged batches (call after clearing the repository)"""
+        with self.lock:
+            self.acknowledged = set()
+            if self.checkpoint_file and os.path.exists(self.checkpoint_file):
+                os.remove(self.checkpoint_file)
+
+    def finish(self) -> bool:
+        """
+        Drop the checkpoint at the end of a load if no batch failed
+
+        A finished load's checkpoint would make later runs against the same
+        repository skip batches they need to send again (e.g. after the
+        data was deleted on the server). With failed batches it is kept so
+        a rerun resumes.
+
+        Returns:
+            True if the load had no failed batches
+        """
+        if self.failed_batches:
+            return False
+        self.reset_checkpoint()
+        return True
+
+    @staticmethod
+    def request_headers(content_type: str, content_encoding: Optional[str] = None) -> Dict[str, str]:
+        headers = {'Content-Type': content_type}
+        if content_encoding:
+            headers['Content-Encoding'] = content_encoding
+        return headers
+
+    def batch_hash(self, payload: bytes, headers: Optional[Dict[str, str]] = None) -> str:
+        """Checkpoint key of a batch (content + endpoint + content headers)"""
+        digest = hashlib.sha256()
+        digest.update(self.url.encode('utf-8'))
+        digest.update(json.dumps(headers or self.headers, sort_keys=True).encode('utf-8'))
+        digest.update(payload)
+        return digest.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Upload
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _body(payload: bytes, size: Optional[int]):
+        """Request body: bytes, or a generator (chunked transfer encoding)"""
+        if not size:
+            return payload
+        view = memoryview(payload)
+        return (bytes(view[i:i + size]) for i in range(0, len(payload), size))
+
+    def post(
+        self,
+        payload: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        stream_chunk_size: Optional[int] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        POST one batch with retry and exponential backoff
+
+        Args:
+            payload: Request body
+            headers: Content headers (default: the uploader's)
+            stream_chunk_size: Override the uploader's stream_chunk_size
+
+        Returns:
+            (success, error message)
+        """
+        error = None
+        for attempt in range(self.max_retries):
+            try:
+                response = self.session.post(
+                    self.url,
+                    data=self._body(payload, stream_chunk_size or self.stream_chunk_size),
+                    headers=headers or self.headers,
+                    auth=self.auth,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                return True, None
+
+            except requests.exceptions.HTTPError as e:
+                error = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+                # Don't retry on client errors (4xx)
+                if e.response.status_code < 500:
+                    return False, error
+
+            except requests.exceptions.Timeout:
+                error = "Timeout"
+
+            except requests.exceptions.ConnectionError as e:
+                error = f"Connection error: {e}"
+
+            except Exception as e:
+                error = str(e)
+
+            if attempt < self.max_retries - 1:
+                time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
+
+        return False, error
+
+    def _run(
+        self,
+        items: Iterable[Tuple[int, bytes]],
+        headers: Dict[str, str],
+        stream_chunk_size: Optional[int],
+        total: Optional[int],
+        label: str,
+        report: Dict
+    ) -> Dict[int, bytes]:
+        """Upload (number, payload) pairs; returns the failed ones"""
+        failed: Dict[int, bytes] = {}
+        total_text = f"/{total}" if total else ""
+
+        def finish(number: int, payload: bytes, key: str, future):
+            ok, error = future.result()
+            if ok:
+                with self.lock:
+                    self.acknowledged.add(key)
+                    self._save_checkpoint()
+                report['uploaded'] += 1
+                report['bytes'] += len(payload)
+                print(f"   {label} {number}{total_text} ✅")
+            else:
+                failed[number] = payload
+                print(f"   {label} {number}{total_text} ❌ {error}")
+
+        pending = deque()
+        max_pending = self.workers * 2
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for number, payload in items:
+                key = self.batch_hash(payload, headers)
+                if key in self.acknowledged:
+                    report['skipped'] += 1
+                    continue
+                pending.append((number, payload, key, pool.submit(self.post, payload, headers, stream_chunk_size)))
+                if len(pending) >= max_pending:
+                    finish(*pending.popleft())
+            while pending:
+                finish(*pending.popleft())
+
+        return failed
+
+    def upload(
+        self,
+        batches: Iterable[Union[str, bytes]],
+        total: Optional[int] = None,
+        retry_failed: bool = True,
+        label: str = 'Batch',
+        content_type: Optional[str] = None,
+        content_encoding: Optional[str] = None,
+        stream_chunk_size: Optional[int] = None
+    ) -> Dict:
+        """
+        Upload batches concurrently, skipping checkpointed ones
+
+        Args:
+            batches: Batch contents (str is UTF-8 encoded); may be a generator
+            total: Batch count for progress output (optional)
+            retry_failed: Retry failed batches once more after the main pass
+            label: Progress label
+            content_type: Override the uploader's Content-Type for these batches
+            content_encoding: Content-Encoding for these batches (with content_type)
+            stream_chunk_size: Chunked transfer encoding for these batches
+
+        Returns:
+            {'total', 'uploaded', 'skipped', 'failed' (batch numbers), 'bytes'}
+        """
+        report = {'total': 0, 'uploaded': 0, 'skipped': 0, 'failed': [], 'bytes': 0}
+        headers = self.request_headers(content_type, content_encoding) if content_type else self.headers
+
+        def numbered():
+            for number, batch in enumerate(batches, 1):
+                report['total'] = number
+                yield number, batch.encode('utf-8') if isinstance(batch, str) else batch
+
+        failed = self._run(numbered(), headers, stream_chunk_size, total, label, report)
+
+        if failed and retry_failed:
+            print(f"   🔁 Retrying {len(failed)} failed batches...")
+            failed = self._run(sorted(failed.items()), headers, stream_chunk_size, total, label, report)
+
+        report['failed'] = sorted(failed)
+        with self.lock:
+            self.failed_batches += len(failed)
+        return report
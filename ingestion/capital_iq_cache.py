@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Columnar Cache for the Raw Capital IQ Download
+
+Parses the raw CSV once into a typed, column-pruned Parquet (or Feather)
+file keyed by the source file's content hash:
+- Only the columns the ETL uses are kept
+- announcedate parsed to datetime64 once
+- eventtype / companyname / sourcetypename stored as categoricals
+- Content hashes are remembered per (path, size, mtime), so a warm start
+  does not re-read the CSV
+
+Usage:
+    from ingestion.capital_iq_cache import load_capital_iq
+
+    df = load_capital_iq('data/capital_iq_raw/capital_iq_download.csv',
+                         columns=['announcedate', 'headline', 'eventtype'])
+
+    # Build/refresh the cache from the command line
+    python ingestion/capital_iq_cache.py --input data/capital_iq_raw/capital_iq_download.csv
+"""
+
+import os
+import sys
+import json
+import codecs
+import hashlib
+import argparse
+import time
+import pandas as pd
+from typing import Dict, List, Optional
+
+DEFAULT_CACHE_DIR = 'data/capital_iq_cache'
+
+# Bump when the cached layout changes (invalidates existing cache files)
+CACHE_VERSION = 1
+
+# Columns used by the ETL and analysis scripts (after lower/strip normalization)
+CACHE_COLUMNS = [
+    'keydevid', 'companyid', 'companyname', 'headline',
+    'eventtype', 'announcedate', 'sourcetypename'
+]
+CATEGORICAL_COLUMNS = ['eventtype', 'companyname', 'sourcetypename']
+
+
+def detect_encoding(path: str, block_size: int = 1 << 20) -> str:
+    """
+    Detect CSV encoding in one bounded-memory pass
+
+    Returns 'utf-8' if the whole file decodes as UTF-8, otherwise 'latin-1'
+    (which decodes any byte sequence, like the old ISO-8859-1 fallback).
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                decoder.decode(block)
+            decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return 'latin-1'
+    return 'utf-8'
+
+
+def file_hash(path: str, cache_dir: str = DEFAULT_CACHE_DIR, block_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file's contents
+
+    Hashes are remembered in {cache_dir}/index.json keyed by absolute path,
+    size and mtime, so an unchanged file is only read once.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    index_path = os.path.join(cache_dir, 'index.json')
+
+    index: Dict = {}
+    if os.path.exists(index_path):
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+
+    entry = index.get(path)
+    if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return entry['sha256']
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+
+    index[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, index_path)
+
+    return index[path]['sha256']
+
+
+def read_raw_capital_iq(path: str) -> pd.DataFrame:
+    """Parse the raw CSV/Excel export into the typed, column-pruned layout"""
+    if path.endswith('.xlsx'):
+        df = pd.read_excel(path)
+        df.columns = df.columns.str.lower().str.strip()
+        df = df[[col for col in CACHE_COLUMNS if col in df.columns]]
+    elif path.endswith('.csv'):
+        df = pd.read_csv(
+            path,
+            encoding=detect_encoding(path),
+            on_bad_lines='skip',
+            low_memory=False,
+            usecols=lambda col: col.lower().strip() in CACHE_COLUMNS
+        )
+        df.columns = df.columns.str.lower().str.strip()
+    else:
+        raise ValueError("File must be .xlsx or .csv")
+
+    df['announcedate'] = pd.to_datetime(df['announcedate'], errors='coerce')
+    for col in CATEGORICAL_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype('category')
+
+    return df
+
+
+def cache_path_for(path: str, cache_dir: str = DEFAULT_CACHE_DIR, fmt: str = 'parquet') -> str:
+    """Cache file location for a source file (content-addressed)"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    digest = file_hash(path, cache_dir)
+    return os.path.join(cache_dir, f"{stem}_{digest[:16]}_v{CACHE_VERSION}.{fmt}")
+
+
+def build_cache(path: str, cache_dir: str = DEFAULT_CACHE_DIR, fmt: str = 'parquet') -> str:
+    """Convert the raw export into its cache file (overwrites) and return the path"""
+    if fmt not in ('parquet', 'feather'):
+        raise ValueError("fmt must be 'parquet' or 'feather'")
+
+    target = cache_path_for(path, cache_dir, fmt)
+    df = read_raw_capital_iq(path)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = target + '.tmp'
+    if fmt == 'parquet':
+        df.to_parquet(tmp_path, index=True)
+    else:
+        # Feather has no index; rows keep their positional CSV order
+        df.reset_index(drop=True).to_feather(tmp_path)
+    os.replace(tmp_path, target)
+
+    return target
+
+
+def load_capital_iq(
+    path: str,
+    columns: Optional[List[str]] = None,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    fmt: str = 'parquet',
+    refresh: bool = False
+) -> pd.DataFrame:
+    """
+    Load a Capital IQ export through the columnar cache
+
+    Args:
+        path: Raw CSV/Excel export (or an existing .parquet/.feather file)
+        columns: Columns to load (default: all cached columns)
+        cache_dir: Cache directory
+        fmt: 'parquet' or 'feather'
+        refresh: Rebuild the cache even if it exists
+
+    Returns:
+        DataFrame indexed by original CSV row
+    """
+    if path.endswith('.parquet') or path.endswith('.feather'):
+        target = path
+    else:
+        target = cache_path_for(path, cache_dir, fmt)
+        if refresh or not os.path.exists(target):
+            build_cache(path, cache_dir, fmt)
+
+    if target.endswith('.parquet'):
+        if columns is not None:
+            import pyarrow.parquet as pq
+            available = set(pq.read_schema(target).names)
+            columns = [col for col in columns if col in available]
+        return pd.read_parquet(target, columns=columns)
+
+    if columns is not None:
+        import pyarrow.ipc as ipc
+        with ipc.open_file(target) as reader:
+            available = set(reader.schema.names)
+        columns = [col for col in columns if col in available]
+    return pd.read_feather(target, columns=columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the columnar cache for a Capital IQ export')
+    parser.add_argument('--input', default='data/capital_iq_raw/capital_iq_download.csv', help='Raw CSV/Excel file')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Cache directory')
+    parser.add_argument('--format', choices=['parquet', 'feather'], default='parquet', help='Cache file format')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ Error: File not found: {args.input}")
+        sys.exit(1)
+
+    print(f"\n📦 Building {args.format} cache for: {args.input}")
+    start = time.time()
+    target = build_cache(args.input, args.cache_dir, args.format)
+    print(f"   ✅ Wrote {target} ({os.path.getsize(target) / 1e6:.1f} MB) in {time.time() - start:.1f}s")
+
+    start = time.time()
+    df = load_capital_iq(args.input, cache_dir=args.cache_dir, fmt=args.format)
+    print(f"   ✅ Warm load: {len(df):,} rows in {time.time() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Single-Pass Entity Matcher for Capital IQ Headlines
+
+Replaces the per-entity re.search loop in CapitalIQProcessorV2/V4:
+- All entity names compiled once into one alternation (longest first,
+  branched on the leading character)
+- One scan per headline finds every alias, including overlapping ones
+  (e.g. "Lehman" inside "Lehman Brothers")
+- Same word-boundary semantics as r'\\b' + re.escape(name) + r'\\b'
+- SEC/Fed disambiguation rules preserved
+- Optional alias → canonical name resolution
+- Column mode over a pandas Series
+
+Usage:
+    matcher = EntityMatcher(CRISIS_ENTITIES.keys(), canonicalize=get_canonical_name)
+    matcher.find("AIG and American International Group seek Fed loan")
+    # {'AIG', 'Fed'}
+    matcher.find_series(df['headline'])
+"""
+
+import re
+import pandas as pd
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+class EntityMatcher:
+    """
+    Precompiled multi-pattern matcher for entity names
+
+    Every position of the (lowercased) text is tried once against a single
+    alternation wrapped in a lookahead, so matches may overlap. The
+    alternation reports the longest name at each position; shorter names
+    that share that start are confirmed with their own pattern.
+    """
+
+    # Ambiguous short names that need special handling
+    AMBIGUOUS_PATTERNS = {
+        'SEC': r'\bsec\b(?!ond|urity|tor|ure)',  # Match SEC but not second, security, sector, secure
+        'Fed': r'\bfed\b(?!eral)',                # Match Fed but not federal
+    }
+
+    def __init__(
+        self,
+        entity_names: Iterable[str],
+        ambiguous_patterns: Optional[Dict[str, str]] = None,
+        canonicalize: Optional[Callable[[str], str]] = None
+    ):
+        """
+        Args:
+            entity_names: Entity names/aliases to detect
+            ambiguous_patterns: Name -> lowercase regex overriding the default
+                word-boundary pattern (default: AMBIGUOUS_PATTERNS).
+                Patterns must match text starting with the name's first
+                character and must not contain capturing groups.
+            canonicalize: Optional alias -> canonical name resolver
+        """
+        ambiguous = self.AMBIGUOUS_PATTERNS if ambiguous_patterns is None else ambiguous_patterns
+        resolve = canonicalize or (lambda name: name)
+
+        # pattern -> (literal, resolved names); names sharing a pattern share a group
+        entries: Dict[str, tuple] = {}
+        for name in entity_names:
+            literal = name.lower()
+            pattern = ambiguous.get(name) or r'\b' + re.escape(literal) + r'\b'
+            entries.setdefault(pattern, (literal, set()))[1].add(resolve(name))
+
+        # Longest first within each leading character (groups are numbered in this order)
+        ordered = sorted(entries.items(), key=lambda item: (item[1][0][:1], -len(item[1][0])))
+        self._names: List[Set[str]] = [names for _, (_, names) in ordered]
+
+        # Shorter entries whose literal is a prefix of a longer one can match
+        # at the same position; the alternation only reports the longest.
+        self._prefixed: List[List[tuple]] = []
+        for i, (_, (literal, _)) in enumerate(ordered):
+            self._prefixed.append([
+                (re.compile(pattern), names)
+                for j, (pattern, (other, names)) in enumerate(ordered)
+                if j != i and len(other) <= len(literal) and literal.startswith(other)
+            ])
+
+        # Branch on the leading character so each position only tries the names
+        # that can start there (a flat alternation tries all of them)
+        branches: Dict[str, List[str]] = {}
+        for pattern, (literal, _) in ordered:
+            branches.setdefault(literal[:1], []).append(f'({pattern})')
+        alternation = '|'.join(
+            f"(?={re.escape(lead)})(?:{'|'.join(groups)})" for lead, groups in branches.items()
+        )
+
+        # Every alternative starts at a word boundary; hoisting the \b lets the
+        # scan skip mid-word positions without trying the alternation
+        anchor = r'\b' if all(pattern.startswith(r'\b') for pattern, _ in ordered) else ''
+        self._regex = re.compile(f'{anchor}(?=(?:{alternation}))') if ordered else None
+
+    def find(self, text) -> Set[str]:
+        """Return all entity names (or canonical names) mentioned in text"""
+        if not isinstance(text, str) or self._regex is None:
+            return set()
+
+        text_lower = text.lower()
+        found = set()
+        for match in self._regex.finditer(text_lower):
+            group = match.lastindex - 1
+            found.update(self._names[group])
+            for pattern, names in self._prefixed[group]:
+                if pattern.match(text_lower, match.start()):
+                    found.update(names)
+
+        return found
+
+    def find_series(self, texts: pd.Series) -> pd.Series:
+        """
+        Match a whole column
+
+        Returns:
+            Series of sets aligned to the input index
+        """
+        find = self.find
+        return pd.Series([find(text) for text in texts.values], index=texts.index, dtype=object)
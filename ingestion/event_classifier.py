@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Local Event-Type Classifier for Capital IQ Headlines
+
+Trainable replacement for the EVENT_PATTERNS / Capital IQ type cascade in
+CapitalIQProcessorV2/V3:
+- Hashed word n-grams of the headline + the Capital IQ event type
+- Linear model (SGD) with sigmoid-calibrated probabilities
+- Bootstrapped from high-confidence rule labels (no manual annotation)
+- Predicts whole columns in one vectorized call
+
+Confidences are calibrated probabilities in [0, 1], so they drop into
+event['classification']['confidence'] with method 'ml_classifier'.
+
+Usage:
+    # Train from an existing processed file (rule labels with confidence >= 0.9)
+    python ingestion/event_classifier.py train \\
+        --events data/capital_iq_processed/lehman_v3_traced.json \\
+        --model results/models/event_classifier.joblib
+
+    # Use in the ETL
+    python ingestion/process_capital_iq_v4.py --classifier results/models/event_classifier.joblib
+"""
+
+import os
+import sys
+import json
+import pickle
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+from scipy.sparse import hstack
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.calibration import CalibratedClassifierCV
+
+
+def _whole_value(value: str) -> List[str]:
+    """Analyzer that treats the full Capital IQ type as a single feature"""
+    return [value] if value else []
+
+
+class EventTypeClassifier:
+    """
+    Hashed n-gram + calibrated linear classifier for FE-EKG event types
+    """
+
+    METHOD = 'ml_classifier'
+
+    def __init__(
+        self,
+        n_features: int = 2 ** 20,
+        ngram_range: tuple = (1, 2),
+        min_confidence: float = 0.9,
+        min_class_count: int = 10,
+        unknown_threshold: float = 0.0
+    ):
+        """
+        Args:
+            n_features: Hash space for headline n-grams
+            ngram_range: Word n-gram range for headlines
+            min_confidence: Rule confidence required for a bootstrap label
+            min_class_count: Classes with fewer bootstrap examples are dropped
+            unknown_threshold: Predictions below this probability become 'unknown'
+        """
+        self.params = {
+            'n_features': n_features,
+            'ngram_range': ngram_range,
+            'min_confidence': min_confidence,
+            'min_class_count': min_class_count,
+            'unknown_threshold': unknown_threshold
+        }
+        self.min_confidence = min_confidence
+        self.min_class_count = min_class_count
+        self.unknown_threshold = unknown_threshold
+
+        # Hashing vectorizers are stateless: only the linear model is persisted
+        self.headline_vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            lowercase=True,
+            alternate_sign=False,
+            norm='l2'
+        )
+        self.type_vectorizer = HashingVectorizer(
+            n_features=2 ** 12,
+            analyzer=_whole_value,
+            alternate_sign=False,
+            norm=None
+        )
+        self.model = None
+        self.model_digest = None  # sha256 of the model file it was loaded from
+
+    def _features(self, headlines: pd.Series, capital_iq_types: pd.Series):
+        headlines = pd.Series(headlines).astype(object).fillna('').astype(str)
+        capital_iq_types = pd.Series(capital_iq_types).astype(object).fillna('').astype(str)
+        return hstack([
+            self.headline_vectorizer.transform(headlines),
+            self.type_vectorizer.transform(capital_iq_types)
+        ]).tocsr()
+
+    def fit(self, headlines: pd.Series, capital_iq_types: pd.Series, labels: pd.Series) -> Dict:
+        """
+        Train on labeled headlines
+
+        Args:
+            headlines: Headline column
+            capital_iq_types: Capital IQ eventtype column
+            labels: FE-EKG event type per row
+
+        Returns:
+            Training summary (examples, classes)
+        """
+        frame = pd.DataFrame({
+            'headline': pd.Series(headlines).values,
+            'eventtype': pd.Series(capital_iq_types).values,
+            'label': pd.Series(labels).values
+        })
+        counts = frame['label'].value_counts()
+        keep = counts[counts >= self.min_class_count].index
+        frame = frame[frame['label'].isin(keep) & (frame['label'] != 'unknown')]
+
+        if frame['label'].nunique() < 2:
+            raise ValueError("Need at least two event types with enough examples to train")
+
+        base = SGDClassifier(alpha=1e-5, max_iter=50, tol=1e-4, random_state=42)
+        self.model = CalibratedClassifierCV(base, method='sigmoid', cv=3)
+        self.model.fit(self._features(frame['headline'], frame['eventtype']), frame['label'])
+
+        return {
+            'examples': len(frame),
+            'classes': {label: int(counts[label]) for label in self.model.classes_}
+        }
+
+    def fit_from_events(self, events: List[Dict]) -> Dict:
+        """
+        Bootstrap from processed FE-EKG events (v3/v4 JSON)
+
+        Only events whose rule classification reached min_confidence are used.
+        """
+        rows = [
+            (e.get('headline', ''), e.get('csvSource', {}).get('originalEventType', ''), e['type'])
+            for e in events
+            if e.get('classification', {}).get('confidence', 0) >= self.min_confidence
+        ]
+        frame = pd.DataFrame(rows, columns=['headline', 'eventtype', 'label'])
+        return self.fit(frame['headline'], frame['eventtype'], frame['label'])
+
+    def fit_from_processor(self, processor, df: Optional[pd.DataFrame] = None, sample: Optional[int] = None) -> Dict:
+        """
+        Bootstrap from a CapitalIQProcessorV3 (or later) rule cascade
+
+        Args:
+            processor: Processor exposing classify_event_type_with_confidence()
+            df: Frame to label (default: processor.df)
+            sample: Label a random sample of this many rows
+        """
+        df = processor.df if df is None else df
+        if sample and len(df) > sample:
+            df = df.sample(sample, random_state=42)
+
+        eventtypes = df['eventtype'] if 'eventtype' in df else pd.Series('', index=df.index)
+        labeled = [
+            processor.classify_event_type_with_confidence(headline, eventtype, None)
+            for headline, eventtype in zip(df['headline'], eventtypes)
+        ]
+        labels = pd.Series([label for label, _ in labeled], index=df.index)
+        confidence = pd.Series([conf for _, conf in labeled], index=df.index)
+
+        mask = confidence >= self.min_confidence
+        return self.fit(df.loc[mask, 'headline'], eventtypes[mask], labels[mask])
+
+    def predict(self, headlines: pd.Series, capital_iq_types: pd.Series) -> pd.DataFrame:
+        """
+        Classify whole columns in one call
+
+        Returns:
+            DataFrame aligned to the input index with columns
+            'type', 'confidence', 'method'
+        """
+        if self.model is None:
+            raise RuntimeError("Classifier is not trained")
+
+        index = headlines.index if isinstance(headlines, pd.Series) else None
+        probabilities = self.model.predict_proba(self._features(headlines, capital_iq_types))
+
+        best = probabilities.argmax(axis=1)
+        confidence = probabilities[np.arange(len(best)), best]
+        types = self.model.classes_[best].astype(object)
+
+        below = confidence < self.unknown_threshold
+        types[below] = 'unknown'
+        confidence = np.where(below, 0.0, confidence)
+
+        return pd.DataFrame({
+            'type': types,
+            'confidence': np.round(confidence, 3),
+            'method': self.METHOD
+        }, index=index)
+
+    def agreement(self, headlines: pd.Series, capital_iq_types: pd.Series, labels: pd.Series) -> float:
+        """Fraction of rows where the classifier agrees with reference labels"""
+        predicted = self.predict(headlines, capital_iq_types)['type'].values
+        return float((predicted == pd.Series(labels).values).mean()) if len(predicted) else 0.0
+
+    def save(self, path: str):
+        """Persist parameters and the trained model"""
+        import joblib
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        joblib.dump({'params': self.params, 'model': self.model}, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'EventTypeClassifier':
+        import joblib
+        state = joblib.load(path)
+        classifier = cls(**state['params'])
+        classifier.model = state['model']
+        with open(path, 'rb') as f:
+            classifier.model_digest = hashlib.sha256(f.read()).hexdigest()
+        return classifier
+
+    def fingerprint(self) -> Optional[str]:
+        """Hash of the trained model (changes on retraining, even with the same params)"""
+        if self.model is None:
+            return None
+        if self.model_digest is not None:
+            return self.model_digest
+        return hashlib.sha256(pickle.dumps(self.model)).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the local Capital IQ event-type classifier')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    train = subparsers.add_parser('train', help='Bootstrap from rule labels')
+    source = train.add_mutually_exclusive_group(required=True)
+    source.add_argument('--events', help='Processed v3/v4 JSON with rule classifications')
+    source.add_argument('--input', help='Raw Capital IQ CSV (labels via the v3 rule cascade)')
+    train.add_argument('--sample', type=int, default=200000, help='Rows to label when using --input')
+    train.add_argument('--min-confidence', type=float, default=0.9, help='Rule confidence for bootstrap labels')
+    train.add_argument('--model', default='results/models/event_classifier.joblib', help='Output model path')
+
+    args = parser.parse_args()
+
+    print("\n" + "=" * 70)
+    print("  Event-Type Classifier Training")
+    print("=" * 70)
+
+    classifier = EventTypeClassifier(min_confidence=args.min_confidence)
+
+    if args.events:
+        with open(args.events, 'r') as f:
+            events = json.load(f)['events']
+        summary = classifier.fit_from_events(events)
+
+        frame = pd.DataFrame({
+            'headline': [e.get('headline', '') for e in events],
+            'eventtype': [e.get('csvSource', {}).get('originalEventType', '') for e in events],
+            'label': [e['type'] for e in events]
+        })
+    else:
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from ingestion.process_capital_iq_v3 import CapitalIQProcessorV3
+
+        processor = CapitalIQProcessorV3(args.input)
+        summary = classifier.fit_from_processor(processor, sample=args.sample)
+        frame = None
+
+    print(f"\n✅ Trained on {summary['examples']:,} high-confidence examples")
+    for label, count in sorted(summary['classes'].items(), key=lambda x: -x[1]):
+        print(f"   {label:30} : {count:6,}")
+
+    if frame is not None:
+        agreement = classifier.agreement(frame['headline'], frame['eventtype'], frame['label'])
+        print(f"\n   Agreement with rule labels (all events): {agreement:.1%}")
+
+    classifier.save(args.model)
+    print(f"\n✅ Saved model to: {args.model}")
+    print("=" * 70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
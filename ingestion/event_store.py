@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Compact Columnar Event Store
+
+Replaces pretty-printed processed-event JSON with a directory of
+memory-mapped NumPy arrays:
+- meta.json          metadata, entities, column schema (small)
+- strings.bin        UTF-8 string table (every distinct string stored once)
+- strings.offsets.npy  int64 offsets into strings.bin
+- col_<n>.npy        one array per leaf field (int32 string codes, int64,
+                     float64; list fields add a col_<n>.offsets.npy)
+- date.npy           datetime64[D] per event, for date-range scans
+- id_order.npy       rows sorted by eventId (offset index, binary search)
+
+Nested fields (csvSource.*, classification.*) are flattened into columns and
+rebuilt on read. Arrays are opened with mmap_mode='r', so opening a store
+only reads meta.json; events are decoded on demand.
+
+Usage:
+    from ingestion.event_store import EventStore, load_event_data
+
+    EventStore.write('data/capital_iq_processed/lehman_v3_traced.evstore', data)
+
+    store = EventStore('data/capital_iq_processed/lehman_v3_traced.evstore')
+    event = store.get('evt_12345')
+    for event in store.scan(start='2008-09-01', end='2008-09-30', entity='ent_lehman_brothers'):
+        ...
+
+    # Either format → the original {'metadata', 'entities', 'events'} dict
+    data = load_event_data('data/capital_iq_processed/lehman_v3_traced.json')
+
+    # Convert from the command line
+    python ingestion/event_store.py --input data/capital_iq_processed/lehman_v3_traced.json
+    python ingestion/event_store.py --input lehman_v3_traced.evstore --export-json out.json
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import time
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional
+
+EVENT_STORE_SUFFIX = '.evstore'
+
+# Bump when the on-disk layout changes
+STORE_VERSION = 1
+
+# String codes reserved for missing values
+NULL_CODE = -1      # field present with value None
+ABSENT_CODE = -2    # field not present in this event
+
+_ABSENT = object()
+
+
+def is_event_store(path: str) -> bool:
+    """True if path is an event store directory"""
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, 'meta.json'))
+
+
+class _StringTable:
+    """Deduplicating string table built while writing"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return NULL_CODE
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    def save(self, path: str):
+        encoded = [s.encode('utf-8') for s in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        with open(os.path.join(path, 'strings.bin'), 'wb') as f:
+            f.write(b''.join(encoded))
+        np.save(os.path.join(path, 'strings.offsets.npy'), offsets)
+
+
+def _leaf_kind(values: List[Any]) -> str:
+    """Storage kind for one flattened field"""
+    present = [v for v in values if v is not _ABSENT]
+    complete = len(present) == len(values) and all(v is not None for v in present)
+
+    if all(v is None or isinstance(v, str) for v in present):
+        return 'str'
+    if complete and all(isinstance(v, list) and all(isinstance(x, str) for x in v) for v in present):
+        return 'strlist'
+    if complete and all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+        return 'int'
+    if complete and all(isinstance(v, float) for v in present):
+        return 'float'
+    return 'json'
+
+
+def _infer_schema(records: List[Any], path: List[str]) -> List[Dict]:
+    """
+    Flatten dict-valued fields into leaf columns
+
+    A field becomes a group when every event that has it holds a non-empty
+    dict; anything else (mixed types, None, empty dicts) is a leaf.
+    """
+    keys: Dict[str, None] = {}
+    for record in records:
+        if isinstance(record, dict):
+            keys.update(dict.fromkeys(record))
+
+    columns = []
+    for key in keys:
+        values = [record.get(key, _ABSENT) if isinstance(record, dict) else _ABSENT for record in records]
+        present = [v for v in values if v is not _ABSENT]
+        if present and all(isinstance(v, dict) and v for v in present):
+            columns.extend(_infer_schema([v if isinstance(v, dict) else None for v in values], path + [key]))
+        else:
+            columns.append({'path': path + [key], 'kind': _leaf_kind(values)})
+    return columns
+
+
+def _get_path(record: Dict, path: List[str]) -> Any:
+    for key in path:
+        if not isinstance(record, dict) or key not in record:
+            return _ABSENT
+        record = record[key]
+    return record
+
+
+class EventStore:
+    """Read-only, memory-mapped view of a processed event file"""
+
+    def __init__(self, path: str):
+        if not is_event_store(path):
+            raise FileNotFoundError(f"Not an event store: {path}")
+
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), 'r') as f:
+            meta = json.load(f)
+
+        if meta.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported event store version {meta.get('version')} (expected {STORE_VERSION})")
+
+        self.metadata: Dict = meta['metadata']
+        self.entities: List[Dict] = meta['entities']
+        self.extra: Dict = meta.get('extra', {})
+        self.key_order: List[str] = meta.get('key_order', ['metadata', 'entities', 'events'])
+        self.schema: List[Dict] = meta['schema']
+        self.count: int = meta['count']
+        self._id_column: Optional[int] = meta.get('id_column')
+
+        self._blob = np.memmap(os.path.join(path, 'strings.bin'), dtype=np.uint8, mode='r') \
+            if os.path.getsize(os.path.join(path, 'strings.bin')) else np.zeros(0, dtype=np.uint8)
+        self._offsets = self._load('strings.offsets.npy')
+        self._columns = [self._load(f'col_{i}.npy') for i in range(len(self.schema))]
+        self._list_offsets = {
+            i: self._load(f'col_{i}.offsets.npy')
+            for i, column in enumerate(self.schema) if column['kind'] == 'strlist'
+        }
+        self.dates = self._load('date.npy')
+        self._id_order = self._load('id_order.npy') if self._id_column is not None else None
+        self._string_codes: Optional[Dict[str, int]] = None
+        self._decoded: Optional[List[str]] = None
+
+    def _load(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, name), mmap_mode='r')
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def write(path: str, data: Dict) -> str:
+        """
+        Write a processed-event dict ({'metadata', 'entities', 'events', ...})
+        as an event store directory (replaces any existing store at path)
+
+        Returns:
+            path
+        """
+        events = data.get('events', [])
+        schema = _infer_schema(events, [])
+        strings = _StringTable()
+
+        tmp_path = path.rstrip('/') + '.tmp'
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        os.makedirs(tmp_path)
+
+        id_column = None
+        for i, column in enumerate(schema):
+            values = [_get_path(event, column['path']) for event in events]
+            kind = column['kind']
+            name = os.path.join(tmp_path, f'col_{i}')
+
+            if kind == 'str':
+                array = np.array(
+                    [ABSENT_CODE if v is _ABSENT else strings.code(v) for v in values],
+                    dtype=np.int32
+                )
+                if column['path'] == ['eventId'] and ABSENT_CODE not in array and NULL_CODE not in array:
+                    id_column = i
+            elif kind == 'strlist':
+                offsets = np.zeros(len(values) + 1, dtype=np.int64)
+                np.cumsum([len(v) for v in values], out=offsets[1:])
+                np.save(name + '.offsets.npy', offsets)
+                array = np.array([strings.code(x) for v in values for x in v], dtype=np.int32)
+            elif kind == 'int':
+                array = np.array(values, dtype=np.int64)
+            elif kind == 'float':
+                array = np.array(values, dtype=np.float64)
+            else:
+                array = np.array(
+                    [ABSENT_CODE if v is _ABSENT else strings.code(json.dumps(v)) for v in values],
+                    dtype=np.int32
+                )
+            np.save(name + '.npy', array)
+
+        dates = [event.get('date') for event in events]
+        date_array = np.array(
+            [d[:10] if isinstance(d, str) and d else 'NaT' for d in dates],
+            dtype='datetime64[D]'
+        ) if events else np.zeros(0, dtype='datetime64[D]')
+        np.save(os.path.join(tmp_path, 'date.npy'), date_array)
+
+        if id_column is not None:
+            ids = [event['eventId'] for event in events]
+            id_order = np.array(sorted(range(len(ids)), key=ids.__getitem__), dtype=np.int64)
+            np.save(os.path.join(tmp_path, 'id_order.npy'), id_order)
+
+        strings.save(tmp_path)
+
+        meta = {
+            'version': STORE_VERSION,
+            'count': len(events),
+            'key_order': list(data),
+            'id_column': id_column,
+            'schema': schema,
+            'metadata': data.get('metadata', {}),
+            'entities': data.get('entities', []),
+            'extra': {k: v for k, v in data.items() if k not in ('metadata', 'entities', 'events')}
+        }
+        with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(tmp_path, path)
+        return path
+
+    # ------------------------------------------------------------------
+    # String table
+    # ------------------------------------------------------------------
+
+    def string(self, code: int) -> Optional[str]:
+        """Decode one string-table entry (None for NULL_CODE)"""
+        if code < 0:
+            return None
+        return self._blob[self._offsets[code]:self._offsets[code + 1]].tobytes().decode('utf-8')
+
+    def string_code(self, value: str) -> Optional[int]:
+        """Reverse lookup of a string in the table (built on first use)"""
+        if self._string_codes is None:
+            self._string_codes = {value: code for code, value in enumerate(self._strings())}
+        return self._string_codes.get(value)
+
+    # ------------------------------------------------------------------
+    # Event access
+    # ------------------------------------------------------------------
+
+    def _value(self, i: int, row: int) -> Any:
+        kind = self.schema[i]['kind']
+        array = self._columns[i]
+
+        if kind == 'strlist':
+            offsets = self._list_offsets[i]
+            return [self.string(code) for code in array[offsets[row]:offsets[row + 1]]]
+        if kind == 'int':
+            return int(array[row])
+        if kind == 'float':
+            return float(array[row])
+
+        code = int(array[row])
+        if code == ABSENT_CODE:
+            return _ABSENT
+        value = self.string(code)
+        if kind == 'json':
+            return json.loads(value)
+        return value
+
+    def event(self, row: int) -> Dict:
+        """Rebuild the event dict at a row position"""
+        if not 0 <= row < self.count:
+            raise IndexError(f"Event row {row} out of range (0..{self.count - 1})")
+
+        event: Dict = {}
+        for i, column in enumerate(self.schema):
+            value = self._value(i, row)
+            if value is _ABSENT:
+                continue
+            target = event
+            for key in column['path'][:-1]:
+                target = target.setdefault(key, {})
+            target[column['path'][-1]] = value
+        return event
+
+    def row_of(self, event_id: str) -> Optional[int]:
+        """Row position of an eventId via binary search over the offset index"""
+        if self._id_order is None:
+            return None
+
+        ids = self._columns[self._id_column]
+        lo, hi = 0, len(self._id_order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(int(ids[self._id_order[mid]])) < event_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._id_order):
+            row = int(self._id_order[lo])
+            if self.string(int(ids[row])) == event_id:
+                return row
+        return None
+
+    def get(self, event_id: str) -> Optional[Dict]:
+        """Event by eventId, or None"""
+        row = self.row_of(event_id)
+        return None if row is None else self.event(row)
+
+    def _strings(self) -> List[str]:
+        """Whole string table, decoded once for bulk reads"""
+        if self._decoded is None:
+            blob = self._blob.tobytes()
+            offsets = self._offsets.tolist()
+            self._decoded = [blob[a:b].decode('utf-8') for a, b in zip(offsets[:-1], offsets[1:])]
+        return self._decoded
+
+    def _column_values(self, i: int, rows: np.ndarray) -> List[Any]:
+        """Decode one column for many rows at once"""
+        kind = self.schema[i]['kind']
+        array = self._columns[i]
+
+        if kind == 'strlist':
+            if not len(rows):
+                return []
+            strings = self._strings()
+            offsets = self._list_offsets[i]
+            starts, ends = offsets[rows].tolist(), offsets[rows + 1].tolist()
+            # Only the codes spanned by these rows
+            base = min(starts)
+            codes = array[base:max(ends)].tolist()
+            return [[strings[c] for c in codes[a - base:b - base]] for a, b in zip(starts, ends)]
+        if kind in ('int', 'float'):
+            return array[rows].tolist()
+
+        strings = self._strings()
+        missing = {NULL_CODE: None, ABSENT_CODE: _ABSENT}
+        values = [strings[c] if c >= 0 else missing[c] for c in array[rows].tolist()]
+        if kind == 'json':
+            values = [v if v is _ABSENT else json.loads(v) for v in values]
+        return values
+
+    def events(self, rows: Optional[np.ndarray] = None) -> List[Dict]:
+        """Rebuild events for many rows (all by default), decoding column-wise"""
+        rows = np.arange(self.count) if rows is None else np.asarray(rows, dtype=np.int64)
+        events: List[Dict] = [{} for _ in range(len(rows))]
+
+        for i, column in enumerate(self.schema):
+            *parents, key = column['path']
+            for event, value in zip(events, self._column_values(i, rows)):
+                if value is _ABSENT:
+                    continue
+                target = event
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                target[key] = value
+        return events
+
+    def __iter__(self) -> Iterator[Dict]:
+        for start in range(0, self.count, 1000):
+            yield from self.events(np.arange(start, min(start + 1000, self.count)))
+
+    # ------------------------------------------------------------------
+    # Scans
+    # ------------------------------------------------------------------
+
+    def _column_index(self, path: List[str]) -> Optional[int]:
+        for i, column in enumerate(self.schema):
+            if column['path'] == path:
+                return i
+        return None
+
+    def rows(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        entity: Optional[str] = None,
+        event_type: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Row positions matching every given filter (evaluated on the arrays)
+
+        Args:
+            start: Inclusive start date (YYYY-MM-DD)
+            end: Inclusive end date (YYYY-MM-DD)
+            entity: Entity id listed in the event's 'entities' (or its actor/target)
+            event_type: Event 'type'
+        """
+        mask = np.ones(self.count, dtype=bool)
+
+        if start is not None:
+            mask &= self.dates >= np.datetime64(start, 'D')
+        if end is not None:
+            mask &= self.dates <= np.datetime64(end, 'D')
+
+        if event_type is not None:
+            i = self._column_index(['type'])
+            code = self.string_code(event_type)
+            if i is None or code is None or self.schema[i]['kind'] != 'str':
+                return np.zeros(0, dtype=np.int64)
+            mask &= self._columns[i] == code
+
+        if entity is not None:
+            # Events reference entities by id (curated datasets) or by name (Capital IQ)
+            names = {entity} | {e.get('name') for e in self.entities if e.get('entityId') == entity}
+            codes = [code for code in map(self.string_code, names) if code is not None]
+            matched = np.zeros(self.count, dtype=bool)
+            for i, column in enumerate(self.schema):
+                if column['path'] == ['entities'] and column['kind'] == 'strlist':
+                    positions = np.flatnonzero(np.isin(self._columns[i], codes))
+                    owners = np.searchsorted(self._list_offsets[i], positions, side='right') - 1
+                    matched[owners] = True
+                elif column['path'] in (['actor'], ['target']) and column['kind'] == 'str':
+                    matched |= np.isin(self._columns[i], codes)
+            mask &= matched
+
+        return np.flatnonzero(mask)
+
+    def scan(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        entity: Optional[str] = None,
+        event_type: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Yield events matching the filters (see rows()), in stored order"""
+        rows = self.rows(start, end, entity, event_type)
+        for offset in range(0, len(rows), 1000):
+            yield from self.events(rows[offset:offset + 1000])
+
+    # ------------------------------------------------------------------
+    # JSON compatibility
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        """The original {'metadata', 'entities', 'events', ...} layout"""
+        data = {'metadata': self.metadata, 'entities': self.entities, 'events': self.events()}
+        data.update(self.extra)
+        return {key: data[key] for key in self.key_order if key in data}
+
+    def export_json(self, path: str, indent: Optional[int] = 2):
+        """Write the store back out as processed-event JSON"""
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=indent)
+
+
+def load_event_data(path: str) -> Dict:
+    """Load processed events from JSON or an event store into the JSON layout"""
+    if is_event_store(path):
+        return EventStore(path).to_dict()
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_event_data(path: str, data: Dict):
+    """Save processed events as an event store (*.evstore) or pretty-printed JSON"""
+    if path.rstrip('/').endswith(EVENT_STORE_SUFFIX):
+        EventStore.write(path, data)
+        return
+
+    output_dir = os.path.dirname(path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def _store_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert processed event JSON to/from the columnar event store')
+    parser.add_argument('--input', required=True, help='Processed event JSON or *.evstore directory')
+    parser.add_argument('--output', help=f'Store directory (default: <input>{EVENT_STORE_SUFFIX})')
+    parser.add_argument('--export-json', help='Export an event store back to JSON at this path')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ Error: File not found: {args.input}")
+        sys.exit(1)
+
+    if args.export_json:
+        start = time.time()
+        EventStore(args.input).export_json(args.export_json)
+        print(f"✅ Exported {args.export_json} in {time.time() - start:.2f}s")
+        return
+
+    output = args.output or os.path.splitext(args.input)[0] + EVENT_STORE_SUFFIX
+
+    print(f"\n📦 Converting {args.input} → {output}")
+    start = time.time()
+    with open(args.input, 'r') as f:
+        data = json.load(f)
+    EventStore.write(output, data)
+    print(f"   ✅ Wrote {len(data.get('events', [])):,} events in {time.time() - start:.2f}s")
+    print(f"   Size: {os.path.getsize(args.input) / 1e6:.2f} MB → {_store_size(output) / 1e6:.2f} MB")
+
+
+if __name__ == '__main__':
+    main()
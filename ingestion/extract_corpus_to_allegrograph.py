@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+Streaming Corpus → RDF Extraction Pipeline
+
+Reads documents from rag/data/raw (PDF/TXT/MD) or a JSONL file, extracts
+triplets with TripletExtractor, maps them to the feekg: vocabulary and
+streams Turtle batches to AllegroGraph.
+
+Stages run in their own threads connected by bounded queues, so document
+reading, LLM extraction, Turtle conversion and HTTP upload overlap and
+memory stays bounded by the queue sizes rather than the corpus size:
+
+    read ──▶ [doc queue] ──▶ extract ×N ──▶ [triplet queue] ──▶ convert ──▶ [turtle queue] ──▶ upload
+
+Usage:
+    # Extract all documents under rag/data/raw and upload
+    python ingestion/extract_corpus_to_allegrograph.py
+
+    # JSONL corpus ({"id": ..., "text": ..., "date": ..., "source": ...} per line)
+    python ingestion/extract_corpus_to_allegrograph.py --input corpus.jsonl
+
+    # Write Turtle locally instead of uploading
+    python ingestion/extract_corpus_to_allegrograph.py --output results/rdf/corpus.ttl
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import queue
+import hashlib
+import argparse
+import threading
+from typing import Dict, Iterator, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.entity_aliases import get_canonical_name
+from ingestion.load_capital_iq_to_allegrograph import AllegroGraphRDFLoader
+from ingestion.process_capital_iq_v3 import CapitalIQProcessorV3
+from llm.instrumentation import llm_metrics, llm_stage
+
+RAW_DATA_DIR = "rag/data/raw"
+
+FEEKG_NS = "http://feekg.org/ontology#"
+
+TURTLE_HEADER = """@prefix feekg: <http://feekg.org/ontology#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+"""
+
+# TripletExtractor relation types → feekg: predicates
+PREDICATE_MAP = {
+    'EVOLVES_TO': 'evolvesTo',
+    'CAUSES': 'causes',
+    'IMPACTS': 'impacts',
+    'TARGETS_ENTITY': 'targetsEntity',
+    'HAS_RISK_TYPE': 'hasRiskType',
+    'MITIGATES': 'mitigates',
+    'AMPLIFIES': 'amplifies',
+    'PRECEDES': 'precedes',
+    'RELATES_TO': 'relatedTo',
+}
+
+# Node types → feekg: classes
+NODE_CLASSES = {
+    'entity': 'Entity',
+    'event': 'Event',
+    'risk': 'Risk',
+    'risk_type': 'RiskType',
+}
+
+# (subject, object) node types fixed by the ontology (domain/range);
+# they override TripletExtractor's entity/event guess
+PREDICATE_NODE_TYPES = {
+    'TARGETS_ENTITY': ('risk', 'entity'),
+    'HAS_RISK_TYPE': ('risk', 'risk_type'),
+}
+
+# Characters not allowed in a Turtle <IRI>
+_IRI_UNSAFE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+_DONE = object()  # Queue sentinel
+
+
+def iter_documents(input_path: str = RAW_DATA_DIR) -> Iterator[Dict]:
+    """
+    Lazily yield documents as {'id', 'text', 'date', 'source'}
+
+    Args:
+        input_path: Directory (PDF/TXT/MD, recursive) or .jsonl file
+    """
+    if input_path.endswith('.jsonl'):
+        with open(input_path, 'r') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield {
+                    'id': str(record.get('id', f"{os.path.basename(input_path)}:{line_no}")),
+                    'text': record['text'],
+                    'date': record.get('date'),
+                    'source': record.get('source', os.path.basename(input_path))
+                }
+        return
+
+    paths = sorted(
+        p for ext in ('pdf', 'txt', 'md')
+        for p in glob.glob(os.path.join(input_path, f"**/*.{ext}"), recursive=True)
+    )
+    for path in paths:
+        rel_path = os.path.relpath(path, input_path)
+        if path.endswith('.pdf'):
+            try:
+                from pypdf import PdfReader
+            except ImportError:
+                print(f"   ⚠️  pypdf not installed, skipping {rel_path}")
+                continue
+            try:
+                text = "\n".join(page.extract_text() or '' for page in PdfReader(path).pages)
+            except Exception as e:
+                print(f"   ⚠️  Failed to read {rel_path}: {e}")
+                continue
+        else:
+            with open(path, 'r', errors='replace') as f:
+                text = f.read()
+
+        yield {'id': rel_path, 'text': text, 'date': None, 'source': os.path.basename(path)}
+
+
+class TripletTurtleMapper:
+    """
+    Maps TripletExtractor output to feekg: Turtle statements
+
+    Entity nodes resolve through config/entity_aliases.py and reuse the
+    ent_<name> ids of the Capital IQ pipeline (CapitalIQProcessorV3.entity_id),
+    so text-extracted facts attach to existing entities. Risk types become
+    feekg:<Name>Risk, e.g. feekg:LiquidityRisk. Event and risk nodes get
+    content-hashed ids.
+
+    Node types come from TripletExtractor, which only tells entities from
+    events, except where the ontology fixes them: targetsEntity and
+    hasRiskType link a Risk (see PREDICATE_NODE_TYPES). Node declarations
+    are emitted once per pipeline run.
+    """
+
+    def __init__(self):
+        self._declared = set()
+
+    @staticmethod
+    def _iri(local_name: str) -> str:
+        # Full IRI: entity ids can contain characters a feekg: prefixed name cannot (',', '&', trailing '.')
+        local_name = _IRI_UNSAFE.sub(lambda m: '%{:02X}'.format(ord(m.group())), local_name)
+        return f"<{FEEKG_NS}{local_name}>"
+
+    def node_uri(self, text: str, node_type: str) -> str:
+        if node_type == 'entity':
+            return self._iri(CapitalIQProcessorV3.entity_id(get_canonical_name(text)))
+        if node_type == 'risk_type':
+            name = ''.join(word.capitalize() for word in re.findall(r'[A-Za-z0-9]+', text))
+            return self._iri(name if name.endswith('Risk') else f"{name}Risk")
+        digest = hashlib.sha1(' '.join(text.lower().split()).encode('utf-8')).hexdigest()[:12]
+        prefix = 'txt_risk' if node_type == 'risk' else 'txt_evt'
+        return self._iri(f"{prefix}_{digest}")
+
+    def _declare(self, uri: str, text: str, node_type: str, triplet: Dict) -> List[str]:
+        if uri in self._declared:
+            return []
+        self._declared.add(uri)
+
+        escape = AllegroGraphRDFLoader._escape
+        node_class = NODE_CLASSES[node_type]
+        if node_type == 'entity':
+            return [
+                f"{uri} rdf:type feekg:Entity .",
+                f'{uri} rdfs:label "{escape(get_canonical_name(text))}" .',
+            ]
+        if node_type in ('risk', 'risk_type'):
+            return [
+                f"{uri} rdf:type feekg:{node_class} .",
+                f'{uri} rdfs:label "{escape(text[:100])}" .',
+            ]
+
+        lines = [
+            f"{uri} rdf:type feekg:Event .",
+            f'{uri} rdfs:label "{escape(text[:100])}" .',
+            f'{uri} feekg:description "{escape(text[:500])}" .',
+            f'{uri} feekg:source "{escape(triplet.get("source", ""))}" .',
+        ]
+        if triplet.get('date'):
+            lines.append(f'{uri} feekg:date "{triplet["date"]}"^^xsd:date .')
+        return lines
+
+    def to_turtle_lines(self, triplet: Dict) -> List[str]:
+        """Return Turtle statements for one validated triplet"""
+        subject_type, object_type = PREDICATE_NODE_TYPES.get(
+            triplet['predicate'], (triplet['subject_type'], triplet['object_type'])
+        )
+        if subject_type not in NODE_CLASSES or object_type not in NODE_CLASSES:
+            raise ValueError(f"Unknown node type in triplet: {subject_type} → {object_type}")
+        subject_uri = self.node_uri(triplet['subject'], subject_type)
+        object_uri = self.node_uri(triplet['object'], object_type)
+        predicate = PREDICATE_MAP.get(triplet['predicate'], 'relatedTo')
+
+        lines = self._declare(subject_uri, triplet['subject'], subject_type, triplet)
+        lines += self._declare(object_uri, triplet['object'], object_type, triplet)
+        lines.append(f"{subject_uri} feekg:{predicate} {object_uri} .")
+        return lines
+
+
+class CorpusRDFPipeline:
+    """
+    Threaded read → extract → convert → upload pipeline with bounded queues
+    """
+
+    def __init__(
+        self,
+        extractor,
+        loader: Optional[AllegroGraphRDFLoader] = None,
+        output_file: Optional[str] = None,
+        extract_workers: int = 2,
+        triples_per_batch: int = 5000,
+        queue_size: int = 8,
+        checkpoint_dir: Optional[str] = None,
+        extract_kwargs: Optional[Dict] = None
+    ):
+        """
+        Args:
+            extractor: TripletExtractor instance
+            loader: AllegroGraphRDFLoader for uploads (ignored if output_file is set)
+            output_file: Write Turtle batches to this file instead of uploading
+            extract_workers: Documents extracted concurrently
+            triples_per_batch: Turtle statements per uploaded batch
+            queue_size: Capacity of each inter-stage queue
+            checkpoint_dir: Per-document extraction checkpoints (see TripletExtractor)
+            extract_kwargs: Extra arguments for extract_from_document()
+        """
+        if loader is None and output_file is None:
+            raise ValueError("Either loader or output_file is required")
+
+        self.extractor = extractor
+        self.loader = loader
+        self.output_file = output_file
+        self.extract_workers = extract_workers
+        self.triples_per_batch = triples_per_batch
+        self.checkpoint_dir = checkpoint_dir
+        self.extract_kwargs = extract_kwargs or {}
+        self.mapper = TripletTurtleMapper()
+
+        self.doc_queue = queue.Queue(maxsize=queue_size)
+        self.triplet_queue = queue.Queue(maxsize=queue_size)
+        self.turtle_queue = queue.Queue(maxsize=queue_size)
+
+        self._lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self.stats = {
+            'documents': 0,
+            'incomplete_documents': 0,
+            'triplets': 0,
+            'statements': 0,
+            'batches_uploaded': 0,
+            'batches_failed': 0,
+        }
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    def _fail(self, error: BaseException):
+        """Record the first stage failure; the other stages then only drain their queues"""
+        with self._lock:
+            if self._error is None:
+                self._error = error
+
+    @staticmethod
+    def _drain(q: queue.Queue, sentinels: int = 1):
+        """Discard items until `sentinels` _DONE markers were read, unblocking upstream put()s"""
+        while sentinels:
+            if q.get() is _DONE:
+                sentinels -= 1
+
+    def _read_stage(self, documents: Iterator[Dict]):
+        try:
+            for doc in documents:
+                if self._error is not None:
+                    break
+                self.doc_queue.put(doc)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            for _ in range(self.extract_workers):
+                self.doc_queue.put(_DONE)
+
+    def _extract_stage(self):
+        try:
+            while True:
+                doc = self.doc_queue.get()
+                if doc is _DONE:
+                    return
+                if self._error is not None:
+                    continue
+
+                try:
+                    with llm_stage('corpus_pipeline.extract'):
+                        result = self.extractor.extract_from_document(
+                            doc['text'],
+                            doc['id'],
+                            source=doc['source'],
+                            date=doc['date'],
+                            checkpoint_dir=self.checkpoint_dir,
+                            **self.extract_kwargs
+                        )
+                except Exception as e:
+                    # Keep the pipeline draining; the document is retried on the next run
+                    print(f"   ❌ {doc['id']}: extraction failed: {e}")
+                    self._count('incomplete_documents')
+                    continue
+
+                self._count('documents')
+                if not result['complete']:
+                    self._count('incomplete_documents')
+                    print(f"   ⚠️  {doc['id']}: chunks {result['failed_chunks']} failed (rerun to retry)")
+
+                self.triplet_queue.put(result['triplets'])
+        except Exception as e:
+            self._fail(e)
+            self._drain(self.doc_queue)
+        finally:
+            self.triplet_queue.put(_DONE)
+
+    def _convert_stage(self):
+        remaining_extractors = self.extract_workers
+        lines = []
+
+        try:
+            while remaining_extractors:
+                triplets = self.triplet_queue.get()
+                if triplets is _DONE:
+                    remaining_extractors -= 1
+                    continue
+                if self._error is not None:
+                    continue
+
+                self._count('triplets', len(triplets))
+                for triplet in triplets:
+                    lines.extend(self.mapper.to_turtle_lines(triplet))
+
+                if len(lines) >= self.triples_per_batch:
+                    self.turtle_queue.put((len(lines), TURTLE_HEADER + "\n".join(lines)))
+                    lines = []
+
+            if lines and self._error is None:
+                self.turtle_queue.put((len(lines), TURTLE_HEADER + "\n".join(lines)))
+        except Exception as e:
+            self._fail(e)
+            self._drain(self.triplet_queue, remaining_extractors)
+        finally:
+            self.turtle_queue.put(_DONE)
+
+    def _upload_stage(self):
+        out = None
+        try:
+            out = open(self.output_file, 'w') if self.output_file else None
+            while True:
+                item = self.turtle_queue.get()
+                if item is _DONE:
+                    return
+                if self._error is not None:
+                    continue
+
+                statement_count, turtle = item
+                if out:
+                    out.write(turtle + "\n\n")
+                    ok = True
+                else:
+                    ok = self.loader.upload_turtle_with_retry(turtle, max_retries=3)
+
+                if ok:
+                    self._count('batches_uploaded')
+                    self._count('statements', statement_count)
+                else:
+                    self._count('batches_failed')
+        except Exception as e:
+            self._fail(e)
+            self._drain(self.turtle_queue)
+        finally:
+            if out:
+                out.close()
+
+    def run(self, documents: Iterator[Dict]) -> Dict:
+        """
+        Run the pipeline to completion
+
+        Args:
+            documents: Iterator of {'id', 'text', 'date', 'source'} (see iter_documents)
+
+        Returns:
+            Stage statistics
+
+        Raises:
+            The first exception raised by a stage (after all stages stopped)
+        """
+        self._error = None
+        threads = [threading.Thread(target=self._read_stage, args=(documents,), name='read')]
+        threads += [
+            threading.Thread(target=self._extract_stage, name=f'extract-{i}')
+            for i in range(self.extract_workers)
+        ]
+        threads.append(threading.Thread(target=self._convert_stage, name='convert'))
+        threads.append(threading.Thread(target=self._upload_stage, name='upload'))
+
+        for t in threads:
+            t.daemon = True
+            t.start()
+        for t in threads:
+            t.join()
+
+        if self._error is not None:
+            raise self._error
+        return dict(self.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Stream documents through triplet extraction into AllegroGraph'
+    )
+    parser.add_argument('--input', default=RAW_DATA_DIR,
+                        help=f'Document directory or .jsonl file (default: {RAW_DATA_DIR})')
+    parser.add_argument('--output', help='Write Turtle to this file instead of uploading')
+    parser.add_argument('--checkpoint-dir', default='results/extraction_checkpoints',
+                        help='Per-document extraction checkpoints')
+    parser.add_argument('--extract-workers', type=int, default=2,
+                        help='Documents extracted concurrently')
+    parser.add_argument('--chunk-workers', type=int, default=4,
+                        help='Concurrent LLM requests per document')
+    parser.add_argument('--batch-size', type=int, default=5000,
+                        help='Turtle statements per upload batch')
+    parser.add_argument('--queue-size', type=int, default=8,
+                        help='Capacity of each inter-stage queue')
+
+    args = parser.parse_args()
+
+    print("\n" + "=" * 70)
+    print("  Corpus → RDF Extraction Pipeline")
+    print("=" * 70)
+
+    if not os.path.exists(args.input):
+        print(f"\n❌ Error: Input not found: {args.input}")
+        sys.exit(1)
+
+    from llm import TripletExtractor
+
+    loader = None if args.output else AllegroGraphRDFLoader()
+    pipeline = CorpusRDFPipeline(
+        TripletExtractor(),
+        loader=loader,
+        output_file=args.output,
+        extract_workers=args.extract_workers,
+        triples_per_batch=args.batch_size,
+        queue_size=args.queue_size,
+        checkpoint_dir=args.checkpoint_dir,
+        extract_kwargs={'max_workers': args.chunk_workers}
+    )
+
+    print(f"\nInput: {args.input}")
+    print(f"Target: {args.output or loader.repo_url}")
+
+    stats = pipeline.run(iter_documents(args.input))
+
+    print(f"\n✅ Pipeline complete")
+    print(f"  - Documents: {stats['documents']:,} ({stats['incomplete_documents']} incomplete)")
+    print(f"  - Triplets: {stats['triplets']:,}")
+    print(f"  - Statements: {stats['statements']:,}")
+    print(f"  - Batches: {stats['batches_uploaded']} ok, {stats['batches_failed']} failed")
+
+    for stage, totals in llm_metrics.to_dict()['stages'].items():
+        print(f"  - LLM [{stage}]: {totals['calls']} calls, "
+              f"{totals['prompt_tokens'] + totals['completion_tokens']:,} tokens, "
+              f"{totals['latency_seconds']:.1f}s")
+    print("=" * 70 + "\n")
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Cancelled by user (completed chunks are checkpointed)")
+        sys.exit(0)
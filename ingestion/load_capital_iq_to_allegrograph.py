@@ -8,7 +8,15 @@ and converts them to RDF triples in AllegroGraph.
 Features:
 - Batch processing for large files (4000+ events)
 - RDF/Turtle format for efficient upload
-- Evolution link computation
+- Parallel uploads with a resumable checkpoint (rerun an interrupted
+  load with --no-clear; removed once a load has no failed batches)
+- Optional gzip N-Triples bulk path (--format ntriples-gz)
+- Idempotent diff-based reloads without clearing (--diff)
+- Pipelined load: conversion, uploads and evolution scoring (process
+  pool) run concurrently through bounded queues
+- Evolution link computation, reified or compact (--link-encoding)
+- Named graphs per source file and year/quarter (--partition), with
+  partitions reloadable on their own (--periods)
 - Progress tracking
 
 Usage:
@@ -23,27 +31,51 @@ Usage:
 """
 
 import os
+import io
 import sys
-import json
+import gzip
 import argparse
 import glob
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple
+from itertools import islice
+from typing import List, Dict, Tuple, Iterable, Iterator, Optional
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
-from evolution.methods import compute_all_evolution_links
+from evolution.methods import compute_all_evolution_links, iter_evolution_links
+from ingestion.event_store import load_event_data
+from ingestion.batch_uploader import BatchUploader, DEFAULT_CHECKPOINT_DIR
+from ingestion.diff_loader import RDFDiffLoader, DEFAULT_MANIFEST_DIR, default_manifest_file
+from ingestion.pipeline import prefetch, StageTimer
+from config.entity_aliases import get_canonical_name, get_all_aliases
+from config.graph_partitions import GRAPH_NS, GraphPartitioner, PARTITION_SCHEMES
+from config.sparql_session import configure, get_session
 
 load_dotenv()
 
 
+# Evolution link encodings (both share feekg:from/to/score, so the same
+# neighbourhood query reads either):
+# - reified: evolvesTo edge + blank-node EvolutionLink with rdf:type, from,
+#   to, score and one *Score triple per component (~11 triples per link)
+# - compact: evolvesTo edge + link IRI feekg:<from>_to_<to> with from, to,
+#   score and one packed componentScores literal (5 triples per link);
+#   re-uploading a link is a no-op instead of a duplicate blank node
+LINK_ENCODINGS = ('reified', 'compact')
+
+
 class AllegroGraphRDFLoader:
     """Optimized RDF loader for AllegroGraph via HTTPS"""
 
-    def __init__(self):
+    def __init__(self, link_encoding: str = 'reified'):
+        if link_encoding not in LINK_ENCODINGS:
+            raise ValueError(f"Unknown link encoding: {link_encoding} (expected one of {LINK_ENCODINGS})")
+        self.link_encoding = link_encoding
         self.base_url = os.getenv('AG_URL', 'https://qa-agraph.nelumbium.ai/').rstrip('/')
         self.user = os.getenv('AG_USER', 'sadmin')
         self.password = os.getenv('AG_PASS')
@@ -56,6 +88,9 @@ class AllegroGraphRDFLoader:
 
         self.auth = (self.user, self.password)
 
+        # Shared keep-alive session (config.sparql_session)
+        self.session = get_session()
+
         # Namespaces
         self.ns = {
             'feekg': 'http://feekg.org/ontology#',
@@ -67,7 +102,7 @@ class AllegroGraphRDFLoader:
     def get_triple_count(self) -> int:
         """Get current triple count"""
         try:
-            response = requests.get(f"{self.repo_url}/size", auth=self.auth, timeout=10)
+            response = self.session.get(f"{self.repo_url}/size", auth=self.auth, timeout=10)
             response.raise_for_status()
             return int(response.text.strip())
         except Exception as e:
@@ -77,17 +112,34 @@ class AllegroGraphRDFLoader:
     def clear_repository(self):
         """Clear all triples from repository"""
         try:
-            response = requests.delete(self.statements_url, auth=self.auth, timeout=30)
+            response = self.session.delete(self.statements_url, auth=self.auth, timeout=30)
             response.raise_for_status()
             print("   ✅ Repository cleared")
         except Exception as e:
             print(f"   ❌ Failed to clear repository: {e}")
             raise
 
+    def drop_graphs(self, graphs: Iterable[str]):
+        """Delete every triple in the given named graphs"""
+        for graph in graphs:
+            response = self.session.delete(
+                self.statements_url,
+                params={'context': f"<{graph}>"},
+                auth=self.auth,
+                timeout=60
+            )
+            response.raise_for_status()
+            print(f"   ✅ Dropped {graph}")
+
+    @staticmethod
+    def batch_content_type(partitioner: Optional[GraphPartitioner] = None) -> str:
+        """Content-Type of Turtle/link batches (TriG when partitioned into named graphs)"""
+        return 'application/trig' if partitioner else 'text/turtle'
+
     def upload_turtle(self, turtle_content: str) -> bool:
         """Upload Turtle content to AllegroGraph"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.statements_url,
                 data=turtle_content.encode('utf-8'),
                 headers={'Content-Type': 'text/turtle'},
@@ -117,7 +169,7 @@ class AllegroGraphRDFLoader:
 
         for attempt in range(max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.statements_url,
                     data=turtle_content.encode('utf-8'),
                     headers={'Content-Type': 'text/turtle'},
@@ -173,130 +225,307 @@ class AllegroGraphRDFLoader:
 
         return False
 
-    def convert_to_turtle(self, data: Dict, batch_size: int = 500) -> List[str]:
+    # Request bodies are sent in pieces of this size (chunked transfer encoding)
+    STREAM_CHUNK_SIZE = 64 << 10
+
+    TURTLE_HEADER = """@prefix feekg: <http://feekg.org/ontology#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+"""
+
+    @staticmethod
+    def build_entity_index(entities: List[Dict]) -> Dict[str, str]:
         """
-        Convert JSON data to Turtle format in batches
+        Map entity names (and their known aliases) to entity IDs
+
+        Exact names win over aliases, and the first entity with a given
+        name wins (same as the previous linear search).
+        """
+        index: Dict[str, str] = {}
+        for entity in entities:
+            index.setdefault(entity['name'], entity['entityId'])
+        for entity in entities:
+            for alias in get_all_aliases(get_canonical_name(entity['name'])):
+                index.setdefault(alias, entity['entityId'])
+        return index
+
+    @staticmethod
+    def _resolve_entity(index: Dict[str, Optional[str]], entity_name: str) -> Optional[str]:
+        """Look up a mention; misses are resolved via canonical name once and cached"""
+        if entity_name not in index:
+            index[entity_name] = index.get(get_canonical_name(entity_name))
+        return index[entity_name]
+
+    def count_turtle_batches(self, data: Dict, batch_size: int = 500) -> int:
+        """Number of batches iter_turtle_batches() will yield"""
+        return 1 + -(-len(data['events']) // batch_size)
+
+    def _entity_triples(self, entity: Dict) -> Iterator[Tuple[str, str, str]]:
+        """(subject, predicate, object) Turtle terms for one entity"""
+        entity_uri = f"feekg:{entity['entityId']}"
+        yield entity_uri, 'rdf:type', 'feekg:Entity'
+        yield entity_uri, 'rdfs:label', f'"{self._escape(entity["name"])}"'
+        yield entity_uri, 'feekg:entityType', f'"{entity["type"]}"'
+
+    def _event_triples(self, event: Dict, entity_index: Dict[str, Optional[str]]) -> Iterator[Tuple[str, str, str]]:
+        """(subject, predicate, object) Turtle terms for one event"""
+        escape = self._escape
+        event_uri = f"feekg:{event['eventId']}"
+
+        # Core event properties
+        yield event_uri, 'rdf:type', 'feekg:Event'
+        yield event_uri, 'feekg:eventType', f'"{event["type"]}"'
+        yield event_uri, 'feekg:date', f'"{event["date"]}"^^xsd:date'
+        yield event_uri, 'rdfs:label', f'"{escape(event["headline"][:100])}"'
+
+        # Optional properties
+        if 'description' in event and event['description']:
+            yield event_uri, 'feekg:description', f'"{escape(event["description"][:500])}"'
+
+        if 'actor' in event and event['actor']:
+            yield event_uri, 'feekg:actor', f'"{escape(event["actor"])}"'
+
+        if 'source' in event:
+            yield event_uri, 'feekg:source', f'"{escape(event["source"])}"'
+
+        if 'severity' in event:
+            yield event_uri, 'feekg:severity', f'"{event["severity"]}"'
+
+        # CSV Source metadata (for traceability back to original CSV)
+        if 'csvSource' in event:
+            csv_src = event['csvSource']
+            if 'rowNumber' in csv_src:
+                yield event_uri, 'feekg:csvRowNumber', f'"{csv_src["rowNumber"]}"^^xsd:integer'
+            if 'filename' in csv_src:
+                yield event_uri, 'feekg:csvFilename', f'"{csv_src["filename"]}"'
+            if 'capitalIqId' in csv_src:
+                yield event_uri, 'feekg:capitalIqId', f'"{csv_src["capitalIqId"]}"'
+            if 'companyId' in csv_src:
+                yield event_uri, 'feekg:companyId', f'"{csv_src["companyId"]}"'
+            if 'companyName' in csv_src:
+                yield event_uri, 'feekg:companyName', f'"{escape(csv_src["companyName"])}"'
+            if 'originalEventType' in csv_src:
+                yield event_uri, 'feekg:originalEventType', f'"{escape(csv_src["originalEventType"])}"'
+
+        # Classification metadata (for quality tracking)
+        if 'classification' in event:
+            classification = event['classification']
+            if 'confidence' in classification:
+                yield event_uri, 'feekg:classificationConfidence', f'"{classification["confidence"]:.2f}"^^xsd:float'
+            if 'method' in classification:
+                yield event_uri, 'feekg:classificationMethod', f'"{classification["method"]}"'
+
+        # Link to entities
+        for entity_name in event.get('entities', []):
+            entity_id = self._resolve_entity(entity_index, entity_name)
+            if entity_id:
+                yield event_uri, 'feekg:involves', f"feekg:{entity_id}"
+
+    def iter_turtle_batches(
+        self,
+        data: Dict,
+        batch_size: int = 500,
+        partitioner: Optional[GraphPartitioner] = None
+    ) -> Iterator[str]:
+        """
+        Convert JSON data to Turtle format, yielding one batch at a time
+
+        The first batch holds all entities; each following batch holds
+        batch_size events. Only the current batch is held in memory.
 
         Args:
             data: Capital IQ JSON data
             batch_size: Number of events per batch
+            partitioner: Write into named graphs (batches become TriG, one
+                graph block per partition present in the batch)
 
-        Returns:
-            List of Turtle strings (one per batch)
+        Yields:
+            Turtle (or TriG) strings (one per batch)
         """
-        batches = []
         events = data['events']
         entities = data['entities']
+        entity_index = self.build_entity_index(entities)
+
+        def batch_text(buffers: Dict[Optional[str], io.StringIO]) -> str:
+            if partitioner is None:
+                # Triples are newline-terminated in the buffer; batches are newline-joined
+                return self.TURTLE_HEADER + buffers[None].getvalue()[:-1]
+            return self.TURTLE_HEADER + "\n".join(
+                f"<{graph}> {{\n{buffer.getvalue()}}}" for graph, buffer in buffers.items()
+            )
 
-        # Create namespace prefixes
-        header = """@prefix feekg: <http://feekg.org/ontology#> .
-@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-"""
+        def write(buffers: Dict[Optional[str], io.StringIO], graph: Optional[str], triples):
+            buffer = buffers.get(graph)
+            if buffer is None:
+                buffer = buffers[graph] = io.StringIO()
+            buffer.writelines(f"{s} {p} {o} .\n" for s, p, o in triples)
 
         # Batch 1: Entities (always in first batch)
-        entity_triples = []
+        buffers = {None: io.StringIO()} if partitioner is None else {}
+        entity_graph = partitioner.entity_graph() if partitioner else None
         for entity in entities:
-            entity_id = entity['entityId']
-            entity_uri = f"feekg:{entity_id}"
-
-            entity_triples.append(f"{entity_uri} rdf:type feekg:Entity .")
-            entity_triples.append(f'{entity_uri} rdfs:label "{self._escape(entity["name"])}" .')
-            entity_triples.append(f'{entity_uri} feekg:entityType "{entity["type"]}" .')
-
-        batches.append(header + "\n".join(entity_triples))
+            write(buffers, entity_graph, self._entity_triples(entity))
+        yield batch_text(buffers)
 
         # Batch events in chunks
         for i in range(0, len(events), batch_size):
-            batch_events = events[i:i + batch_size]
-            event_triples = []
-
-            for event in batch_events:
-                event_id = event['eventId']
-                event_uri = f"feekg:{event_id}"
-
-                # Core event properties
-                event_triples.append(f"{event_uri} rdf:type feekg:Event .")
-                event_triples.append(f'{event_uri} feekg:eventType "{event["type"]}" .')
-                event_triples.append(f'{event_uri} feekg:date "{event["date"]}"^^xsd:date .')
-                event_triples.append(f'{event_uri} rdfs:label "{self._escape(event["headline"][:100])}" .')
-
-                # Optional properties
-                if 'description' in event and event['description']:
-                    event_triples.append(f'{event_uri} feekg:description "{self._escape(event["description"][:500])}" .')
-
-                if 'actor' in event and event['actor']:
-                    event_triples.append(f'{event_uri} feekg:actor "{self._escape(event["actor"])}" .')
-
-                if 'source' in event:
-                    event_triples.append(f'{event_uri} feekg:source "{self._escape(event["source"])}" .')
-
-                if 'severity' in event:
-                    event_triples.append(f'{event_uri} feekg:severity "{event["severity"]}" .')
-
-                # CSV Source metadata (for traceability back to original CSV)
-                if 'csvSource' in event:
-                    csv_src = event['csvSource']
-                    if 'rowNumber' in csv_src:
-                        event_triples.append(f'{event_uri} feekg:csvRowNumber "{csv_src["rowNumber"]}"^^xsd:integer .')
-                    if 'filename' in csv_src:
-                        event_triples.append(f'{event_uri} feekg:csvFilename "{csv_src["filename"]}" .')
-                    if 'capitalIqId' in csv_src:
-                        event_triples.append(f'{event_uri} feekg:capitalIqId "{csv_src["capitalIqId"]}" .')
-                    if 'companyId' in csv_src:
-                        event_triples.append(f'{event_uri} feekg:companyId "{csv_src["companyId"]}" .')
-                    if 'companyName' in csv_src:
-                        event_triples.append(f'{event_uri} feekg:companyName "{self._escape(csv_src["companyName"])}" .')
-                    if 'originalEventType' in csv_src:
-                        event_triples.append(f'{event_uri} feekg:originalEventType "{self._escape(csv_src["originalEventType"])}" .')
-
-                # Classification metadata (for quality tracking)
-                if 'classification' in event:
-                    classification = event['classification']
-                    if 'confidence' in classification:
-                        event_triples.append(f'{event_uri} feekg:classificationConfidence "{classification["confidence"]:.2f}"^^xsd:float .')
-                    if 'method' in classification:
-                        event_triples.append(f'{event_uri} feekg:classificationMethod "{classification["method"]}" .')
-
-                # Link to entities
-                for entity_name in event.get('entities', []):
-                    # Find entity ID
-                    entity_id = next((e['entityId'] for e in entities if e['name'] == entity_name), None)
-                    if entity_id:
-                        entity_uri = f"feekg:{entity_id}"
-                        event_triples.append(f"{event_uri} feekg:involves {entity_uri} .")
-
-            if event_triples:
-                batches.append(header + "\n".join(event_triples))
-
-        return batches
-
-    def add_evolution_links(self, links: List[Dict]) -> bool:
-        """Add evolution links as RDF triples"""
-        if not links:
-            return True
+            buffers = {None: io.StringIO()} if partitioner is None else {}
+            for event in events[i:i + batch_size]:
+                graph = partitioner.event_graph(event) if partitioner else None
+                write(buffers, graph, self._event_triples(event, entity_index))
+            yield batch_text(buffers)
+
+    def _ntriples_term(self, term: str) -> str:
+        """Expand a prefixed Turtle term (IRI or typed literal) to N-Triples syntax"""
+        if term.startswith('"'):
+            if term.endswith('"'):
+                return term
+            literal, _, datatype = term.rpartition('^^')
+            return f"{literal}^^{self._ntriples_term(datatype)}"
+        if term.startswith('_:'):
+            return term
+        prefix, _, local = term.partition(':')
+        return f"<{self.ns[prefix]}{local}>"
+
+    def iter_ntriples_batches(
+        self,
+        data: Dict,
+        batch_bytes: int = 8 << 20,
+        graph: Optional[str] = None,
+        partitioner: Optional[GraphPartitioner] = None
+    ) -> Iterator[bytes]:
+        """
+        Convert JSON data to N-Triples (or N-Quads with a graph IRI), yielding
+        UTF-8 batches of about batch_bytes
 
-        # Process in batches
-        batch_size = 1000
-        for i in range(0, len(links), batch_size):
-            batch_links = links[i:i + batch_size]
-            triples = []
+        Same triples as iter_turtle_batches(), with full IRIs instead of a
+        prefix header, split by size rather than event count.
+
+        Args:
+            data: Capital IQ JSON data
+            batch_bytes: Target uncompressed batch size
+            graph: Named graph IRI (emits N-Quads)
+            partitioner: Per-record named graphs (emits N-Quads; overrides graph)
+        """
+        entity_index = self.build_entity_index(data['entities'])
+        expand = self._ntriples_term
+        terms: Dict[str, str] = {}   # predicates/classes repeat on every line
+        suffixes: Dict[Optional[str], str] = {}
+
+        def records():
+            for entity in data['entities']:
+                yield partitioner.entity_graph() if partitioner else graph, self._entity_triples(entity)
+            for event in data['events']:
+                yield partitioner.event_graph(event) if partitioner else graph, self._event_triples(event, entity_index)
+
+        buffer = io.BytesIO()
+        for record_graph, triples in records():
+            suffix = suffixes.get(record_graph)
+            if suffix is None:
+                suffix = suffixes[record_graph] = f" <{record_graph}> .\n" if record_graph else " .\n"
+            for s, p, o in triples:
+                if p not in terms:
+                    terms[p] = expand(p)
+                line = f"{expand(s)} {terms[p]} {expand(o)}{suffix}"
+                buffer.write(line.encode('utf-8'))
+                if buffer.tell() >= batch_bytes:
+                    yield buffer.getvalue()
+                    buffer = io.BytesIO()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def iter_compressed_batches(
+        self,
+        data: Dict,
+        batch_bytes: int = 8 << 20,
+        graph: Optional[str] = None,
+        partitioner: Optional[GraphPartitioner] = None
+    ) -> Iterator[bytes]:
+        """gzip-compressed iter_ntriples_batches() (deterministic, so checkpoints still match)"""
+        for batch in self.iter_ntriples_batches(data, batch_bytes, graph, partitioner):
+            yield gzip.compress(batch, compresslevel=6, mtime=0)
+
+    def convert_to_turtle(self, data: Dict, batch_size: int = 500) -> List[str]:
+        """
+        Convert JSON data to Turtle format in batches
+
+        Materializes iter_turtle_batches(); prefer the generator for large files.
+
+        Args:
+            data: Capital IQ JSON data
+            batch_size: Number of events per batch
+
+        Returns:
+            List of Turtle strings (one per batch)
+        """
+        return list(self.iter_turtle_batches(data, batch_size))
+
+    @staticmethod
+    def pack_components(components: Dict[str, float]) -> str:
+        """componentScores literal: <component>=<value>,..."""
+        return ','.join(f"{name}={value:.4f}" for name, value in components.items())
+
+    @staticmethod
+    def unpack_components(packed: str) -> Dict[str, float]:
+        """Inverse of pack_components"""
+        return {
+            name: float(value)
+            for name, value in (item.split('=', 1) for item in packed.split(',') if item)
+        }
+
+    def iter_evolution_link_batches(
+        self,
+        links: Iterable[Dict],
+        batch_size: int = 1000,
+        encoding: Optional[str] = None,
+        partitioner: Optional[GraphPartitioner] = None
+    ) -> Iterator[str]:
+        """
+        Convert evolution links to Turtle, yielding one batch at a time
 
-            header = """@prefix feekg: <http://feekg.org/ontology#> .
+        Args:
+            links: Evolution links (a list, or a stream from iter_evolution_links)
+            batch_size: Links per batch
+            encoding: 'reified' or 'compact' (default: the loader's link_encoding)
+            partitioner: Write each link into its source event's partition (TriG)
+        """
+        encoding = encoding or self.link_encoding
+        header = """@prefix feekg: <http://feekg.org/ontology#> .
 @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
 @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
 
 """
 
+        links = iter(links)
+        while True:
+            batch_links = list(islice(links, batch_size))
+            if not batch_links:
+                break
+            graphs: Dict[Optional[str], List[str]] = {}
+
             for link in batch_links:
+                graph = partitioner.link_graph(link) if partitioner else None
+                triples = graphs.get(graph)
+                if triples is None:
+                    triples = graphs[graph] = []
                 from_uri = f"feekg:{link['from']}"
                 to_uri = f"feekg:{link['to']}"
 
                 # Main evolution relationship
                 triples.append(f"{from_uri} feekg:evolvesTo {to_uri} .")
 
+                if encoding == 'compact':
+                    # Deterministic link IRI, component scores in one literal
+                    link_uri = f"feekg:{link['from']}_to_{link['to']}"
+                    triples.append(f"{link_uri} feekg:from {from_uri} .")
+                    triples.append(f"{link_uri} feekg:to {to_uri} .")
+                    triples.append(f'{link_uri} feekg:score "{link["score"]:.4f}"^^xsd:float .')
+                    components = self.pack_components(link.get('components', {}))
+                    triples.append(f'{link_uri} feekg:componentScores "{components}" .')
+                    continue
+
                 # Evolution scores (using blank nodes for structured data)
                 link_id = f"_:link_{link['from']}_{link['to']}"
                 triples.append(f"{link_id} rdf:type feekg:EvolutionLink .")
@@ -310,14 +539,89 @@ class AllegroGraphRDFLoader:
                     for comp_name, comp_value in components.items():
                         triples.append(f'{link_id} feekg:{comp_name}Score "{comp_value:.4f}"^^xsd:float .')
 
-            turtle = header + "\n".join(triples)
+            if partitioner is None:
+                yield header + "\n".join(graphs[None])
+            else:
+                yield header + "\n".join(
+                    f"<{graph}> {{\n" + "\n".join(triples) + "\n}" for graph, triples in graphs.items()
+                )
+
+    def add_evolution_links(self, links: List[Dict], uploader: Optional[BatchUploader] = None) -> bool:
+        """
+        Add evolution links as RDF triples
+
+        Failed batches are reported and skipped. With an uploader, batches
+        go through its worker pool and checkpoint.
+        """
+        if not links:
+            return True
+
+        batch_size = 1000
+        batches = self.iter_evolution_link_batches(links, batch_size)
+
+        if uploader is not None:
+            total = -(-len(links) // batch_size)
+            report = uploader.upload(batches, total=total, label='Link batch')
+            if report['failed']:
+                print(f"   ⚠️  Failed to upload evolution link batches {report['failed']}. Skipping...")
+            return True
+
+        for i, turtle in enumerate(batches):
             if not self.upload_turtle_with_retry(turtle, max_retries=3):
-                print(f"   ⚠️  Failed to upload evolution link batch {i+1}. Skipping...")
+                print(f"   ⚠️  Failed to upload evolution link batch {i * batch_size + 1}. Skipping...")
                 # Don't return False - continue with other batches
                 continue
 
         return True
 
+    def default_checkpoint_file(self) -> str:
+        """Upload checkpoint for this repository"""
+        return os.path.join(DEFAULT_CHECKPOINT_DIR, f"{self.catalog}_{self.repo}.json")
+
+    def create_uploader(self, workers: int = 4, checkpoint_file: Optional[str] = None) -> BatchUploader:
+        """Parallel uploader for this repository's statements endpoint"""
+        return BatchUploader(
+            self.statements_url,
+            auth=self.auth,
+            content_type='text/turtle',
+            workers=workers,
+            session=self.session,
+            checkpoint_file=checkpoint_file
+        )
+
+    def upload_compressed(
+        self,
+        data: Dict,
+        uploader: BatchUploader,
+        batch_bytes: int = 8 << 20,
+        graph: Optional[str] = None,
+        batches: Optional[Iterable[bytes]] = None,
+        partitioner: Optional[GraphPartitioner] = None
+    ) -> Dict:
+        """
+        Upload events/entities as gzip-compressed N-Triples (N-Quads with a graph)
+
+        Batches are sized by uncompressed bytes and sent with chunked
+        transfer encoding in STREAM_CHUNK_SIZE pieces.
+
+        Args:
+            batches: Compressed batches to send instead of
+                iter_compressed_batches(data, batch_bytes, graph) (e.g. prefetched)
+            partitioner: Per-record named graphs (N-Quads)
+
+        Returns:
+            The uploader report
+        """
+        if batches is None:
+            batches = self.iter_compressed_batches(data, batch_bytes, graph, partitioner)
+        return uploader.upload(
+            batches,
+            label='Compressed batch',
+            content_type='application/n-quads' if graph or partitioner else 'application/n-triples',
+            content_encoding='gzip',
+            stream_chunk_size=self.STREAM_CHUNK_SIZE
+        )
+
     @staticmethod
     def _escape(text: str) -> str:
         """Escape special characters for Turtle format"""
@@ -331,14 +635,62 @@ class AllegroGraphRDFLoader:
                 .replace('\t', '\\t'))
 
 
+def is_delta_file(data: Dict, file_path: str) -> bool:
+    """
+    True (with a hint) for an incremental delta from process_capital_iq_v4.py
+
+    A delta only holds changed records, so loading it would either replace
+    the repository with them or leave removed events and stale links
+    behind; the merged store is synced with --diff instead.
+    """
+    metadata = data.get('metadata') or {}
+    if not metadata.get('delta'):
+        return False
+    store = os.path.abspath(metadata['base_file']) if metadata.get('base_file') else '<merged store>'
+    print(f"   ⚠️  Skipping {os.path.basename(file_path)}: incremental delta (changed records only)")
+    print(f"      Sync the merged store instead: --diff --input {store}")
+    return True
+
+
 def load_file_to_allegrograph(
     loader: AllegroGraphRDFLoader,
     file_path: str,
-    compute_evolution: bool = True
+    compute_evolution: bool = True,
+    uploader: Optional[BatchUploader] = None,
+    compressed: bool = False,
+    batch_bytes: int = 8 << 20,
+    evolution_workers: Optional[int] = None,
+    queue_size: int = 8,
+    partitioner: Optional[GraphPartitioner] = None,
+    periods: Optional[List[str]] = None
 ) -> Tuple[int, int, int]:
     """
     Load a single Capital IQ file to AllegroGraph
 
+    Runs as a pipeline rather than convert → upload → score → upload:
+    - Events: RDF conversion in a background thread, at most queue_size
+      batches ahead of the uploader
+    - Evolution links: scored in a process pool and streamed into link
+      batches, uploaded while scoring (and the event upload) continue
+    Both upload stages share the uploader's worker pool settings and
+    checkpoint, so load time approaches the slowest stage instead of the
+    sum of all stages.
+
+    Args:
+        loader: AllegroGraph loader
+        file_path: Processed JSON file or *.evstore
+        compute_evolution: Compute and upload evolution links
+        uploader: Batch uploader (default: loader.create_uploader(), no checkpoint)
+        compressed: Upload events as gzip N-Triples batches of batch_bytes
+            instead of Turtle (evolution links stay Turtle)
+        batch_bytes: Uncompressed size per compressed batch
+        evolution_workers: Scoring processes (default: CPU count, capped at 8)
+        queue_size: Converted batches buffered ahead of each upload stage
+        partitioner: Write into named graphs per dataset and period
+        periods: With a partitioner, reload only these periods: their graphs
+            (and the dataset's entity graph) are dropped first, then only
+            their events and the links starting at them are uploaded
+
     Returns:
         (entity_count, event_count, link_count)
     """
@@ -346,9 +698,13 @@ def load_file_to_allegrograph(
     print(f"Loading: {os.path.basename(file_path)}")
     print(f"{'='*70}")
 
-    # Load JSON
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    if uploader is None:
+        uploader = loader.create_uploader()
+
+    # Load JSON (or columnar event store)
+    data = load_event_data(file_path)
+    if is_delta_file(data, file_path):
+        return (0, 0, 0)
 
     metadata = data.get('metadata', {})
     events = data.get('events', [])
@@ -359,53 +715,155 @@ def load_file_to_allegrograph(
     print(f"   - Entities: {len(entities)}")
     print(f"   - Date range: {metadata.get('date_range', {}).get('start', 'N/A')} to {metadata.get('date_range', {}).get('end', 'N/A')}")
 
-    # Convert to Turtle batches
-    print(f"\n2. Converting to RDF (Turtle format)...")
-    batches = loader.convert_to_turtle(data, batch_size=500)
-    print(f"   ✅ Created {len(batches)} batches")
+    upload_data = data
+    if partitioner is not None:
+        print(f"   - Named graphs: {GRAPH_NS}{partitioner.dataset}/<{partitioner.scheme}>")
+        if periods:
+            selected = set(periods)
+            upload_data = dict(data, events=[e for e in events if partitioner.period(e.get('date')) in selected])
+            print(f"\n   Reloading {len(upload_data['events']):,} events in {', '.join(sorted(selected))}")
+            loader.drop_graphs([partitioner.entity_graph()] + [partitioner.graph(period) for period in sorted(selected)])
 
-    # Upload batches with retry and checkpoint tracking
-    print(f"\n3. Uploading to AllegroGraph...")
     initial_count = loader.get_triple_count()
+    timer = StageTimer()
+    start = time.time()
 
-    successful_batches = 0
-    failed_batches = []
+    # The scoring pool is forked before any pipeline thread starts
+    links = None
+    if compute_evolution and len(events) > 1:
+        print(f"\n2. Scoring evolution links in the background...")
+        print("   Methods: Temporal, Entity Overlap, Semantic, Topic, Causality, Emotional")
+        try:
+            links = iter_evolution_links(events, entities, threshold=0.2, max_workers=evolution_workers)
+        except Exception as e:
+            print(f"   ⚠️  Evolution computation failed: {e}")
 
-    for i, batch in enumerate(batches, 1):
-        print(f"   Batch {i}/{len(batches)}... ", end='', flush=True)
-        if loader.upload_turtle_with_retry(batch, max_retries=3):
-            print("✅")
-            successful_batches += 1
+    def upload_events() -> Tuple[Dict, int]:
+        stage_start = time.perf_counter()
+        if compressed:
+            batches = prefetch(
+                timer.timed('convert', loader.iter_compressed_batches(upload_data, batch_bytes, partitioner=partitioner)),
+                maxsize=queue_size, name='convert'
+            )
+            report = loader.upload_compressed(upload_data, uploader, batch_bytes=batch_bytes, batches=batches,
+                                              partitioner=partitioner)
+            batch_count = report['total']
         else:
-            print("❌")
-            failed_batches.append(i)
-            # Continue processing other batches instead of stopping
+            batch_count = loader.count_turtle_batches(upload_data, batch_size=500)
+            batches = prefetch(
+                timer.timed('convert', loader.iter_turtle_batches(upload_data, batch_size=500, partitioner=partitioner)),
+                maxsize=queue_size, name='convert'
+            )
+            report = uploader.upload(batches, total=batch_count, content_type=loader.batch_content_type(partitioner))
+        timer.add('event upload', time.perf_counter() - stage_start)
+        return report, batch_count
+
+    def upload_links() -> int:
+        stage_start = time.perf_counter()
+        count = 0
+
+        def counted():
+            nonlocal count
+            for link in timer.timed('score', links):
+                if periods and partitioner.period(link['from_date']) not in periods:
+                    continue
+                count += 1
+                yield link
+
+        try:
+            batches = prefetch(
+                loader.iter_evolution_link_batches(counted(), partitioner=partitioner),
+                maxsize=queue_size, name='links'
+            )
+            report = uploader.upload(batches, label='Link batch', content_type=loader.batch_content_type(partitioner))
+            if report['failed']:
+                print(f"   ⚠️  Failed to upload evolution link batches {report['failed']}. Skipping...")
+        except Exception as e:
+            print(f"   ⚠️  Evolution computation failed: {e}")
+            return 0
+        finally:
+            timer.add('link upload', time.perf_counter() - stage_start)
+        return count
+
+    mode = f"gzip N-Triples, {batch_bytes >> 20} MB batches" if compressed else "Turtle"
+    print(f"\n3. Uploading to AllegroGraph ({mode}, {uploader.workers} workers per stage)...")
+    with ThreadPoolExecutor(max_workers=2) as stages:
+        event_stage = stages.submit(upload_events)
+        link_stage = stages.submit(upload_links) if links is not None else None
+        report, batch_count = event_stage.result()
+        link_count = link_stage.result() if link_stage is not None else 0
 
     new_count = loader.get_triple_count()
     uploaded_count = new_count - initial_count
+    if report['skipped']:
+        print(f"   ⏭️  Skipped {report['skipped']} batches acknowledged in a previous run")
 
-    if failed_batches:
-        print(f"   ⚠️  Uploaded {uploaded_count:,} triples ({successful_batches}/{len(batches)} batches)")
-        print(f"   ⚠️  Failed batches: {failed_batches} (continuing anyway)")
+    if report['failed']:
+        print(f"   ⚠️  Event batches: {report['uploaded']}/{batch_count} uploaded")
+        print(f"   ⚠️  Failed batches: {report['failed']} (continuing anyway)")
     else:
-        print(f"   ✅ Uploaded {uploaded_count:,} triples (all {len(batches)} batches successful)")
+        print(f"   ✅ Event batches: all {batch_count} acknowledged")
+    if links is not None:
+        print(f"   ✅ Evolution links: {link_count:,} (score ≥ 0.2)")
+    print(f"   ✅ Uploaded {uploaded_count:,} triples in {time.time() - start:.1f}s (stages: {timer.summary()})")
 
-    # Compute evolution links
-    link_count = 0
-    if compute_evolution and len(events) > 1:
-        print(f"\n4. Computing evolution links...")
-        print("   Methods: Temporal, Entity Overlap, Semantic, Topic, Causality, Emotional")
+    return (len(entities), len(events), link_count)
 
-        try:
-            links = compute_all_evolution_links(events, entities, threshold=0.2)
-            print(f"   ✅ Computed {len(links)} links (score ≥ 0.2)")
 
-            if links:
-                print(f"\n5. Uploading evolution links...")
-                if loader.add_evolution_links(links):
+def load_file_diff(
+    loader: AllegroGraphRDFLoader,
+    file_path: str,
+    differ: RDFDiffLoader,
+    compute_evolution: bool = True,
+    uploader: Optional[BatchUploader] = None
+) -> Tuple[int, int, int]:
+    """
+    Reload a single Capital IQ file by sending only changed records
+
+    Evolution links are recomputed, but only links touching added, changed
+    or removed events are deleted and re-uploaded.
+
+    Returns:
+        (entity_count, event_count, link_count)
+    """
+    print(f"\n{'='*70}")
+    print(f"Diff loading: {os.path.basename(file_path)}")
+    print(f"{'='*70}")
+
+    if uploader is None:
+        uploader = loader.create_uploader()
+
+    data = load_event_data(file_path)
+    if is_delta_file(data, file_path):
+        return (0, 0, 0)
+    events = data.get('events', [])
+    entities = data.get('entities', [])
+
+    print(f"\n1. Diffing {len(events):,} events and {len(entities)} entities against the manifest...")
+    report = differ.sync(data, os.path.basename(file_path))
+
+    if report['failed_batches']:
+        print(f"   ⚠️  {report['failed_batches']} update batches failed (rerun to retry)")
+    else:
+        print(f"   ✅ Inserted {report['inserted']}, updated {report['updated']}, deleted {report['deleted']} records")
+
+    link_count = 0
+    event_ns = loader.ns['feekg']
+    changed = set(report['changed_subjects'])
+    # Removed events are only known by IRI; any changed subject that is not a current entity counts
+    entity_iris = {f"<{event_ns}{entity['entityId']}>" for entity in entities}
+    touched = sorted(iri for iri in changed if iri not in entity_iris)
+
+    if compute_evolution and touched and len(events) > 1:
+        print(f"\n2. Refreshing evolution links for {len(touched)} changed events...")
+        try:
+            if differ.delete_links_for(touched):
+                links = compute_all_evolution_links(events, entities, threshold=0.2)
+                touched_ids = {iri[len(event_ns) + 1:-1] for iri in touched}
+                links = [link for link in links if link['from'] in touched_ids or link['to'] in touched_ids]
+                print(f"   ✅ {len(links)} links touch changed events")
+                if links and loader.add_evolution_links(links, uploader=uploader):
                     link_count = len(links)
-                    final_count = loader.get_triple_count()
-                    print(f"   ✅ Uploaded {final_count - new_count:,} evolution triples")
         except Exception as e:
             print(f"   ⚠️  Evolution computation failed: {e}")
 
@@ -426,11 +884,25 @@ Examples:
 
   # Load without clearing
   python ingestion/load_capital_iq_to_allegrograph.py --no-clear
+
+  # Reload without downtime: only changed records are deleted/inserted
+  python ingestion/load_capital_iq_to_allegrograph.py --diff
+
+  # Compact evolution links (5 triples per link instead of ~11)
+  python ingestion/load_capital_iq_to_allegrograph.py --link-encoding compact
+
+  # One named graph per file and quarter; later reload just two quarters
+  python ingestion/load_capital_iq_to_allegrograph.py --partition quarter
+  python ingestion/load_capital_iq_to_allegrograph.py --partition quarter \\
+      --input lehman_v4_deduped.json --periods 2008-Q3,2008-Q4
+
+  # Resume an interrupted load (skips acknowledged batches)
+  python ingestion/load_capital_iq_to_allegrograph.py --no-clear --input lehman_v4_deduped.json
         """
     )
     parser.add_argument(
         '--input',
-        help='Specific JSON file to load (default: load all files in capital_iq_processed/)'
+        help='Specific JSON file or *.evstore to load (default: load all files in capital_iq_processed/)'
     )
     parser.add_argument(
         '--no-clear',
@@ -442,28 +914,108 @@ Examples:
         action='store_true',
         help='Skip evolution link computation (faster for testing)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Concurrent batch uploads (default: 4)'
+    )
+    parser.add_argument(
+        '--evolution-workers',
+        type=int,
+        help='Evolution scoring processes (default: CPU count, max 8; 0 = in-process)'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        help=f'Upload checkpoint file (default: {DEFAULT_CHECKPOINT_DIR}/<catalog>_<repo>.json)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['turtle', 'ntriples-gz'],
+        default='turtle',
+        help='Event upload format: Turtle batches of 500 events, or gzip N-Triples sized by bytes'
+    )
+    parser.add_argument(
+        '--batch-mb',
+        type=int,
+        default=8,
+        help='Uncompressed MB per batch for --format ntriples-gz (default: 8)'
+    )
+    parser.add_argument(
+        '--link-encoding',
+        choices=list(LINK_ENCODINGS),
+        default='reified',
+        help='Evolution link triples: reified blank nodes (~11 per link) or compact link IRIs (5 per link)'
+    )
+    parser.add_argument(
+        '--partition',
+        choices=list(PARTITION_SCHEMES),
+        help='Write each file into named graphs per year or quarter (default: the default graph)'
+    )
+    parser.add_argument(
+        '--periods',
+        help='With --partition: drop and reload only these comma-separated periods (e.g. 2008-Q3,2008-Q4)'
+    )
+    parser.add_argument(
+        '--diff',
+        action='store_true',
+        help='Send only added/changed/removed records instead of clearing and reloading'
+    )
+    parser.add_argument(
+        '--manifest',
+        help=f'Diff manifest of record hashes (default: {DEFAULT_MANIFEST_DIR}/<catalog>_<repo>.json)'
+    )
 
     args = parser.parse_args()
+    if args.periods and not args.partition:
+        parser.error('--periods requires --partition')
+    if args.diff and args.partition:
+        parser.error('--diff does not support --partition (reload partitions with --periods instead)')
+    periods = [period.strip() for period in args.periods.split(',')] if args.periods else None
 
     print("\n" + "=" * 70)
     print("  Capital IQ to AllegroGraph Loader")
     print("=" * 70)
 
+    # Event and link uploads run concurrently with --workers each on the shared session
+    configure(pool_size=max(int(os.getenv('SPARQL_POOL_SIZE', 10)), 2 * args.workers))
+
     # Initialize loader
-    loader = AllegroGraphRDFLoader()
+    loader = AllegroGraphRDFLoader(link_encoding=args.link_encoding)
 
     print(f"\nConfiguration:")
     print(f"  Repository: {loader.catalog}/{loader.repo}")
     print(f"  URL: {loader.repo_url}")
+    print(f"  Link encoding: {loader.link_encoding}")
 
     # Check connection
     initial_count = loader.get_triple_count()
     print(f"  Current triples: {initial_count:,}")
 
-    # Clear if requested
-    if not args.no_clear:
+    differ = RDFDiffLoader(loader, args.manifest or default_manifest_file(loader))
+
+    if args.diff:
+        # The manifest tracks what is loaded; re-sent link batches must not be skipped
+        uploader = loader.create_uploader(workers=args.workers)
+        print(f"  Diff mode: {sum(len(r) for r in differ.manifest['files'].values()):,} records in manifest")
+    elif periods:
+        # Dropped partitions are re-sent in full, whatever the checkpoint says
+        uploader = loader.create_uploader(workers=args.workers)
+        print(f"  Reloading partitions: {', '.join(periods)}")
+    else:
+        uploader = loader.create_uploader(
+            workers=args.workers,
+            checkpoint_file=args.checkpoint or loader.default_checkpoint_file()
+        )
+
+    # Clear if requested (acknowledged batches and manifest hashes no longer apply)
+    if not args.diff and not periods and not args.no_clear:
         print(f"\nClearing existing data...")
         loader.clear_repository()
+        uploader.reset_checkpoint()
+        differ.reset()
+    elif not args.diff and not periods and uploader.acknowledged:
+        print(f"  Resuming: {len(uploader.acknowledged)} batches already acknowledged")
 
     # Determine files to load
     if args.input:
@@ -479,9 +1031,12 @@ Examples:
 
         files_to_load = [file_path]
     else:
-        # All files in directory
-        pattern = "data/capital_iq_processed/*.json"
-        files_to_load = sorted(glob.glob(pattern))
+        # All files in directory (skipping incremental manifests written by older runs)
+        files_to_load = sorted(
+            path for path in
+            glob.glob("data/capital_iq_processed/*.json") + glob.glob("data/capital_iq_processed/*.evstore")
+            if not path.endswith('.manifest.json')
+        )
 
         if not files_to_load:
             print(f"\n❌ Error: No JSON files found in data/capital_iq_processed/")
@@ -497,15 +1052,38 @@ Examples:
     total_links = 0
 
     for file_path in files_to_load:
-        entity_count, event_count, link_count = load_file_to_allegrograph(
-            loader,
-            file_path,
-            compute_evolution=not args.no_evolution
-        )
+        if args.diff:
+            entity_count, event_count, link_count = load_file_diff(
+                loader,
+                file_path,
+                differ,
+                compute_evolution=not args.no_evolution,
+                uploader=uploader
+            )
+        else:
+            entity_count, event_count, link_count = load_file_to_allegrograph(
+                loader,
+                file_path,
+                compute_evolution=not args.no_evolution,
+                uploader=uploader,
+                compressed=args.format == 'ntriples-gz',
+                batch_bytes=args.batch_mb << 20,
+                evolution_workers=args.evolution_workers,
+                partitioner=GraphPartitioner.for_file(file_path, args.partition) if args.partition else None,
+                periods=periods
+            )
         total_entities += entity_count
         total_events += event_count
         total_links += link_count
 
+    # A completed load's checkpoint would make later --no-clear runs skip batches
+    if uploader.checkpoint_file:
+        if uploader.finish():
+            print(f"\n✅ Upload checkpoint cleared: {uploader.checkpoint_file}")
+        else:
+            print(f"\n⚠️  {uploader.failed_batches} batches failed; "
+                  f"rerun with --no-clear to resume ({uploader.checkpoint_file})")
+
     # Final summary
     final_count = loader.get_triple_count()
 
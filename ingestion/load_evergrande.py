@@ -5,15 +5,15 @@ Creates entities, events, risks, and their relationships.
 
 import sys
 import os
-import json
 from datetime import datetime
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from config.graph_backend import get_connection
+from ingestion.event_store import load_event_data
 
 
-def load_evergrande_data(json_path='data/evergrande_crisis.json'):
+def load_evergrande_data(json_path='data/evergrande_crisis.json', batch_size=1000):
     """Load Evergrande crisis data into graph database"""
 
     backend_type = os.getenv('GRAPH_BACKEND', 'neo4j')
@@ -27,8 +27,7 @@ def load_evergrande_data(json_path='data/evergrande_crisis.json'):
     # Load JSON data
     print("1️⃣  Loading JSON data...")
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        data = load_event_data(json_path)
 
         print(f"   ✅ Loaded {data['metadata']['events_count']} events")
         print(f"   ✅ Loaded {data['metadata']['entities_count']} entities")
@@ -48,7 +47,7 @@ def load_evergrande_data(json_path='data/evergrande_crisis.json'):
 
     # Ingest data (Neo4j specific for MVP)
     if backend_type.lower() == 'neo4j':
-        success = load_to_neo4j(backend, data)
+        success = load_to_neo4j(backend, data, batch_size)
     else:
         print("   ⚠️  AllegroGraph ingestion not yet implemented")
         success = False
@@ -60,121 +59,114 @@ def load_evergrande_data(json_path='data/evergrande_crisis.json'):
     return success
 
 
-def load_to_neo4j(backend, data):
-    """Load data into Neo4j using Cypher queries"""
+def load_to_neo4j(backend, data, batch_size=1000):
+    """Load data into Neo4j using batched (UNWIND) Cypher queries"""
 
     # Step 1: Load Entities
     print("\n3️⃣  Loading entities...")
+    entity_query = """
+    UNWIND $rows AS row
+    MERGE (e:Entity {entityId: row.entityId})
+    SET e.name = row.name,
+        e.type = row.type,
+        e.description = row.description,
+        e.createdAt = datetime()
+    """
     entity_count = 0
-    for entity in data['entities']:
-        query = """
-        MERGE (e:Entity {entityId: $entityId})
-        SET e.name = $name,
-            e.type = $type,
-            e.description = $description,
-            e.createdAt = datetime()
-        RETURN e.entityId as id
-        """
-        try:
-            result = backend.execute_query(query, entity)
-            entity_count += 1
-        except Exception as e:
-            print(f"   ⚠️  Failed to create entity {entity['entityId']}: {e}")
+    try:
+        entity_count = backend.write_batches(entity_query, data['entities'], batch_size)
+    except Exception as e:
+        print(f"   ⚠️  Failed to create entities: {e}")
 
     print(f"   ✅ Created {entity_count} entities")
 
     # Step 2: Load Events
     print("\n4️⃣  Loading events...")
+    event_query = """
+    UNWIND $rows AS row
+    MERGE (ev:Event {eventId: row.eventId})
+    SET ev.type = row.type,
+        ev.date = date(row.date),
+        ev.description = row.description,
+        ev.source = row.source,
+        ev.confidence = row.confidence,
+        ev.createdAt = datetime()
+    """
     event_count = 0
-    for event in data['events']:
-        query = """
-        MERGE (ev:Event {eventId: $eventId})
-        SET ev.type = $type,
-            ev.date = date($date),
-            ev.description = $description,
-            ev.source = $source,
-            ev.confidence = $confidence,
-            ev.createdAt = datetime()
-        """
-
-        # Add actor relationship
-        if event.get('actor'):
-            query += """
-            WITH ev
-            MATCH (actor:Entity {entityId: $actor})
-            MERGE (ev)-[:HAS_ACTOR]->(actor)
-            """
-
-        # Add target relationship
-        if event.get('target'):
-            query += """
-            WITH ev
-            MATCH (target:Entity {entityId: $target})
-            MERGE (ev)-[:HAS_TARGET]->(target)
-            """
-
-        query += " RETURN ev.eventId as id"
-
+    try:
+        event_count = backend.write_batches(event_query, data['events'], batch_size)
+    except Exception as e:
+        print(f"   ⚠️  Failed to create events: {e}")
+
+    # Add actor and target relationships
+    role_query = """
+    UNWIND $rows AS row
+    MATCH (ev:Event {eventId: row.eventId})
+    MATCH (entity:Entity {entityId: row.entityId})
+    MERGE (ev)-[:%s]->(entity)
+    """
+    for role, relationship in (('actor', 'HAS_ACTOR'), ('target', 'HAS_TARGET')):
         try:
-            result = backend.execute_query(query, event)
-            event_count += 1
+            backend.write_batches(role_query % relationship, (
+                {'eventId': event['eventId'], 'entityId': event[role]}
+                for event in data['events'] if event.get(role)
+            ), batch_size)
         except Exception as e:
-            print(f"   ⚠️  Failed to create event {event['eventId']}: {e}")
+            print(f"   ⚠️  Failed to create {relationship} relationships: {e}")
 
     print(f"   ✅ Created {event_count} events")
 
     # Step 3: Load Risks
     print("\n5️⃣  Loading risks...")
+    risk_query = """
+    UNWIND $rows AS row
+    MERGE (r:Risk {riskId: row.riskId})
+    SET r.score = row.initialScore,
+        r.severity = row.severity,
+        r.probability = row.probability,
+        r.status = row.status,
+        r.detectedDate = date(row.detectedDate),
+        r.description = row.description,
+        r.createdAt = datetime()
+    WITH r, row
+    MATCH (rt:RiskType {name: row.riskType})
+    MERGE (r)-[:HAS_RISK_TYPE]->(rt)
+    WITH r, row
+    MATCH (e:Entity {entityId: row.targetEntity})
+    MERGE (r)-[:TARGETS_ENTITY]->(e)
+    WITH r, row
+    MATCH (ev:Event {eventId: row.triggeredBy})
+    MERGE (ev)-[:INCREASES_RISK_OF]->(r)
+    """
     risk_count = 0
-    for risk in data['risks']:
-        query = """
-        MERGE (r:Risk {riskId: $riskId})
-        SET r.score = $initialScore,
-            r.severity = $severity,
-            r.probability = $probability,
-            r.status = $status,
-            r.detectedDate = date($detectedDate),
-            r.description = $description,
-            r.createdAt = datetime()
-        WITH r
-        MATCH (rt:RiskType {name: $riskType})
-        MERGE (r)-[:HAS_RISK_TYPE]->(rt)
-        WITH r
-        MATCH (e:Entity {entityId: $targetEntity})
-        MERGE (r)-[:TARGETS_ENTITY]->(e)
-        WITH r
-        MATCH (ev:Event {eventId: $triggeredBy})
-        MERGE (ev)-[:INCREASES_RISK_OF]->(r)
-        RETURN r.riskId as id
+    try:
+        risk_count = backend.write_batches(risk_query, data['risks'], batch_size)
+
+        # Create initial risk snapshots
+        snapshot_query = """
+        UNWIND $rows AS row
+        MATCH (r:Risk {riskId: row.riskId})
+        CREATE (rs:RiskSnapshot {
+            snapshotId: row.snapshotId,
+            time: datetime(row.time),
+            score: row.score,
+            severity: row.severity
+        })
+        MERGE (rs)-[:SNAP_OF]->(r)
         """
-
-        try:
-            result = backend.execute_query(query, risk)
-            risk_count += 1
-
-            # Create initial risk snapshot
-            snapshot_query = """
-            MATCH (r:Risk {riskId: $riskId})
-            CREATE (rs:RiskSnapshot {
-                snapshotId: $snapshotId,
-                time: datetime($time),
-                score: $score,
-                severity: $severity
-            })
-            MERGE (rs)-[:SNAP_OF]->(r)
-            """
-
-            snapshot_data = {
+        backend.write_batches(snapshot_query, (
+            {
                 'riskId': risk['riskId'],
                 'snapshotId': f"{risk['riskId']}_snap_001",
                 'time': f"{risk['detectedDate']}T00:00:00Z",
                 'score': risk['initialScore'],
                 'severity': risk['severity']
             }
-            backend.execute_query(snapshot_query, snapshot_data)
+            for risk in data['risks']
+        ), batch_size)
 
-        except Exception as e:
-            print(f"   ⚠️  Failed to create risk {risk['riskId']}: {e}")
+    except Exception as e:
+        print(f"   ⚠️  Failed to create risks: {e}")
 
     print(f"   ✅ Created {risk_count} risks with snapshots")
 
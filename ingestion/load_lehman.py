@@ -7,11 +7,11 @@ Loads processed Capital IQ data and runs event evolution analysis.
 Usage:
     python ingestion/load_lehman.py
     python ingestion/load_lehman.py --input data/capital_iq_processed/lehman_case_study.json
+    python ingestion/load_lehman.py --batch-size 5000
 """
 
 import os
 import sys
-import json
 import argparse
 from datetime import datetime
 
@@ -20,14 +20,17 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.graph_backend import get_connection
 from evolution.methods import compute_all_evolution_links
+from ingestion.event_store import load_event_data
 
 
-def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_case_study.json'):
+def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_case_study.json',
+                           batch_size: int = 1000):
     """
     Load Lehman Brothers case study into Neo4j and run evolution analysis
 
     Args:
         input_file: Path to processed JSON file
+        batch_size: Rows per UNWIND write (one transaction each)
     """
 
     print("\n" + "=" * 70)
@@ -45,8 +48,7 @@ def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_c
 
     # Load JSON data
     print(f"\n1. Loading data from: {input_file}")
-    with open(input_file, 'r') as f:
-        data = json.load(f)
+    data = load_event_data(input_file)
 
     print(f"   ✅ Loaded {data['metadata']['events_count']} events")
     print(f"   ✅ Loaded {data['metadata']['entities_count']} entities")
@@ -69,50 +71,47 @@ def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_c
 
     # Load entities
     print(f"\n4. Loading {len(data['entities'])} entities...")
+    entity_query = """
+    UNWIND $rows AS row
+    MERGE (e:Entity {entityId: row.entityId})
+    SET e.name = row.name,
+        e.type = row.type,
+        e.createdAt = datetime()
+    """
     entity_count = 0
-    for entity in data['entities']:
-        query = """
-        MERGE (e:Entity {entityId: $entityId})
-        SET e.name = $name,
-            e.type = $type,
-            e.createdAt = datetime()
-        RETURN e.entityId as id
-        """
-        try:
-            result = backend.execute_query(query, {
+    try:
+        entity_count = backend.write_batches(entity_query, (
+            {
                 'entityId': entity['entityId'],
                 'name': entity['name'],
                 'type': entity['type']
-            })
-            entity_count += 1
-        except Exception as e:
-            print(f"   ⚠️  Failed to create entity {entity['entityId']}: {e}")
+            }
+            for entity in data['entities']
+        ), batch_size)
+    except Exception as e:
+        print(f"   ⚠️  Failed to create entities: {e}")
 
     print(f"   ✅ Loaded {entity_count} entities")
 
     # Load events
     print(f"\n5. Loading {len(data['events'])} events...")
+    event_query = """
+    UNWIND $rows AS row
+    MERGE (ev:Event {eventId: row.eventId})
+    SET ev.type = row.type,
+        ev.date = date(row.date),
+        ev.headline = row.headline,
+        ev.description = row.description,
+        ev.source = row.source,
+        ev.actor = row.actor,
+        ev.severity = row.severity,
+        ev.sentiment = row.sentiment,
+        ev.createdAt = datetime()
+    """
     event_count = 0
-
-    # Build entity name to ID map for faster lookup
-    entity_map = {e['name']: e['entityId'] for e in data['entities']}
-
-    for event in data['events']:
-        query = """
-        MERGE (ev:Event {eventId: $eventId})
-        SET ev.type = $type,
-            ev.date = date($date),
-            ev.headline = $headline,
-            ev.description = $description,
-            ev.source = $source,
-            ev.actor = $actor,
-            ev.severity = $severity,
-            ev.sentiment = $sentiment,
-            ev.createdAt = datetime()
-        RETURN ev.eventId as id
-        """
-        try:
-            result = backend.execute_query(query, {
+    try:
+        event_count = backend.write_batches(event_query, (
+            {
                 'eventId': event['eventId'],
                 'type': event['type'],
                 'date': event['date'],
@@ -122,26 +121,29 @@ def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_c
                 'actor': event.get('actor', 'unknown'),
                 'severity': event.get('severity', 'low'),  # Store severity from v2
                 'sentiment': 0.0
-            })
-            event_count += 1
-
-            # Link event to entities (optimized with entity_map)
-            for entity_name in event['entities']:
-                # Use entity_map for O(1) lookup instead of O(n) search
-                entity_id = entity_map.get(entity_name)
-                if entity_id:
-                    link_query = """
-                    MATCH (e:Entity {entityId: $entityId})
-                    MATCH (ev:Event {eventId: $eventId})
-                    MERGE (e)-[:INVOLVES]->(ev)
-                    """
-                    backend.execute_query(link_query, {
-                        'entityId': entity_id,
-                        'eventId': event['eventId']
-                    })
+            }
+            for event in data['events']
+        ), batch_size)
+    except Exception as e:
+        print(f"   ⚠️  Failed to create events: {e}")
 
-        except Exception as e:
-            print(f"   ⚠️  Failed to create event {event['eventId']}: {e}")
+    # Link events to entities (entity_map for O(1) name lookup)
+    entity_map = {e['name']: e['entityId'] for e in data['entities']}
+    involves_query = """
+    UNWIND $rows AS row
+    MATCH (e:Entity {entityId: row.entityId})
+    MATCH (ev:Event {eventId: row.eventId})
+    MERGE (e)-[:INVOLVES]->(ev)
+    """
+    try:
+        backend.write_batches(involves_query, (
+            {'entityId': entity_map[entity_name], 'eventId': event['eventId']}
+            for event in data['events']
+            for entity_name in event['entities']
+            if entity_name in entity_map
+        ), batch_size)
+    except Exception as e:
+        print(f"   ⚠️  Failed to link events to entities: {e}")
 
     print(f"   ✅ Loaded {event_count} events")
 
@@ -169,23 +171,24 @@ def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_c
     # Store evolution links in Neo4j
     if links:
         print(f"\n   Storing evolution links in Neo4j...")
+        link_query = """
+        UNWIND $rows AS row
+        MATCH (from:Event {eventId: row.from})
+        MATCH (to:Event {eventId: row.to})
+        MERGE (from)-[r:EVOLVES_TO]->(to)
+        SET r.score = row.score,
+            r.method = row.method,
+            r.temporal = row.temporal,
+            r.entity = row.entity,
+            r.semantic = row.semantic,
+            r.topic = row.topic,
+            r.causality = row.causality,
+            r.emotional = row.emotional
+        """
         link_count = 0
-        for link in links:
-            query = """
-            MATCH (from:Event {eventId: $from})
-            MATCH (to:Event {eventId: $to})
-            MERGE (from)-[r:EVOLVES_TO]->(to)
-            SET r.score = $score,
-                r.method = $method,
-                r.temporal = $temporal,
-                r.entity = $entity,
-                r.semantic = $semantic,
-                r.topic = $topic,
-                r.causality = $causality,
-                r.emotional = $emotional
-            """
-            try:
-                backend.execute_query(query, {
+        try:
+            link_count = backend.write_batches(link_query, (
+                {
                     'from': link['from'],
                     'to': link['to'],
                     'score': link['score'],
@@ -196,10 +199,11 @@ def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_c
                     'topic': link['components'].get('topic', 0.0),
                     'causality': link['components'].get('causality', 0.0),
                     'emotional': link['components'].get('emotional', 0.0)
-                })
-                link_count += 1
-            except Exception as e:
-                print(f"   ⚠️  Failed to store link: {e}")
+                }
+                for link in links
+            ), batch_size)
+        except Exception as e:
+            print(f"   ⚠️  Failed to store links: {e}")
 
         print(f"   ✅ Stored {link_count} evolution links")
 
@@ -296,14 +300,13 @@ def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_c
         'low': -0.30       # Reduce likelihood by 30%
     }
 
-    risk_count = 0
+    risk_rows = []
     for event_data in data['events']:
         event_type = event_data['type']
         event_severity = event_data.get('severity', 'low')
 
         # Only create risks for events with defined risk mappings
         if event_type in event_risk_mapping:
-            risk_id = f"risk_{event_data['eventId']}"
             risk_config = event_risk_mapping[event_type]
 
             # Use event severity from v2, fallback to mapping base severity
@@ -312,37 +315,33 @@ def load_lehman_case_study(input_file: str = 'data/capital_iq_processed/lehman_c
             # Adjust likelihood based on actual event severity
             likelihood = max(0.1, min(1.0, risk_config['base_likelihood'] + severity_adjustment.get(severity, 0)))
 
-            query = """
-            MERGE (r:Risk {riskId: $riskId})
-            SET r.riskType = $riskType,
-                r.severity = $severity,
-                r.likelihood = $likelihood,
-                r.description = $description,
-                r.createdAt = datetime()
-            RETURN r.riskId as id
-            """
-            try:
-                backend.execute_query(query, {
-                    'riskId': risk_id,
-                    'riskType': risk_config['risk_type'],
-                    'severity': severity,
-                    'likelihood': likelihood,
-                    'description': f"{risk_config['description']}: {event_data['headline'][:100]}"
-                })
-
-                # Link risk to event
-                link_query = """
-                MATCH (ev:Event {eventId: $eventId})
-                MATCH (r:Risk {riskId: $riskId})
-                MERGE (ev)-[:TRIGGERS]->(r)
-                """
-                backend.execute_query(link_query, {
-                    'eventId': event_data['eventId'],
-                    'riskId': risk_id
-                })
-                risk_count += 1
-            except Exception as e:
-                print(f"   ⚠️  Failed to create risk: {e}")
+            risk_rows.append({
+                'riskId': f"risk_{event_data['eventId']}",
+                'eventId': event_data['eventId'],
+                'riskType': risk_config['risk_type'],
+                'severity': severity,
+                'likelihood': likelihood,
+                'description': f"{risk_config['description']}: {event_data['headline'][:100]}"
+            })
+
+    # Create risks and link each to its triggering event
+    risk_query = """
+    UNWIND $rows AS row
+    MERGE (r:Risk {riskId: row.riskId})
+    SET r.riskType = row.riskType,
+        r.severity = row.severity,
+        r.likelihood = row.likelihood,
+        r.description = row.description,
+        r.createdAt = datetime()
+    WITH r, row
+    MATCH (ev:Event {eventId: row.eventId})
+    MERGE (ev)-[:TRIGGERS]->(r)
+    """
+    risk_count = 0
+    try:
+        risk_count = backend.write_batches(risk_query, risk_rows, batch_size)
+    except Exception as e:
+        print(f"   ⚠️  Failed to create risks: {e}")
 
     print(f"   ✅ Created {risk_count} risk nodes")
 
@@ -390,10 +389,12 @@ def main():
     parser.add_argument('--input',
                        default='data/capital_iq_processed/lehman_case_study.json',
                        help='Input JSON file (default: lehman_case_study.json)')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                       help='Rows per batched Cypher write (default: 1000)')
 
     args = parser.parse_args()
 
-    load_lehman_case_study(args.input)
+    load_lehman_case_study(args.input, batch_size=args.batch_size)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Bounded Producer/Consumer Stages for the Loaders
+
+prefetch() runs a generator (e.g. Turtle conversion) in a background thread
+and hands its items over through a bounded queue, so the producer works
+ahead of its consumer (e.g. BatchUploader.upload) by at most `maxsize`
+items instead of strictly alternating with it. StageTimer records how long
+each stage was busy, which shows whether the pipeline is bound by its
+slowest stage.
+
+Usage:
+    from ingestion.pipeline import prefetch, StageTimer
+
+    timer = StageTimer()
+    batches = prefetch(timer.timed('convert', loader.iter_turtle_batches(data)), maxsize=8)
+    report = uploader.upload(batches)
+    print(timer.summary())
+"""
+
+import time
+import queue
+import threading
+from typing import Dict, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(iterable: Iterable[T], maxsize: int = 8, name: str = 'prefetch') -> Iterator[T]:
+    """
+    Iterate `iterable` in a background thread, at most `maxsize` items ahead
+
+    Exceptions from the producer are re-raised in the consumer. If the
+    consumer stops early (or is garbage collected), the producer thread is
+    told to stop at its next item.
+    """
+    items: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_Failure(e))
+
+    thread = threading.Thread(target=produce, name=name, daemon=True)
+    thread.start()
+
+    def consume():
+        try:
+            while True:
+                item = items.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+    return consume()
+
+
+class StageTimer:
+    """Wall-clock busy time per pipeline stage"""
+
+    def __init__(self):
+        self.busy: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        with self.lock:
+            self.busy[stage] = self.busy.get(stage, 0.0) + seconds
+
+    def timed(self, stage: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from `iterable`, charging the time spent producing each item to `stage`"""
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(stage, time.perf_counter() - start)
+                return
+            self.add(stage, time.perf_counter() - start)
+            yield item
+
+    def summary(self) -> str:
+        return ', '.join(f"{stage} {seconds:.1f}s" for stage, seconds in self.busy.items())
@@ -10,14 +10,45 @@ Improvements over v1:
 """
 
 import pandas as pd
+import numpy as np
 import json
 import os
 import sys
 import argparse
 import re
 from datetime import datetime
-from typing import List, Dict, Set, Optional
-from collections import defaultdict
+from typing import List, Dict, Set, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ingestion.entity_matcher import EntityMatcher
+from ingestion.capital_iq_cache import detect_encoding, load_capital_iq
+
+
+def filter_crisis_chunk(
+    chunk: pd.DataFrame,
+    entity_pattern: str,
+    keyword_pattern: str,
+    period: Tuple[str, str]
+) -> pd.DataFrame:
+    """
+    Normalize a raw Capital IQ chunk and keep crisis-relevant rows
+
+    Module-level so it can run in worker processes.
+    """
+    # Normalize column names
+    chunk.columns = chunk.columns.str.lower().str.strip()
+
+    # Convert date column
+    chunk['announcedate'] = pd.to_datetime(chunk['announcedate'], errors='coerce')
+
+    in_period = (chunk['announcedate'] >= period[0]) & (chunk['announcedate'] <= period[1])
+    chunk = chunk[in_period]
+
+    entity_mask = chunk['headline'].str.contains(entity_pattern, case=False, na=False)
+    keyword_mask = chunk['headline'].str.contains(keyword_pattern, case=False, na=False)
+    return chunk[entity_mask | keyword_mask]
 
 
 class CapitalIQProcessorV2:
@@ -70,11 +101,71 @@ class CapitalIQProcessorV2:
         'management_change': ['ceo', 'chief executive', 'resignation', 'appointed', 'steps down']
     }
 
-    def __init__(self, input_file: str):
+    # Capital IQ event type fallback (checked in order, substring match)
+    CAPITAL_IQ_TYPE_RULES = [
+        # M&A related
+        ('merger_acquisition', ['m&a', 'acquisition', 'merger', 'closing', 'rumor', 'divestiture', 'spin-off']),
+        # Earnings & financial performance
+        ('earnings_announcement', ['earnings', 'guidance', 'sales', 'trading statement', 'results']),
+        # Management & board changes
+        ('management_change', ['executive', 'board', 'director', 'officer', 'management']),
+        # Capital raising & financing
+        ('capital_raising', ['fixed income', 'debt financing', 'private placement', 'offering', 'ipo', 'follow-on']),
+        # Buybacks & stock movements
+        ('stock_movement', ['buyback', 'repurchase', 'dividend', 'split', 'stock']),
+        # Credit events
+        ('credit_downgrade', ['credit', 'rating', 'default', 'covenant']),
+        # Restructuring & downsizing
+        ('restructuring', ['restructur', 'downsi', 'discontin', 'reorgan', 'layoff']),
+        # Bankruptcy & insolvency
+        ('bankruptcy', ['bankruptcy', 'insolvency', 'liquidation', 'administration', 'receivership']),
+        # Strategic actions
+        ('strategic_partnership', ['strategic alliance', 'joint venture', 'partnership']),
+        # Legal & regulatory
+        ('legal_issue', ['lawsuit', 'legal', 'litigation', 'settlement', 'regulatory']),
+        # Business operations (less crisis-relevant, but classify them)
+        ('business_operations', ['expansion', 'client', 'product', 'contract', 'facility']),
+    ]
+
+    # Severity inference (event types that are always critical, then headline keywords in order)
+    CRITICAL_EVENT_TYPES = ['bankruptcy', 'government_intervention']
+    SEVERITY_KEYWORDS = [
+        ('critical', ['bankruptcy', 'collapse', 'bailout', 'emergency', 'rescue']),
+        ('high', ['downgrade', 'loss', 'writedown', 'default']),
+        ('medium', ['acquisition', 'merger', 'restructuring']),
+    ]
+
+    # Lehman crisis window (inclusive)
+    CRISIS_PERIOD = ('2007-01-01', '2009-12-31')
+
+    def __init__(
+        self,
+        input_file: str,
+        chunksize: Optional[int] = None,
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            input_file: Capital IQ CSV/Excel export
+            chunksize: Stream the CSV in chunks of this many rows, keeping only
+                crisis-relevant rows (peak memory bounded by chunk size)
+            workers: Processes filtering chunks in parallel (default: CPU count)
+            cache_dir: Load through the typed Parquet cache in this directory
+                (built on first use, keyed by the file's content hash)
+        """
         self.input_file = input_file
+        self.chunksize = chunksize
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_dir = cache_dir
         self.df = None
         self.entities = {}  # entity_name -> entity_type
-        self.load_data()
+        if cache_dir:
+            self.load_data_cached()
+        elif chunksize:
+            self.load_data_streaming()
+        else:
+            self.load_data()
 
     def load_data(self):
         """Load and prepare Capital IQ data"""
@@ -104,6 +195,62 @@ class CapitalIQProcessorV2:
 
         print(f"   ✅ Date range: {self.df['announcedate'].min()} to {self.df['announcedate'].max()}")
 
+    def load_data_cached(self):
+        """Load typed, column-pruned data from the columnar cache"""
+        print(f"\n📥 Loading data from: {self.input_file} (cache: {self.cache_dir})")
+
+        self.df = load_capital_iq(self.input_file, cache_dir=self.cache_dir)
+
+        print(f"   ✅ Loaded {len(self.df):,} raw events")
+        print(f"   ✅ Date range: {self.df['announcedate'].min()} to {self.df['announcedate'].max()}")
+
+    def crisis_filter_patterns(self) -> Tuple[str, str]:
+        """Headline regexes for crisis entity mentions and crisis keywords"""
+        return '|'.join(self.CRISIS_ENTITIES.keys()), '|'.join(self.CRISIS_KEYWORDS)
+
+    def load_data_streaming(self):
+        """
+        Stream a Capital IQ CSV in chunks, keeping only crisis-relevant rows
+
+        The encoding is detected once, chunks are filtered (date, entity,
+        keyword) across a process pool with a bounded number in flight, and
+        only the filtered rows are kept. Row labels still count CSV rows.
+        """
+        print(f"\n📥 Streaming data from: {self.input_file} ({self.chunksize:,} rows/chunk, {self.workers} workers)")
+
+        if not self.input_file.endswith('.csv'):
+            raise ValueError("Streaming mode requires a .csv file")
+
+        encoding = detect_encoding(self.input_file)
+        print(f"   ✅ Encoding: {encoding}")
+
+        entity_pattern, keyword_pattern = self.crisis_filter_patterns()
+        reader = pd.read_csv(self.input_file, encoding=encoding, on_bad_lines='skip', chunksize=self.chunksize)
+
+        total_rows = 0
+        parts = []
+        pending = deque()
+        max_pending = self.workers * 2
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for chunk in reader:
+                total_rows += len(chunk)
+                pending.append(pool.submit(filter_crisis_chunk, chunk, entity_pattern, keyword_pattern, self.CRISIS_PERIOD))
+                if len(pending) >= max_pending:
+                    parts.append(pending.popleft().result())
+            while pending:
+                parts.append(pending.popleft().result())
+
+        if not parts:
+            # No data rows: normalize the bare header so the frame has the
+            # CSV's columns and a datetime64 'announcedate', as real chunks do
+            header = pd.read_csv(self.input_file, encoding=encoding, nrows=0)
+            parts.append(filter_crisis_chunk(header, entity_pattern, keyword_pattern, self.CRISIS_PERIOD))
+        self.df = pd.concat(parts)
+
+        print(f"   ✅ Scanned {total_rows:,} raw events, kept {len(self.df):,} crisis-relevant")
+        print(f"   ✅ Date range: {self.df['announcedate'].min()} to {self.df['announcedate'].max()}")
+
     def extract_lehman_crisis_events(self) -> pd.DataFrame:
         """
         Extract Lehman Brothers crisis events using:
@@ -115,13 +262,13 @@ class CapitalIQProcessorV2:
         print(f"\n🎯 Extracting Lehman crisis events...")
 
         # Step 1: Filter by date range
-        crisis_period = (self.df['announcedate'] >= '2007-01-01') & (self.df['announcedate'] <= '2009-12-31')
+        start, end = self.CRISIS_PERIOD
+        crisis_period = (self.df['announcedate'] >= start) & (self.df['announcedate'] <= end)
         filtered = self.df[crisis_period].copy()
         print(f"   ✅ Date filter (2007-2009): {len(filtered):,} events")
 
         # Step 2: Filter by entity mentions OR crisis keywords
-        entity_pattern = '|'.join(self.CRISIS_ENTITIES.keys())
-        keyword_pattern = '|'.join(self.CRISIS_KEYWORDS)
+        entity_pattern, keyword_pattern = self.crisis_filter_patterns()
 
         entity_mask = filtered['headline'].str.contains(entity_pattern, case=False, na=False)
         keyword_mask = filtered['headline'].str.contains(keyword_pattern, case=False, na=False)
@@ -141,32 +288,29 @@ class CapitalIQProcessorV2:
 
         return crisis_relevant
 
+    def build_entity_matcher(self) -> EntityMatcher:
+        """Compile CRISIS_ENTITIES into a single-pass matcher"""
+        return EntityMatcher(self.CRISIS_ENTITIES.keys())
+
+    @property
+    def entity_matcher(self) -> EntityMatcher:
+        """Matcher for the current CRISIS_ENTITIES (rebuilt if the mapping is replaced)"""
+        cached = self.__dict__.get('_entity_matcher')
+        if cached is None or cached[0] is not self.CRISIS_ENTITIES:
+            cached = (self.CRISIS_ENTITIES, self.build_entity_matcher())
+            self._entity_matcher = cached
+        return cached[1]
+
     def extract_entities_from_text(self, text: str) -> Set[str]:
         """Extract financial entities from text using pattern matching"""
         if pd.isna(text):
             return set()
 
-        entities = set()
-        text_lower = text.lower()
-
-        # Ambiguous short names that need special handling
-        ambiguous_names = {
-            'SEC': r'\bsec\b(?!ond|urity|tor|ure)',  # Match SEC but not second, security, sector, secure
-            'Fed': r'\bfed\b(?!eral)',                # Match Fed but not federal
-        }
-
-        for entity_name in self.CRISIS_ENTITIES.keys():
-            # Special handling for ambiguous short names
-            if entity_name in ambiguous_names:
-                pattern = ambiguous_names[entity_name]
-                if re.search(pattern, text_lower):
-                    entities.add(entity_name)
-            else:
-                # Standard case-insensitive matching with word boundaries
-                if re.search(r'\b' + re.escape(entity_name.lower()) + r'\b', text_lower):
-                    entities.add(entity_name)
+        return self.entity_matcher.find(text)
 
-        return entities
+    def extract_entities_from_series(self, texts: pd.Series) -> pd.Series:
+        """Extract entities for a whole headline column (Series of sets)"""
+        return self.entity_matcher.find_series(texts)
 
     def classify_event_type(self, headline: str, capital_iq_type: str) -> str:
         """Classify event type using headline analysis + Capital IQ type"""
@@ -185,71 +329,74 @@ class CapitalIQProcessorV2:
         if pd.notna(capital_iq_type):
             capital_iq_lower = capital_iq_type.lower()
 
-            # M&A related
-            if any(term in capital_iq_lower for term in ['m&a', 'acquisition', 'merger', 'closing', 'rumor', 'divestiture', 'spin-off']):
-                return 'merger_acquisition'
-
-            # Earnings & financial performance
-            elif any(term in capital_iq_lower for term in ['earnings', 'guidance', 'sales', 'trading statement', 'results']):
-                return 'earnings_announcement'
-
-            # Management & board changes
-            elif any(term in capital_iq_lower for term in ['executive', 'board', 'director', 'officer', 'management']):
-                return 'management_change'
-
-            # Capital raising & financing
-            elif any(term in capital_iq_lower for term in ['fixed income', 'debt financing', 'private placement', 'offering', 'ipo', 'follow-on']):
-                return 'capital_raising'
-
-            # Buybacks & stock movements
-            elif any(term in capital_iq_lower for term in ['buyback', 'repurchase', 'dividend', 'split', 'stock']):
-                return 'stock_movement'
-
-            # Credit events
-            elif any(term in capital_iq_lower for term in ['credit', 'rating', 'default', 'covenant']):
-                return 'credit_downgrade'
-
-            # Restructuring & downsizing
-            elif any(term in capital_iq_lower for term in ['restructur', 'downsi', 'discontin', 'reorgan', 'layoff']):
-                return 'restructuring'
-
-            # Bankruptcy & insolvency
-            elif any(term in capital_iq_lower for term in ['bankruptcy', 'insolvency', 'liquidation', 'administration', 'receivership']):
-                return 'bankruptcy'
-
-            # Strategic actions
-            elif any(term in capital_iq_lower for term in ['strategic alliance', 'joint venture', 'partnership']):
-                return 'strategic_partnership'
-
-            # Legal & regulatory
-            elif any(term in capital_iq_lower for term in ['lawsuit', 'legal', 'litigation', 'settlement', 'regulatory']):
-                return 'legal_issue'
-
-            # Business operations (less crisis-relevant, but classify them)
-            elif any(term in capital_iq_lower for term in ['expansion', 'client', 'product', 'contract', 'facility']):
-                return 'business_operations'
+            for event_type, terms in self.CAPITAL_IQ_TYPE_RULES:
+                if any(term in capital_iq_lower for term in terms):
+                    return event_type
 
         return 'unknown'
 
     def infer_event_severity(self, event_type: str, headline: str) -> str:
         """Infer event severity from type and headline keywords"""
-        if event_type in ['bankruptcy', 'government_intervention']:
+        if event_type in self.CRITICAL_EVENT_TYPES:
             return 'critical'
 
         headline_lower = headline.lower() if not pd.isna(headline) else ''
 
-        critical_keywords = ['bankruptcy', 'collapse', 'bailout', 'emergency', 'rescue']
-        high_keywords = ['downgrade', 'loss', 'writedown', 'default']
-        medium_keywords = ['acquisition', 'merger', 'restructuring']
+        for severity, keywords in self.SEVERITY_KEYWORDS:
+            if any(kw in headline_lower for kw in keywords):
+                return severity
 
-        if any(kw in headline_lower for kw in critical_keywords):
-            return 'critical'
-        elif any(kw in headline_lower for kw in high_keywords):
-            return 'high'
-        elif any(kw in headline_lower for kw in medium_keywords):
-            return 'medium'
-        else:
-            return 'low'
+        return 'low'
+
+    # ------------------------------------------------------------------
+    # Column-wise equivalents (whole DataFrame columns at once)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _lower(texts: pd.Series) -> pd.Series:
+        """Lowercase a text column (missing/non-string values become NaN)"""
+        return texts.astype(object).str.lower()
+
+    @staticmethod
+    def _select_rules(texts_lower: pd.Series, rules: List, default: str) -> np.ndarray:
+        """
+        First matching label per row for ordered (label, substrings) rules
+
+        Vectorized equivalent of:
+            for label, terms in rules:
+                if any(term in text for term in terms): return label
+        """
+        # Evaluate each distinct value once (Capital IQ types repeat heavily);
+        # missing values get code -1, i.e. the trailing default
+        codes, uniques = pd.factorize(texts_lower)
+        uniques = pd.Series(uniques, dtype=object)
+
+        conditions = [
+            uniques.str.contains('|'.join(re.escape(term) for term in terms), regex=True, na=False).to_numpy(dtype=bool)
+            for _, terms in rules
+        ]
+        labels = np.select(conditions, [label for label, _ in rules], default=default).astype(object)
+        return np.append(labels, default)[codes]
+
+    def classify_event_type_series(self, headlines: pd.Series, capital_iq_types: pd.Series) -> pd.Series:
+        """Column-wise classify_event_type()"""
+        pattern_type = self._select_rules(self._lower(headlines), list(self.EVENT_PATTERNS.items()), 'unknown')
+        type_fallback = self._select_rules(self._lower(capital_iq_types), self.CAPITAL_IQ_TYPE_RULES, 'unknown')
+
+        event_types = np.select(
+            [headlines.isna().to_numpy(), pattern_type != 'unknown'],
+            ['unknown', pattern_type],
+            default=type_fallback
+        )
+        return pd.Series(event_types, index=headlines.index, dtype=object)
+
+    def infer_event_severity_series(self, event_types: pd.Series, headlines: pd.Series) -> pd.Series:
+        """Column-wise infer_event_severity()"""
+        keyword_severity = self._select_rules(self._lower(headlines), self.SEVERITY_KEYWORDS, 'low')
+        critical_type = np.isin(np.asarray(event_types, dtype=object), self.CRITICAL_EVENT_TYPES)
+
+        severity = np.where(critical_type, 'critical', keyword_severity)
+        return pd.Series(severity, index=headlines.index, dtype=object)
 
     def convert_to_feekg_format(self, df: pd.DataFrame, output_file: str):
         """Convert DataFrame to FE-EKG JSON format with entity extraction"""
@@ -341,6 +488,12 @@ def main():
     parser.add_argument('--input', required=True, help='Input CSV/Excel file')
     parser.add_argument('--output', default='data/capital_iq_processed/lehman_case_study_v2.json',
                        help='Output JSON file')
+    parser.add_argument('--chunksize', type=int,
+                       help='Stream the CSV in chunks of this many rows (bounded memory)')
+    parser.add_argument('--workers', type=int,
+                       help='Processes for chunk filtering (default: CPU count)')
+    parser.add_argument('--cache-dir',
+                       help='Load through the typed Parquet cache in this directory (e.g. data/capital_iq_cache)')
 
     args = parser.parse_args()
 
@@ -354,7 +507,7 @@ def main():
         sys.exit(1)
 
     # Process data
-    processor = CapitalIQProcessorV2(args.input)
+    processor = CapitalIQProcessorV2(args.input, chunksize=args.chunksize, workers=args.workers, cache_dir=args.cache_dir)
 
     # Extract crisis events
     crisis_events = processor.extract_lehman_crisis_events()
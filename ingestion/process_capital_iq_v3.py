@@ -15,9 +15,10 @@ Usage:
 """
 
 import pandas as pd
-import json
+import numpy as np
 import os
 import sys
+import gc
 import argparse
 from datetime import datetime
 from typing import List, Dict, Set, Optional, Tuple
@@ -25,6 +26,7 @@ from collections import defaultdict
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from ingestion.process_capital_iq_v2 import CapitalIQProcessorV2
+from ingestion.event_store import save_event_data
 
 
 class CapitalIQProcessorV3(CapitalIQProcessorV2):
@@ -105,9 +107,35 @@ class CapitalIQProcessorV3(CapitalIQProcessorV2):
         'Lawsuits & Legal Issues': ('legal_issue', 0.95)
     }
 
-    def __init__(self, input_file: str):
-        super().__init__(input_file)
+    def __init__(
+        self,
+        input_file: str,
+        chunksize: Optional[int] = None,
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None
+    ):
+        super().__init__(input_file, chunksize=chunksize, workers=workers, cache_dir=cache_dir)
         self.row_index_map = {}  # event_id -> CSV row number
+        self.event_classifier = None  # Optional EventTypeClassifier (replaces rule cascade)
+
+    def load_event_classifier(self, model_path: str):
+        """Classify with a trained EventTypeClassifier instead of the rule cascade"""
+        from ingestion.event_classifier import EventTypeClassifier
+        self.event_classifier = EventTypeClassifier.load(model_path)
+        print(f"   ✅ Loaded event classifier: {model_path}")
+
+    def predict_event_types(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Classify a whole frame with the loaded classifier
+
+        Returns:
+            DataFrame with 'type', 'confidence', 'method' aligned to df,
+            or None if no classifier is loaded
+        """
+        if self.event_classifier is None:
+            return None
+        eventtypes = df['eventtype'].astype(object) if 'eventtype' in df else pd.Series('', index=df.index)
+        return self.event_classifier.predict(df['headline'], eventtypes)
 
     def classify_event_type_with_confidence(
         self,
@@ -146,6 +174,145 @@ class CapitalIQProcessorV3(CapitalIQProcessorV2):
         # No match found
         return ('unknown', 0.0)
 
+    def classify_events_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Column-wise classify_event_type_with_confidence() + infer_event_severity()
+
+        Uses the loaded event classifier instead of the rules if one is set.
+
+        Returns:
+            DataFrame aligned to df with 'type', 'confidence', 'method', 'severity'
+        """
+        headlines = df['headline']
+        eventtypes = df['eventtype'].astype(object) if 'eventtype' in df else pd.Series('', index=df.index, dtype=object)
+
+        labels = self.predict_event_types(df)
+        if labels is None:
+            # Priority 1: headline patterns, 2: Capital IQ mapping, 3: legacy v2 mapping
+            pattern_type = self._select_rules(self._lower(headlines), list(self.EVENT_PATTERNS.items()), 'unknown')
+            legacy_type = self._select_rules(self._lower(eventtypes), self.CAPITAL_IQ_TYPE_RULES, 'unknown')
+            mapped_type = eventtypes.map({k: v[0] for k, v in self.COMPREHENSIVE_CAPITAL_IQ_MAPPING.items()}).to_numpy(dtype=object)
+            mapped_confidence = eventtypes.map({k: v[1] for k, v in self.COMPREHENSIVE_CAPITAL_IQ_MAPPING.items()}).to_numpy(dtype=float)
+
+            conditions = [
+                headlines.isna().to_numpy(),
+                pattern_type != 'unknown',
+                eventtypes.isin(list(self.COMPREHENSIVE_CAPITAL_IQ_MAPPING)).to_numpy(),
+                legacy_type != 'unknown'
+            ]
+            event_types = np.select(conditions, ['unknown', pattern_type, mapped_type, legacy_type], default='unknown')
+            confidence = np.select(conditions, [0.0, 0.95, mapped_confidence, 0.85], default=0.0)
+            method = np.select(
+                [confidence >= 0.95, confidence >= 0.75],
+                ['pattern_match', 'capital_iq_mapping'],
+                default='fallback'
+            )
+
+            labels = pd.DataFrame({
+                'type': event_types.astype(object),
+                'confidence': confidence,
+                'method': method.astype(object)
+            }, index=df.index)
+
+        labels['severity'] = self.infer_event_severity_series(labels['type'], headlines).values
+        return labels
+
+    # Event record layout: top-level fields, then csvSource fields (frame columns)
+    EVENT_FIELDS = ['eventId', 'date', 'type', 'severity', 'actor', 'headline', 'description', 'source', 'entities']
+    CSV_SOURCE_FIELDS = ['rowNumber', 'capitalIqId', 'companyId', 'companyName', 'originalEventType', 'announceDate']
+
+    def entity_type(self, entity_name: str) -> str:
+        """Entity type for an extracted entity name"""
+        return self.CRISIS_ENTITIES.get(entity_name, 'company')
+
+    @staticmethod
+    def entity_id(entity_name: str) -> str:
+        """Entity id for an entity name (ent_lehman_brothers)"""
+        return f"ent_{entity_name.lower().replace(' ', '_')}"
+
+    def build_entities(self, entity_sets: pd.Series) -> Dict[str, Dict]:
+        """Entity records keyed by entity id, built once per unique name"""
+        entities = {}
+        for entity_name in dict.fromkeys(name for names in entity_sets for name in names):
+            entity_id = self.entity_id(entity_name)
+            if entity_id not in entities:
+                entities[entity_id] = {
+                    'entityId': entity_id,
+                    'name': entity_name,
+                    'type': self.entity_type(entity_name)
+                }
+        return entities
+
+    def prepare_event_frame(self, crisis_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Derive every event field column-wise
+
+        Returns:
+            DataFrame aligned to crisis_df with one column per EVENT_FIELDS /
+            CSV_SOURCE_FIELDS entry plus 'confidence' and 'method'
+        """
+        def column(name: str, default) -> pd.Series:
+            if name in crisis_df:
+                return crisis_df[name].astype(object)
+            return pd.Series(default, index=crisis_df.index, dtype=object)
+
+        labels = self.classify_events_frame(crisis_df)
+        dates = crisis_df['announcedate']
+        headlines = column('headline', '')
+
+        if 'keydevid' in crisis_df:
+            event_ids = ['evt_' + str(keydevid) for keydevid in crisis_df['keydevid']]
+        else:
+            event_ids = [f"evt_{idx}" for idx in range(1, len(crisis_df) + 1)]
+
+        return pd.DataFrame({
+            'eventId': event_ids,
+            'date': dates.dt.strftime('%Y-%m-%d').astype(object).where(dates.notna(), None),
+            'type': labels['type'],
+            'severity': labels['severity'],
+            'actor': column('companyname', 'unknown'),
+            'headline': headlines,
+            'description': headlines,  # Use headline as description
+            'source': column('sourcetypename', 'Capital IQ'),
+            'entities': self.extract_entities_from_series(headlines),
+            'rowNumber': crisis_df.index.to_numpy(dtype='int64'),  # Original CSV row number
+            'capitalIqId': [str(value) for value in column('keydevid', '')],
+            'companyId': [str(value) for value in column('companyid', '')],
+            'companyName': column('companyname', ''),
+            'originalEventType': column('eventtype', ''),
+            'announceDate': [ts.isoformat() if pd.notna(ts) else None for ts in dates],
+            'confidence': labels['confidence'].astype(float),
+            'method': labels['method']
+        }, index=crisis_df.index)
+
+    def build_event_records(self, frame: pd.DataFrame) -> List[Dict]:
+        """Emit nested event dicts from a prepared frame (one pass, native types)"""
+        filename = os.path.basename(self.input_file)
+        event_fields = self.EVENT_FIELDS
+        csv_fields = self.CSV_SOURCE_FIELDS
+        columns = event_fields + csv_fields + ['confidence', 'method']
+        n_event, n_csv = len(event_fields), len(csv_fields)
+        entities_pos = event_fields.index('entities')
+
+        # Hundreds of thousands of small dicts trigger repeated GC passes; none
+        # of them form cycles, so pause the collector while building
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            events = []
+            for values in zip(*(frame[col].tolist() for col in columns)):
+                event = dict(zip(event_fields, values[:n_event]))
+                event['entities'] = list(values[entities_pos])
+                event['csvSource'] = {'filename': filename, **dict(zip(csv_fields, values[n_event:n_event + n_csv]))}
+                event['classification'] = {'confidence': values[-2], 'method': values[-1]}
+                events.append(event)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        self.row_index_map.update(zip(frame['eventId'].tolist(), frame['rowNumber'].tolist()))
+        return events
+
     def process_events_with_source_tracking(self) -> Dict:
         """
         Process events with full CSV source metadata
@@ -161,79 +328,18 @@ class CapitalIQProcessorV3(CapitalIQProcessorV2):
         # Extract crisis events
         crisis_df = self.extract_lehman_crisis_events()
 
-        events = []
-        entities = {}
-
-        for idx, (df_idx, row) in enumerate(crisis_df.iterrows(), 1):
-            if idx % 500 == 0:
-                print(f"   Processing event {idx}/{len(crisis_df)}...")
-
-            # Extract entities
-            headline = row.get('headline', '')
-            extracted_entities = self.extract_entities_from_text(headline)
-
-            for entity_name in extracted_entities:
-                if entity_name not in entities:
-                    entity_id = f"ent_{entity_name.lower().replace(' ', '_')}"
-                    entities[entity_id] = {
-                        'entityId': entity_id,
-                        'name': entity_name,
-                        'type': self.CRISIS_ENTITIES.get(entity_name, 'company')
-                    }
-
-            # Classify event with confidence
-            capital_iq_type = row.get('eventtype', '')
-            event_type, confidence = self.classify_event_type_with_confidence(
-                headline,
-                capital_iq_type,
-                df_idx
-            )
-
-            # Infer severity
-            severity = self.infer_event_severity(event_type, headline)
-
-            # Build event with source tracking
-            event_id = f"evt_{row.get('keydevid', idx)}"
-
-            event = {
-                'eventId': event_id,
-                'date': row['announcedate'].strftime('%Y-%m-%d') if pd.notna(row['announcedate']) else None,
-                'type': event_type,
-                'severity': severity,
-                'actor': row.get('companyname', 'unknown'),
-                'headline': headline,
-                'description': headline,  # Use headline as description
-                'source': row.get('sourcetypename', 'Capital IQ'),
-                'entities': list(extracted_entities),
-
-                # NEW: CSV source metadata
-                'csvSource': {
-                    'filename': os.path.basename(self.input_file),
-                    'rowNumber': int(df_idx),  # Original CSV row number
-                    'capitalIqId': str(row.get('keydevid', '')),
-                    'companyId': str(row.get('companyid', '')),
-                    'companyName': row.get('companyname', ''),
-                    'originalEventType': capital_iq_type,
-                    'announceDate': row.get('announcedate').isoformat() if pd.notna(row['announcedate']) else None
-                },
-
-                # NEW: Classification metadata
-                'classification': {
-                    'confidence': confidence,
-                    'method': 'pattern_match' if confidence >= 0.95 else 'capital_iq_mapping' if confidence >= 0.75 else 'fallback'
-                }
-            }
-
-            events.append(event)
-            self.row_index_map[event_id] = int(df_idx)
+        # Derive all fields column-wise, then emit records
+        frame = self.prepare_event_frame(crisis_df)
+        entities = self.build_entities(frame['entities'])
+        events = self.build_event_records(frame)
 
         # Calculate statistics
-        unknown_count = sum(1 for e in events if e['type'] == 'unknown')
-        avg_confidence = sum(e['classification']['confidence'] for e in events) / len(events) if events else 0
+        unknown_count = int((frame['type'] == 'unknown').sum())
+        avg_confidence = float(frame['confidence'].sum()) / len(events) if events else 0
 
         print(f"\n   ✅ Processed {len(events)} events")
         print(f"   ✅ Extracted {len(entities)} entities")
-        print(f"   ✅ Unknown events: {unknown_count} ({(unknown_count/len(events)*100):.1f}%)")
+        print(f"   ✅ Unknown events: {unknown_count} ({(unknown_count / len(events) * 100 if events else 0):.1f}%)")
         print(f"   ✅ Avg confidence: {avg_confidence:.2%}")
 
         return {
@@ -246,8 +352,8 @@ class CapitalIQProcessorV3(CapitalIQProcessorV2):
                 'unknown_events_count': unknown_count,
                 'avg_classification_confidence': round(avg_confidence, 3),
                 'date_range': {
-                    'start': crisis_df['announcedate'].min().strftime('%Y-%m-%d'),
-                    'end': crisis_df['announcedate'].max().strftime('%Y-%m-%d')
+                    'start': crisis_df['announcedate'].min().strftime('%Y-%m-%d') if len(crisis_df) else None,
+                    'end': crisis_df['announcedate'].max().strftime('%Y-%m-%d') if len(crisis_df) else None
                 }
             },
             'events': events,
@@ -267,7 +373,25 @@ def main():
     parser.add_argument(
         '--output',
         default='data/capital_iq_processed/lehman_v3_traced.json',
-        help='Output JSON file'
+        help='Output JSON file (or a *.evstore directory for the columnar event store)'
+    )
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        help='Stream the CSV in chunks of this many rows (bounded memory)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Processes for chunk filtering (default: CPU count)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Load through the typed Parquet cache in this directory (e.g. data/capital_iq_cache)'
+    )
+    parser.add_argument(
+        '--classifier',
+        help='Trained EventTypeClassifier model (default: rule-based classification)'
     )
 
     args = parser.parse_args()
@@ -277,16 +401,13 @@ def main():
     print("=" * 70)
 
     # Process
-    processor = CapitalIQProcessorV3(args.input)
+    processor = CapitalIQProcessorV3(args.input, chunksize=args.chunksize, workers=args.workers, cache_dir=args.cache_dir)
+    if args.classifier:
+        processor.load_event_classifier(args.classifier)
     data = processor.process_events_with_source_tracking()
 
-    # Save
-    output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-
-    with open(args.output, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Save (*.evstore → columnar event store, otherwise JSON)
+    save_event_data(args.output, data)
 
     print(f"\n✅ Saved to: {args.output}")
     print(f"\nQuality Metrics:")
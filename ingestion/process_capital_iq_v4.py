@@ -14,7 +14,9 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
 import json
+import hashlib
 import os
 import sys
 import argparse
@@ -24,6 +26,8 @@ from collections import defaultdict
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from ingestion.process_capital_iq_v3 import CapitalIQProcessorV3
+from ingestion.entity_matcher import EntityMatcher
+from ingestion.event_store import EventStore, EVENT_STORE_SUFFIX, load_event_data, save_event_data
 from config.entity_aliases import get_canonical_name, get_all_aliases
 
 
@@ -170,30 +174,62 @@ class CapitalIQProcessorV4(CapitalIQProcessorV3):
         'Federal Deposit Insurance Corporation': 'regulator',
     }
 
-    def __init__(self, input_file: str):
-        # Call parent init but override CRISIS_ENTITIES
-        super().__init__(input_file)
+    def __init__(
+        self,
+        input_file: str,
+        chunksize: Optional[int] = None,
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None
+    ):
         # Use expanded entity list for better detection
+        # (set before loading: streaming mode filters rows while reading)
         self.CRISIS_ENTITIES = self.CRISIS_ENTITIES_EXPANDED
+        super().__init__(input_file, chunksize=chunksize, workers=workers, cache_dir=cache_dir)
 
-    def extract_entities_from_text(self, text: str) -> Set[str]:
+    def build_entity_matcher(self) -> EntityMatcher:
         """
-        Extract financial entities and return CANONICAL names
+        Compile CRISIS_ENTITIES into a matcher that returns CANONICAL names
 
         Enhancement over parent:
-        - Returns canonical entity names instead of aliases
+        - Aliases resolve to canonical names at match time
         - e.g., "American International Group" → "AIG"
         """
-        # Use parent method to extract raw entity names
-        raw_entities = super().extract_entities_from_text(text)
+        return EntityMatcher(self.CRISIS_ENTITIES.keys(), canonicalize=get_canonical_name)
+
+    # csvSource keeps the original company name next to its canonical form
+    CSV_SOURCE_FIELDS = ['rowNumber', 'capitalIqId', 'companyId', 'companyName', 'companyNameCanonical', 'originalEventType', 'announceDate']
+
+    def entity_type(self, entity_name: str) -> str:
+        """Entity type for a canonical name (falls back to any alias's type)"""
+        # Try canonical name first, then try to find any alias
+        entity_type = self.CRISIS_ENTITIES.get(entity_name)
+        if not entity_type:
+            # Fallback: try all aliases
+            for alias in get_all_aliases(entity_name):
+                entity_type = self.CRISIS_ENTITIES.get(alias)
+                if entity_type:
+                    break
+        return entity_type or 'company'  # Default fallback
+
+    def prepare_event_frame(self, crisis_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Derive every event field column-wise
+
+        Enhancement over parent:
+        - Actor resolved to canonical name (once per unique company)
+        - csvSource keeps the original name for traceability
+        """
+        frame = super().prepare_event_frame(crisis_df)
 
-        # Resolve to canonical names
-        canonical_entities = set()
-        for entity_name in raw_entities:
-            canonical = get_canonical_name(entity_name)
-            canonical_entities.add(canonical)
+        raw_actor = frame['actor']
+        codes, names = pd.factorize(raw_actor)
+        # Missing names (code -1) map to the trailing NaN
+        canonical = np.array([get_canonical_name(name) for name in names] + [np.nan], dtype=object)
 
-        return canonical_entities
+        frame['companyName'] = raw_actor  # Keep original for reference
+        frame['companyNameCanonical'] = canonical[codes]
+        frame['actor'] = frame['companyNameCanonical']  # CANONICAL NAME
+        return frame
 
     def process_events_with_source_tracking(self) -> Dict:
         """
@@ -208,99 +244,18 @@ class CapitalIQProcessorV4(CapitalIQProcessorV3):
         # Extract crisis events
         crisis_df = self.extract_lehman_crisis_events()
 
-        events = []
-        entities = {}
-
-        for idx, (df_idx, row) in enumerate(crisis_df.iterrows(), 1):
-            if idx % 500 == 0:
-                print(f"   Processing event {idx}/{len(crisis_df)}...")
-
-            # Extract entities (now returns canonical names)
-            headline = row.get('headline', '')
-            extracted_entities = self.extract_entities_from_text(headline)
-
-            # Create canonical entity objects
-            for canonical_entity_name in extracted_entities:
-                if canonical_entity_name not in entities:
-                    entity_id = f"ent_{canonical_entity_name.lower().replace(' ', '_')}"
-
-                    # Get entity type from expanded mapping
-                    # Try canonical name first, then try to find any alias
-                    entity_type = self.CRISIS_ENTITIES.get(canonical_entity_name)
-                    if not entity_type:
-                        # Fallback: try all aliases
-                        all_aliases = get_all_aliases(canonical_entity_name)
-                        for alias in all_aliases:
-                            entity_type = self.CRISIS_ENTITIES.get(alias)
-                            if entity_type:
-                                break
-                    if not entity_type:
-                        entity_type = 'company'  # Default fallback
-
-                    entities[entity_id] = {
-                        'entityId': entity_id,
-                        'name': canonical_entity_name,  # Use canonical name
-                        'type': entity_type
-                    }
-
-            # Classify event with confidence
-            capital_iq_type = row.get('eventtype', '')
-            event_type, confidence = self.classify_event_type_with_confidence(
-                headline,
-                capital_iq_type,
-                df_idx
-            )
-
-            # Infer severity
-            severity = self.infer_event_severity(event_type, headline)
-
-            # Resolve actor to canonical name
-            raw_actor = row.get('companyname', 'unknown')
-            canonical_actor = get_canonical_name(raw_actor)
-
-            # Build event with canonical entity references
-            event_id = f"evt_{row.get('keydevid', idx)}"
-
-            event = {
-                'eventId': event_id,
-                'date': row['announcedate'].strftime('%Y-%m-%d') if pd.notna(row['announcedate']) else None,
-                'type': event_type,
-                'severity': severity,
-                'actor': canonical_actor,  # CANONICAL NAME
-                'headline': headline,
-                'description': headline,
-                'source': row.get('sourcetypename', 'Capital IQ'),
-                'entities': list(extracted_entities),  # CANONICAL NAMES
-
-                # CSV source metadata (preserves original for traceability)
-                'csvSource': {
-                    'filename': os.path.basename(self.input_file),
-                    'rowNumber': int(df_idx),
-                    'capitalIqId': str(row.get('keydevid', '')),
-                    'companyId': str(row.get('companyid', '')),
-                    'companyName': raw_actor,  # Keep original for reference
-                    'companyNameCanonical': canonical_actor,  # Add canonical version
-                    'originalEventType': capital_iq_type,
-                    'announceDate': row.get('announcedate').isoformat() if pd.notna(row['announcedate']) else None
-                },
-
-                # Classification metadata
-                'classification': {
-                    'confidence': confidence,
-                    'method': 'pattern_match' if confidence >= 0.95 else 'capital_iq_mapping' if confidence >= 0.75 else 'fallback'
-                }
-            }
-
-            events.append(event)
-            self.row_index_map[event_id] = int(df_idx)
+        # Derive all fields column-wise (entities are canonical names), then emit records
+        frame = self.prepare_event_frame(crisis_df)
+        entities = self.build_entities(frame['entities'])
+        events = self.build_event_records(frame)
 
         # Calculate statistics
-        unknown_count = sum(1 for e in events if e['type'] == 'unknown')
-        avg_confidence = sum(e['classification']['confidence'] for e in events) / len(events) if events else 0
+        unknown_count = int((frame['type'] == 'unknown').sum())
+        avg_confidence = float(frame['confidence'].sum()) / len(events) if events else 0
 
         print(f"\n   ✅ Processed {len(events)} events")
         print(f"   ✅ Extracted {len(entities)} unique entities (deduplicated)")
-        print(f"   ✅ Unknown events: {unknown_count} ({(unknown_count/len(events)*100):.1f}%)")
+        print(f"   ✅ Unknown events: {unknown_count} ({(unknown_count / len(events) * 100 if events else 0):.1f}%)")
         print(f"   ✅ Avg confidence: {avg_confidence:.2%}")
 
         return {
@@ -313,8 +268,8 @@ class CapitalIQProcessorV4(CapitalIQProcessorV3):
                 'unknown_events_count': unknown_count,
                 'avg_classification_confidence': round(avg_confidence, 3),
                 'date_range': {
-                    'start': crisis_df['announcedate'].min().strftime('%Y-%m-%d'),
-                    'end': crisis_df['announcedate'].max().strftime('%Y-%m-%d')
+                    'start': crisis_df['announcedate'].min().strftime('%Y-%m-%d') if len(crisis_df) else None,
+                    'end': crisis_df['announcedate'].max().strftime('%Y-%m-%d') if len(crisis_df) else None
                 },
                 'enhancements': {
                     'entity_deduplication': True,
@@ -326,6 +281,197 @@ class CapitalIQProcessorV4(CapitalIQProcessorV3):
             'entities': list(entities.values())
         }
 
+    # ------------------------------------------------------------------
+    # Incremental processing (keyed on keydevid)
+    # ------------------------------------------------------------------
+
+    # Source columns whose content determines an event
+    INCREMENTAL_HASH_COLUMNS = ['announcedate', 'headline', 'eventtype', 'companyid', 'companyname', 'sourcetypename']
+
+    def rules_fingerprint(self) -> str:
+        """Hash of the extraction/classification rules (a change forces a full rebuild)"""
+        rules = {
+            'entities': sorted(self.CRISIS_ENTITIES.items()),
+            'keywords': self.CRISIS_KEYWORDS,
+            'patterns': self.EVENT_PATTERNS,
+            'mapping': sorted(self.COMPREHENSIVE_CAPITAL_IQ_MAPPING.items()),
+            'type_rules': self.CAPITAL_IQ_TYPE_RULES,
+            'severity': [self.CRITICAL_EVENT_TYPES, self.SEVERITY_KEYWORDS],
+            'classifier': (
+                [self.event_classifier.params, self.event_classifier.fingerprint()]
+                if self.event_classifier is not None else None
+            )
+        }
+        return hashlib.sha256(json.dumps(rules, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def row_hashes(self, crisis_df: pd.DataFrame) -> pd.Series:
+        """Content hash per row over INCREMENTAL_HASH_COLUMNS (hex strings)"""
+        columns = [col for col in self.INCREMENTAL_HASH_COLUMNS if col in crisis_df]
+        hashes = pd.util.hash_pandas_object(crisis_df[columns].astype(object).astype(str), index=False)
+        return hashes.map('{:016x}'.format)
+
+    def summarize_store(self, events: List[Dict], entities: List[Dict]) -> Dict:
+        """Metadata block for a full event/entity store"""
+        unknown_count = sum(1 for e in events if e['type'] == 'unknown')
+        avg_confidence = sum(e['classification']['confidence'] for e in events) / len(events) if events else 0
+        dates = [e['date'] for e in events if e['date']]
+
+        return {
+            'source': 'Capital IQ',
+            'processor_version': 'v4_deduped',
+            'created_at': datetime.now().isoformat(),
+            'events_count': len(events),
+            'entities_count': len(entities),
+            'unknown_events_count': unknown_count,
+            'avg_classification_confidence': round(avg_confidence, 3),
+            'date_range': {
+                'start': min(dates) if dates else None,
+                'end': max(dates) if dates else None
+            },
+            'enhancements': {
+                'entity_deduplication': True,
+                'canonical_naming': True,
+                'alias_resolution': True
+            }
+        }
+
+    def process_incremental(self, store_file: str, manifest_file: str, delta_file: str) -> Dict:
+        """
+        Process only new or changed Capital IQ rows and merge them into the store
+
+        The manifest records keydevid -> content hash for every processed row
+        plus a fingerprint of the rules; if the rules changed, every row is
+        reprocessed. Events whose rows left the crisis set are removed, and
+        entities no longer referenced by any event are dropped. Unchanged
+        events keep the csvSource.rowNumber of the run that produced them.
+
+        Args:
+            store_file: Full event/entity JSON or *.evstore (read if present, rewritten)
+            manifest_file: Manifest JSON (read if present, rewritten)
+            delta_file: Output delta JSON (a change record): 'events'/'entities'
+                hold added and updated records, 'removed' lists deleted
+                event/entity ids. To update AllegroGraph, load the merged
+                store with --diff, which applies the same upserts/deletes and
+                rescores links touching changed events against all events.
+
+        Returns:
+            The delta dict
+        """
+        print(f"\n📊 Incremental processing (store: {store_file})...")
+
+        crisis_df = self.extract_lehman_crisis_events()
+        if 'keydevid' not in crisis_df:
+            raise ValueError("Incremental mode requires a 'keydevid' column")
+
+        # Load previous state
+        fingerprint = self.rules_fingerprint()
+        manifest = {'rules_fingerprint': fingerprint, 'rows': {}}
+        if os.path.exists(manifest_file):
+            with open(manifest_file, 'r') as f:
+                previous = json.load(f)
+            if previous.get('rules_fingerprint') == fingerprint:
+                manifest = previous
+            else:
+                print(f"   ⚠️  Rules changed since last run: reprocessing all rows")
+
+        store = {'events': [], 'entities': []}
+        if os.path.exists(store_file):
+            store = load_event_data(store_file)
+
+        # Diff current rows against the manifest
+        keys = crisis_df['keydevid'].astype(object).map(str)
+        hashes = self.row_hashes(crisis_df)
+        seen = manifest['rows']
+        previous_hashes = keys.map(seen)
+        is_new = previous_hashes.isna()
+        is_changed = ~is_new & (previous_hashes != hashes)
+        pending = crisis_df[(is_new | is_changed).to_numpy()]
+
+        current_ids = set('evt_' + key for key in keys)
+        removed_ids = [e['eventId'] for e in store['events'] if e['eventId'] not in current_ids]
+
+        print(f"   ✅ New rows: {int(is_new.sum()):,}, changed: {int(is_changed.sum()):,}, "
+              f"unchanged: {len(crisis_df) - len(pending):,}, removed: {len(removed_ids):,}")
+
+        # Process only pending rows
+        frame = self.prepare_event_frame(pending)
+        delta_events = self.build_event_records(frame)
+        delta_entities = self.build_entities(frame['entities'])
+
+        # Merge into the store
+        events = {e['eventId']: e for e in store['events']}
+        for event_id in removed_ids:
+            del events[event_id]
+        added = [e for e in delta_events if e['eventId'] not in events]
+        updated = [e for e in delta_events if e['eventId'] in events]
+        events.update((e['eventId'], e) for e in delta_events)
+        merged_events = sorted(events.values(), key=lambda e: (e['date'] is None, e['date'] or ''))
+
+        entities = {e['entityId']: e for e in store['entities']}
+        new_entity_ids = [entity_id for entity_id in delta_entities if entity_id not in entities]
+        entities.update(delta_entities)
+        referenced = {self.entity_id(name) for event in merged_events for name in event['entities']}
+        removed_entity_ids = [entity_id for entity_id in entities if entity_id not in referenced]
+        for entity_id in removed_entity_ids:
+            del entities[entity_id]
+
+        merged_entities = list(entities.values())
+        store = {
+            'metadata': self.summarize_store(merged_events, merged_entities),
+            'events': merged_events,
+            'entities': merged_entities
+        }
+
+        # Manifest covers exactly the rows now in the crisis set
+        manifest = {
+            'rules_fingerprint': fingerprint,
+            'source_file': os.path.basename(self.input_file),
+            'updated_at': datetime.now().isoformat(),
+            'rows': dict(zip(keys, hashes))
+        }
+
+        delta = {
+            'metadata': {
+                'source': 'Capital IQ',
+                'processor_version': 'v4_deduped',
+                'delta': True,
+                'base_file': store_file,
+                'created_at': datetime.now().isoformat(),
+                'added_events_count': len(added),
+                'updated_events_count': len(updated),
+                'removed_events_count': len(removed_ids),
+                'added_entities_count': len(new_entity_ids)
+            },
+            'events': delta_events,
+            'entities': [
+                entities[entity_id] for entity_id in delta_entities if entity_id in entities
+            ],
+            'removed': {
+                'events': removed_ids,
+                'entities': removed_entity_ids
+            }
+        }
+
+        if store_file.rstrip('/').endswith(EVENT_STORE_SUFFIX):
+            EventStore.write(store_file, store)
+            outputs = ((manifest_file, manifest), (delta_file, delta))
+        else:
+            outputs = ((store_file, store), (manifest_file, manifest), (delta_file, delta))
+
+        for path, payload in outputs:
+            output_dir = os.path.dirname(path)
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(payload, f, indent=2)
+            os.replace(tmp_path, path)
+
+        print(f"   ✅ Store: {len(merged_events):,} events, {len(merged_entities)} entities")
+        print(f"   ✅ Delta: +{len(added)} / ~{len(updated)} / -{len(removed_ids)} events → {delta_file}")
+
+        return delta
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -339,7 +485,38 @@ def main():
     parser.add_argument(
         '--output',
         default='data/capital_iq_processed/lehman_v4_deduped.json',
-        help='Output JSON file'
+        help='Output JSON file (or a *.evstore directory for the columnar event store)'
+    )
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        help='Stream the CSV in chunks of this many rows (bounded memory)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Processes for chunk filtering (default: CPU count)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Load through the typed Parquet cache in this directory (e.g. data/capital_iq_cache)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Process only new/changed keydevids and merge into --output'
+    )
+    parser.add_argument(
+        '--manifest',
+        help='Incremental manifest (default: <output dir>/manifests/<name>.manifest.json)'
+    )
+    parser.add_argument(
+        '--delta',
+        help='Incremental delta output (default: <output dir>/deltas/<name>_delta_<timestamp>.json)'
+    )
+    parser.add_argument(
+        '--classifier',
+        help='Trained EventTypeClassifier model (default: rule-based classification)'
     )
 
     args = parser.parse_args()
@@ -349,16 +526,36 @@ def main():
     print("=" * 70)
 
     # Process
-    processor = CapitalIQProcessorV4(args.input)
-    data = processor.process_events_with_source_tracking()
+    processor = CapitalIQProcessorV4(args.input, chunksize=args.chunksize, workers=args.workers, cache_dir=args.cache_dir)
+    if args.classifier:
+        processor.load_event_classifier(args.classifier)
+
+    if args.incremental:
+        stem = os.path.splitext(args.output)[0]
+        # Not next to the output: loaders glob data/capital_iq_processed/*.json
+        manifest_file = args.manifest or os.path.join(
+            os.path.dirname(args.output), 'manifests', f"{os.path.basename(stem)}.manifest.json"
+        )
+        delta_file = args.delta or os.path.join(
+            os.path.dirname(args.output), 'deltas',
+            f"{os.path.basename(stem)}_delta_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        delta = processor.process_incremental(args.output, manifest_file, delta_file)
+
+        print(f"\n✅ Updated: {args.output}")
+        print(f"✅ Manifest: {manifest_file}")
+        print(f"✅ Delta: {delta_file} "
+              f"(+{delta['metadata']['added_events_count']} / ~{delta['metadata']['updated_events_count']} / "
+              f"-{delta['metadata']['removed_events_count']} events)")
+        print(f"\nSync AllegroGraph with the merged store (not the delta):")
+        print(f"  python ingestion/load_capital_iq_to_allegrograph.py --diff --input {os.path.abspath(args.output)}")
+        print("=" * 70 + "\n")
+        return
 
-    # Save
-    output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    data = processor.process_events_with_source_tracking()
 
-    with open(args.output, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Save (*.evstore → columnar event store, otherwise JSON)
+    save_event_data(args.output, data)
 
     print(f"\n✅ Saved to: {args.output}")
     print(f"\nQuality Metrics:")
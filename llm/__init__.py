@@ -11,5 +11,13 @@ Integrates NVIDIA NIM and Nemotron for:
 from .triplet_extractor import TripletExtractor
 from .nemotron_client import NemotronClient
 from .semantic_scorer import SemanticScorer
+from .instrumentation import LLMMetrics, llm_metrics, llm_stage
+from .local_embeddings import (
+    LocalEmbeddingClient, SentenceTransformerEmbedder, HashingEmbedder, get_embedding_client
+)
 
-__all__ = ['TripletExtractor', 'NemotronClient', 'SemanticScorer']
+__all__ = [
+    'TripletExtractor', 'NemotronClient', 'SemanticScorer',
+    'LocalEmbeddingClient', 'SentenceTransformerEmbedder', 'HashingEmbedder',
+    'get_embedding_client', 'LLMMetrics', 'llm_metrics', 'llm_stage'
+]
@@ -0,0 +1,283 @@
+"""
+LLM Call Instrumentation
+
+Records every LLM/embedding call made through NemotronClient,
+NemotronScorer and TripletExtractor:
+- model, call site and pipeline stage
+- prompt/completion tokens and estimated cost (models in MODEL_PRICING only)
+- latency histogram, retries, errors
+- cache hits/misses (SemanticScorer embedding cache)
+
+Metrics are aggregated in-process and exportable as JSON or Prometheus
+text exposition format.
+
+Usage:
+    from llm.instrumentation import llm_metrics, llm_stage
+
+    with llm_stage('evolution.causality'):
+        scorer.compute_causal_score(evt_a, evt_b)
+
+    print(llm_metrics.to_json())
+    open('results/llm_metrics.prom', 'w').write(llm_metrics.to_prometheus())
+"""
+
+import os
+import json
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+# Latency histogram buckets (seconds)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# USD per 1K tokens: model -> (prompt, completion). Filled from the JSON
+# file named by LLM_PRICING_FILE ({"model": [prompt, completion], ...}) or
+# by callers; cost is only reported for models listed here.
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {}
+
+
+def load_model_pricing(path: str) -> Dict[str, Tuple[float, float]]:
+    """Add per-model prices from a JSON file to MODEL_PRICING"""
+    with open(path, 'r') as f:
+        prices = json.load(f)
+    for model, (prompt_price, completion_price) in prices.items():
+        MODEL_PRICING[model] = (float(prompt_price), float(completion_price))
+    return MODEL_PRICING
+
+
+if os.getenv('LLM_PRICING_FILE'):
+    load_model_pricing(os.environ['LLM_PRICING_FILE'])
+
+_current_stage = contextvars.ContextVar('llm_stage', default='default')
+
+
+@contextmanager
+def llm_stage(name: str):
+    """
+    Attribute all LLM calls in this block to a pipeline stage
+
+    Stages nest by replacement (the innermost name wins). Worker threads
+    must be started with contextvars.copy_context() to inherit the stage.
+    """
+    token = _current_stage.set(name)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+
+def current_stage() -> str:
+    return _current_stage.get()
+
+
+class _Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'buckets': {str(b): c for b, c in zip(self.buckets, self.counts)},
+            'sum': round(self.sum, 6),
+            'count': self.count
+        }
+
+
+class LLMMetrics:
+    """
+    Thread-safe registry of LLM call metrics
+
+    Series are keyed by (site, model, stage).
+    """
+
+    COUNTERS = (
+        'calls', 'errors', 'retries',
+        'prompt_tokens', 'completion_tokens', 'cost_usd'
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded metrics"""
+        with self._lock:
+            self._counters = defaultdict(lambda: dict.fromkeys(self.COUNTERS, 0))
+            self._latency = defaultdict(_Histogram)
+            self._cache = defaultdict(lambda: {'hits': 0, 'misses': 0})
+
+    def record_call(
+        self,
+        site: str,
+        model: Optional[str],
+        latency: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        retries: int = 0,
+        error: bool = False,
+        stage: Optional[str] = None
+    ):
+        """
+        Record one LLM call
+
+        Args:
+            site: Call site (e.g. 'nim.generate_text', 'nemotron_scorer.causal')
+            model: Model identifier
+            latency: Wall time in seconds (including retries)
+            prompt_tokens: Prompt tokens reported by the API
+            completion_tokens: Completion tokens reported by the API
+            retries: Retry attempts before the final outcome
+            error: True if the call ultimately failed
+            stage: Pipeline stage (default: current llm_stage())
+        """
+        key = (site, model or 'unknown', stage or current_stage())
+        pricing = MODEL_PRICING.get(model)
+        cost = (prompt_tokens * pricing[0] + completion_tokens * pricing[1]) / 1000 if pricing else 0.0
+
+        with self._lock:
+            counters = self._counters[key]
+            counters['calls'] += 1
+            counters['errors'] += int(error)
+            counters['retries'] += retries
+            counters['prompt_tokens'] += prompt_tokens
+            counters['completion_tokens'] += completion_tokens
+            counters['cost_usd'] += cost
+            self._latency[key].observe(latency)
+
+    def record_cache(self, site: str, hit: bool, count: int = 1, stage: Optional[str] = None):
+        """Record cache hits or misses for a call site"""
+        key = (site, stage or current_stage())
+        with self._lock:
+            self._cache[key]['hits' if hit else 'misses'] += count
+
+    @contextmanager
+    def track(self, site: str, model: Optional[str]):
+        """
+        Time a call and record it on exit
+
+        Yields a dict the caller fills with 'prompt_tokens',
+        'completion_tokens', 'retries' and (optionally) 'model'.
+        Exceptions are recorded as errors and re-raised.
+        """
+        call = {'prompt_tokens': 0, 'completion_tokens': 0, 'retries': 0, 'model': model}
+        start = time.perf_counter()
+        error = False
+        try:
+            yield call
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record_call(
+                site,
+                call['model'],
+                time.perf_counter() - start,
+                prompt_tokens=call['prompt_tokens'] or 0,
+                completion_tokens=call['completion_tokens'] or 0,
+                retries=call['retries'],
+                error=error
+            )
+
+    def to_dict(self) -> Dict:
+        """
+        Snapshot of all metrics plus per-stage totals
+
+        cost_usd is None for models without MODEL_PRICING (and for stages
+        without any priced call) rather than a misleading 0.
+        """
+        with self._lock:
+            calls = []
+            stages = defaultdict(lambda: {**dict.fromkeys(self.COUNTERS + ('latency_seconds',), 0), 'cost_usd': None})
+            for (site, model, stage), counters in sorted(self._counters.items()):
+                histogram = self._latency[(site, model, stage)]
+                priced = model in MODEL_PRICING
+                calls.append({
+                    'site': site,
+                    'model': model,
+                    'stage': stage,
+                    **counters,
+                    'cost_usd': counters['cost_usd'] if priced else None,
+                    'latency_seconds': histogram.to_dict()
+                })
+                for name, value in counters.items():
+                    if name != 'cost_usd':
+                        stages[stage][name] += value
+                if priced:
+                    stages[stage]['cost_usd'] = (stages[stage]['cost_usd'] or 0) + counters['cost_usd']
+                stages[stage]['latency_seconds'] += histogram.sum
+
+            cache = [
+                {'site': site, 'stage': stage, **counts}
+                for (site, stage), counts in sorted(self._cache.items())
+            ]
+
+        return {'calls': calls, 'stages': dict(stages), 'cache': cache}
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = 'feekg_llm') -> str:
+        """Render metrics in Prometheus text exposition format"""
+        snapshot = self.to_dict()
+        lines = []
+
+        def labels(**kw) -> str:
+            escaped = {k: str(v).replace('\\', '\\\\').replace('"', '\\"') for k, v in kw.items()}
+            return '{' + ','.join(f'{k}="{v}"' for k, v in escaped.items()) + '}'
+
+        counter_help = {
+            'calls': 'LLM calls',
+            'errors': 'Failed LLM calls',
+            'retries': 'LLM call retries',
+            'prompt_tokens': 'Prompt tokens consumed',
+            'completion_tokens': 'Completion tokens generated',
+            'cost_usd': 'Estimated cost in USD',
+        }
+        for name, help_text in counter_help.items():
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for call in snapshot['calls']:
+                if call[name] is None:  # cost of an unpriced model
+                    continue
+                lbl = labels(site=call['site'], model=call['model'], stage=call['stage'])
+                lines.append(f"{metric}{lbl} {call[name]}")
+
+        metric = f"{prefix}_latency_seconds"
+        lines.append(f"# HELP {metric} LLM call latency")
+        lines.append(f"# TYPE {metric} histogram")
+        for call in snapshot['calls']:
+            base = dict(site=call['site'], model=call['model'], stage=call['stage'])
+            histogram = call['latency_seconds']
+            for bound, count in histogram['buckets'].items():
+                lines.append(f"{metric}_bucket{labels(**base, le=bound)} {count}")
+            lines.append(f"{metric}_bucket{labels(**base, le='+Inf')} {histogram['count']}")
+            lines.append(f"{metric}_sum{labels(**base)} {histogram['sum']}")
+            lines.append(f"{metric}_count{labels(**base)} {histogram['count']}")
+
+        for outcome in ('hits', 'misses'):
+            metric = f"{prefix}_cache_{outcome}_total"
+            lines.append(f"# HELP {metric} Cache {outcome}")
+            lines.append(f"# TYPE {metric} counter")
+            for entry in snapshot['cache']:
+                lines.append(f"{metric}{labels(site=entry['site'], stage=entry['stage'])} {entry[outcome]}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry used by all instrumented call sites
+llm_metrics = LLMMetrics()
@@ -0,0 +1,228 @@
+"""
+Local CPU Embedding Providers
+
+Offline alternatives to the NVIDIA NIM embedding endpoint. Both providers
+expose the same generate_embeddings() signature as NemotronClient, so they
+can be passed anywhere a NemotronClient is used for embeddings
+(e.g. SemanticScorer):
+
+- SentenceTransformerEmbedder: all-MiniLM-L6-v2 (same model as rag/)
+- HashingEmbedder: dependency-free hashed n-gram vectors for tests/CI
+
+Usage:
+    from llm import SemanticScorer, get_embedding_client
+
+    scorer = SemanticScorer(client=get_embedding_client('hashing'))
+"""
+
+import os
+import re
+import zlib
+import numpy as np
+from typing import List, Optional, Union
+
+
+class LocalEmbeddingClient:
+    """
+    Base class for local embedding providers
+
+    Subclasses implement _embed_batch(); batching, similarity and
+    health checks are shared.
+    """
+
+    model_name = 'local'
+
+    def __init__(self, batch_size: int = 64, num_threads: Optional[int] = None):
+        """
+        Initialize local embedding client
+
+        Args:
+            batch_size: Number of texts encoded per inference call
+            num_threads: CPU threads for inference (None = library default)
+        """
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+
+    def generate_embeddings(
+        self,
+        texts: Union[str, List[str]],
+        model: Optional[str] = None,
+        input_type: str = 'passage'
+    ) -> List[List[float]]:
+        """
+        Generate embeddings locally
+
+        Args:
+            texts: Single text or list of texts
+            model: Ignored (kept for NemotronClient compatibility)
+            input_type: Ignored (kept for NemotronClient compatibility)
+
+        Returns:
+            List of embedding vectors
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+
+        embeddings = []
+        for i in range(0, len(texts), self.batch_size):
+            batch = texts[i:i + self.batch_size]
+            embeddings.extend(self._embed_batch(batch).tolist())
+
+        return embeddings
+
+    def compute_similarity(self, text1: str, text2: str, model: Optional[str] = None) -> float:
+        """
+        Compute cosine similarity between two texts
+
+        Returns:
+            Cosine similarity score (0.0-1.0)
+        """
+        vec1, vec2 = (np.asarray(v) for v in self.generate_embeddings([text1, text2]))
+
+        norm1 = np.linalg.norm(vec1)
+        norm2 = np.linalg.norm(vec2)
+        if norm1 == 0 or norm2 == 0:
+            return 0.0
+
+        similarity = np.dot(vec1, vec2) / (norm1 * norm2)
+        return float(max(0.0, min(1.0, similarity)))  # Clamp to [0, 1]
+
+    def health_check(self) -> dict:
+        """Local providers are healthy if they can embed a probe string"""
+        try:
+            self.generate_embeddings('health check')
+            return {'status': 'healthy', 'model': self.model_name}
+        except Exception as e:
+            return {'status': 'unhealthy', 'error': str(e)}
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class SentenceTransformerEmbedder(LocalEmbeddingClient):
+    """
+    CPU embeddings with sentence-transformers
+
+    Defaults to all-MiniLM-L6-v2 (384 dims), the model used by rag/.
+    The model is loaded lazily on first use.
+    """
+
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        batch_size: int = 64,
+        num_threads: Optional[int] = None,
+        device: str = 'cpu'
+    ):
+        super().__init__(batch_size=batch_size, num_threads=num_threads)
+        self.model_name = model_name
+        self.device = device
+        self._model = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            if self.num_threads:
+                import torch
+                torch.set_num_threads(self.num_threads)
+
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+
+
+class HashingEmbedder(LocalEmbeddingClient):
+    """
+    Hashed word n-gram embeddings (no model download, no network)
+
+    Deterministic across processes (CRC32, not Python's salted hash()),
+    so cached vectors and test expectations stay stable. Vectors are
+    L2-normalized, so cosine similarity reduces to token overlap.
+    Pure numpy and cheap enough that it runs single-threaded.
+    """
+
+    _TOKEN_RE = re.compile(r"[a-z0-9&']+")
+
+    def __init__(
+        self,
+        dim: int = 1024,
+        ngram_range: tuple = (1, 2),
+        batch_size: int = 256
+    ):
+        super().__init__(batch_size=batch_size)
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.model_name = f'hashing-{dim}'
+
+    def _features(self, text: str) -> List[str]:
+        tokens = self._TOKEN_RE.findall(text.lower())
+        features = []
+        min_n, max_n = self.ngram_range
+        for n in range(min_n, max_n + 1):
+            features.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return features
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+
+        rows, cols, signs = [], [], []
+        for row, text in enumerate(texts):
+            for feature in self._features(text or ''):
+                h = zlib.crc32(feature.encode('utf-8'))
+                rows.append(row)
+                cols.append(h % self.dim)
+                signs.append(1.0 if h & 0x80000000 else -1.0)
+
+        if rows:
+            np.add.at(matrix, (rows, cols), signs)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+
+def get_embedding_client(backend: Optional[str] = None, **kwargs):
+    """
+    Factory for the configured embedding provider
+
+    Args:
+        backend: 'nim', 'minilm' or 'hashing' (default: EMBEDDING_BACKEND env, then 'nim')
+        **kwargs: Passed to the provider constructor
+
+    Returns:
+        Object exposing generate_embeddings()
+    """
+    backend = (backend or os.getenv('EMBEDDING_BACKEND', 'nim')).lower()
+
+    if backend in ('nim', 'nvidia'):
+        from .nemotron_client import NemotronClient
+        return NemotronClient(**kwargs)
+    elif backend in ('minilm', 'sentence-transformers', 'local'):
+        return SentenceTransformerEmbedder(**kwargs)
+    elif backend == 'hashing':
+        return HashingEmbedder(**kwargs)
+    else:
+        raise ValueError(f"Unknown embedding backend: {backend}. Use 'nim', 'minilm' or 'hashing'")
+
+
+# Example usage
+if __name__ == '__main__':
+    embedder = HashingEmbedder()
+
+    sim = embedder.compute_similarity(
+        "Evergrande defaults on debt",
+        "Evergrande defaults on offshore debt"
+    )
+    print(f"Hashing similarity: {sim:.3f}")
+
+    emb = embedder.generate_embeddings(["Financial risk assessment"])
+    print(f"Embedding dimension: {len(emb[0])}")
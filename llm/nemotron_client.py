@@ -9,9 +9,14 @@ Provides interface to NVIDIA NIM microservices for:
 
 import os
 import json
+import time
 import requests
 from typing import List, Dict, Optional, Union
 from datetime import datetime
+from .instrumentation import llm_metrics
+
+# Responses worth retrying (rate limits, transient server errors)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 
 class NemotronClient:
@@ -24,16 +29,24 @@ class NemotronClient:
     - Custom fine-tuned models
     """
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_retries: Optional[int] = None
+    ):
         """
         Initialize NVIDIA NIM client
 
         Args:
             api_key: NVIDIA API key (from env if not provided)
             base_url: NIM endpoint URL (from env if not provided)
+            max_retries: Retries on connection errors, 429 and 5xx
+                (default NIM_MAX_RETRIES or 2)
         """
         self.api_key = api_key or os.getenv('NVIDIA_API_KEY')
         self.base_url = base_url or os.getenv('NVIDIA_NIM_URL', 'https://integrate.api.nvidia.com/v1')
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('NIM_MAX_RETRIES', 2))
 
         if not self.api_key:
             raise ValueError("NVIDIA_API_KEY not found in environment or parameters")
@@ -43,12 +56,37 @@ class NemotronClient:
             'Content-Type': 'application/json'
         }
 
+    def _post(self, url: str, payload: Dict, call: Dict) -> Dict:
+        """
+        POST with exponential backoff on transient failures
+
+        Records the retries taken in call['retries'] (see llm_metrics.track).
+        """
+        for attempt in range(self.max_retries + 1):
+            call['retries'] = attempt
+            last_attempt = attempt == self.max_retries
+            try:
+                response = requests.post(url, headers=self.headers, json=payload, timeout=30)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                    response.raise_for_status()
+                    return response.json()
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    time.sleep(min(int(retry_after), 30))
+                    continue
+            time.sleep(0.5 * 2 ** attempt)
+
     def generate_text(
         self,
         prompt: str,
         model: str = 'meta/llama-3.1-8b-instruct',
         max_tokens: int = 1024,
         temperature: float = 0.2,
+        metrics_site: str = 'nim.generate_text',
         **kwargs
     ) -> Dict:
         """
@@ -59,6 +97,7 @@ class NemotronClient:
             model: Model identifier
             max_tokens: Maximum response tokens
             temperature: Sampling temperature (0.0-1.0)
+            metrics_site: Call-site label recorded in llm_metrics
             **kwargs: Additional generation parameters
 
         Returns:
@@ -75,14 +114,17 @@ class NemotronClient:
         }
 
         try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            with llm_metrics.track(metrics_site, model) as call:
+                data = self._post(url, payload, call)
+
+                usage = data.get('usage') or {}
+                call['prompt_tokens'] = usage.get('prompt_tokens', 0)
+                call['completion_tokens'] = usage.get('completion_tokens', 0)
 
             return {
                 'text': data['choices'][0]['message']['content'],
                 'model': data.get('model'),
-                'tokens': data.get('usage', {})
+                'tokens': usage
             }
         except requests.exceptions.RequestException as e:
             raise Exception(f"NIM API request failed: {e}")
@@ -116,9 +158,10 @@ class NemotronClient:
         }
 
         try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            with llm_metrics.track('nim.generate_embeddings', model) as call:
+                data = self._post(url, payload, call)
+
+                call['prompt_tokens'] = (data.get('usage') or {}).get('prompt_tokens', 0)
 
             return [item['embedding'] for item in data['data']]
         except requests.exceptions.RequestException as e:
@@ -5,11 +5,14 @@ Replaces simple keyword matching with deep learning embeddings:
 - NV-Embed-v2 for high-quality semantic similarity
 - Financial domain-specific scoring
 - Multi-modal similarity (events, entities, risks)
+- Offline scoring via local embedding providers (llm/local_embeddings.py)
 """
 
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from .nemotron_client import NemotronClient
+from .local_embeddings import LocalEmbeddingClient, get_embedding_client
+from .instrumentation import llm_metrics
 
 
 class SemanticScorer:
@@ -20,14 +23,15 @@ class SemanticScorer:
     with embedding-based approach for higher accuracy
     """
 
-    def __init__(self, client: Optional[NemotronClient] = None):
+    def __init__(self, client: Optional[Union[NemotronClient, LocalEmbeddingClient]] = None):
         """
         Initialize semantic scorer
 
         Args:
-            client: NemotronClient instance (creates new if not provided)
+            client: Embedding provider with generate_embeddings()
+                    (creates one from EMBEDDING_BACKEND if not provided)
         """
-        self.client = client or NemotronClient()
+        self.client = client or get_embedding_client()
         self._embedding_cache = {}  # Cache embeddings to reduce API calls
 
     def compute_event_similarity(
@@ -228,8 +232,12 @@ class SemanticScorer:
         """
         # Check cache
         if use_cache and text in self._embedding_cache:
+            llm_metrics.record_cache('semantic_scorer.embeddings', hit=True)
             return self._embedding_cache[text]
 
+        if use_cache:
+            llm_metrics.record_cache('semantic_scorer.embeddings', hit=False)
+
         # Generate embedding
         embeddings = self.client.generate_embeddings([text], input_type='passage')
         embedding = np.array(embeddings[0])
@@ -263,6 +271,9 @@ class SemanticScorer:
                 uncached_texts.append(text)
                 uncached_indices.append(i)
 
+        llm_metrics.record_cache('semantic_scorer.embeddings', hit=True, count=len(texts) - len(uncached_texts))
+        llm_metrics.record_cache('semantic_scorer.embeddings', hit=False, count=len(uncached_texts))
+
         # Generate embeddings for uncached texts
         if uncached_texts:
             new_embeddings = self.client.generate_embeddings(uncached_texts, input_type='passage')
@@ -5,11 +5,16 @@ Implements NVIDIA GraphRAG triplet extraction pattern:
 - Text → LLM → Structured triplets → Graph database
 - Achieves 98% accuracy with fine-tuned Llama-3 8B
 - Handles financial domain-specific entity/event recognition
+- Chunked, concurrent, resumable extraction for long documents
 """
 
+import os
 import re
 import json
-from typing import List, Dict, Optional, Tuple
+import hashlib
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
 from datetime import datetime
 from .nemotron_client import NemotronClient
 
@@ -77,35 +82,271 @@ class TripletExtractor:
                 'date': str
             }
         """
+        try:
+            return self._extract_chunk(text, source, date, model)
+        except Exception as e:
+            print(f"Warning: Triplet extraction failed: {e}")
+            return []
+
+    def extract_from_document(
+        self,
+        text: str,
+        doc_id: str,
+        source: Optional[str] = None,
+        date: Optional[str] = None,
+        model: str = 'meta/llama-3.1-8b-instruct',
+        chunk_tokens: int = 1500,
+        overlap_tokens: int = 150,
+        max_workers: int = 4,
+        checkpoint_dir: Optional[str] = None
+    ) -> Dict:
+        """
+        Extract triplets from a long document
+
+        The text is split into overlapping token-bounded chunks, chunks are
+        extracted concurrently, and triplets are merged across chunks by
+        normalized (subject, predicate, object). With checkpoint_dir set,
+        finished chunks are persisted so an interrupted run resumes where
+        it stopped; failed chunks are retried on the next run.
+
+        Args:
+            text: Full document text
+            doc_id: Stable document identifier (used for the checkpoint file)
+            source: Source identifier (defaults to doc_id)
+            date: Publication date (YYYY-MM-DD)
+            model: LLM model to use
+            chunk_tokens: Maximum tokens per chunk
+            overlap_tokens: Tokens shared between consecutive chunks
+            max_workers: Concurrent LLM requests
+            checkpoint_dir: Directory for per-document checkpoints (None = no checkpointing)
+
+        Returns:
+            {
+                'doc_id': str,
+                'triplets': [...],        # merged, deduplicated
+                'chunks': int,
+                'failed_chunks': [int],   # chunk indices that raised
+                'complete': bool
+            }
+        """
+        source = source or doc_id
+        chunks = self.chunk_text(text, chunk_tokens, overlap_tokens)
+
+        checkpoint = self._load_checkpoint(checkpoint_dir, doc_id, text, chunk_tokens, overlap_tokens)
+        completed = checkpoint['completed']
+        pending = [i for i in range(len(chunks)) if str(i) not in completed]
+        failed = []
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    # copy_context() keeps the caller's llm_stage() for metrics attribution
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self._extract_chunk, chunks[i], source, date, model
+                    ): i
+                    for i in pending
+                }
+                for future in as_completed(futures):
+                    chunk_idx = futures[future]
+                    try:
+                        completed[str(chunk_idx)] = future.result()
+                    except Exception as e:
+                        print(f"Warning: {doc_id} chunk {chunk_idx} extraction failed: {e}")
+                        failed.append(chunk_idx)
+                        continue
+                    self._save_checkpoint(checkpoint_dir, doc_id, checkpoint)
+
+        complete = not failed
+        checkpoint['complete'] = complete
+        self._save_checkpoint(checkpoint_dir, doc_id, checkpoint)
+
+        chunk_results = [(int(i), triplets) for i, triplets in completed.items()]
+        return {
+            'doc_id': doc_id,
+            'triplets': self.merge_triplets(chunk_results),
+            'chunks': len(chunks),
+            'failed_chunks': sorted(failed),
+            'complete': complete
+        }
+
+    def extract_from_documents(
+        self,
+        documents: Iterable[Tuple[str, str]],
+        checkpoint_dir: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """
+        Extract triplets from a corpus of (doc_id, text) pairs
+
+        Documents whose checkpoint is already complete are served from the
+        checkpoint without any LLM calls, so re-running over a partially
+        processed corpus only pays for unfinished documents.
+
+        Args:
+            documents: Iterable of (doc_id, text)
+            checkpoint_dir: Directory for per-document checkpoints
+            **kwargs: Passed to extract_from_document()
+
+        Yields:
+            extract_from_document() result per document
+        """
+        for doc_id, text in documents:
+            yield self.extract_from_document(text, doc_id, checkpoint_dir=checkpoint_dir, **kwargs)
+
+    @staticmethod
+    def chunk_text(text: str, chunk_tokens: int = 1500, overlap_tokens: int = 150) -> List[str]:
+        """
+        Split text into overlapping token-bounded chunks
+
+        Tokens are whitespace-delimited words, which keeps chunks safely
+        under the model context without a tokenizer dependency.
+
+        Args:
+            text: Input text
+            chunk_tokens: Maximum tokens per chunk
+            overlap_tokens: Tokens repeated at the start of the next chunk
+
+        Returns:
+            List of chunk strings (a single chunk for short texts)
+        """
+        if overlap_tokens >= chunk_tokens:
+            raise ValueError("overlap_tokens must be smaller than chunk_tokens")
+
+        tokens = text.split()
+        if len(tokens) <= chunk_tokens:
+            return [text] if tokens else []
+
+        step = chunk_tokens - overlap_tokens
+        chunks = []
+        for start in range(0, len(tokens), step):
+            chunks.append(' '.join(tokens[start:start + chunk_tokens]))
+            if start + chunk_tokens >= len(tokens):
+                break
+
+        return chunks
+
+    @staticmethod
+    def merge_triplets(chunk_results: List[Tuple[int, List[Dict]]]) -> List[Dict]:
+        """
+        Merge triplets across chunks, deduplicating by normalized
+        (subject, predicate, object)
+
+        The highest-confidence occurrence is kept and annotated with the
+        chunk indices the triplet was found in.
+
+        Args:
+            chunk_results: List of (chunk_index, triplets)
+
+        Returns:
+            Deduplicated triplets in chunk order
+        """
+        merged = {}
+        for chunk_idx, triplets in sorted(chunk_results, key=lambda x: x[0]):
+            for triplet in triplets:
+                key = (
+                    _normalize_node(triplet['subject']),
+                    triplet['predicate'],
+                    _normalize_node(triplet['object'])
+                )
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = dict(triplet, chunks=[chunk_idx])
+                else:
+                    if chunk_idx not in existing['chunks']:
+                        existing['chunks'].append(chunk_idx)
+                    if triplet['confidence'] > existing['confidence']:
+                        merged[key] = dict(triplet, chunks=existing['chunks'])
+
+        return list(merged.values())
+
+    def _extract_chunk(
+        self,
+        text: str,
+        source: Optional[str],
+        date: Optional[str],
+        model: str
+    ) -> List[Dict]:
+        """Extract and validate triplets from one chunk (raises on LLM failure)"""
         # Construct domain-specific prompt
         prompt = self._build_extraction_prompt(text)
 
         # Call LLM
-        try:
-            response = self.client.generate_text(
-                prompt=prompt,
-                model=model,
-                max_tokens=2048,
-                temperature=0.1
-            )
-
-            # Parse response
-            raw_triplets = self._parse_llm_response(response['text'])
-
-            # Post-process and validate
-            validated_triplets = []
-            for triplet in raw_triplets:
+        response = self.client.generate_text(
+            prompt=prompt,
+            model=model,
+            max_tokens=2048,
+            temperature=0.1,
+            metrics_site='triplet_extractor.extract_triplets'
+        )
+
+        # Parse response
+        raw_triplets = self._parse_llm_response(response['text'])
+
+        # Post-process and validate (a malformed triplet is skipped, not the chunk)
+        validated_triplets = []
+        for triplet in raw_triplets:
+            try:
                 validated = self._validate_and_enrich_triplet(
                     triplet, text, source, date
                 )
-                if validated:
-                    validated_triplets.append(validated)
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                print(f"Warning: skipping malformed triplet {triplet!r}: {e}")
+                continue
+            if validated:
+                validated_triplets.append(validated)
 
-            return validated_triplets
+        return validated_triplets
 
-        except Exception as e:
-            print(f"Warning: Triplet extraction failed: {e}")
-            return []
+    @staticmethod
+    def _checkpoint_path(checkpoint_dir: str, doc_id: str) -> str:
+        safe_id = re.sub(r'[^A-Za-z0-9_.-]', '_', doc_id)[:80]
+        digest = hashlib.sha1(doc_id.encode('utf-8')).hexdigest()[:10]
+        return os.path.join(checkpoint_dir, f"{safe_id}_{digest}.json")
+
+    def _load_checkpoint(
+        self,
+        checkpoint_dir: Optional[str],
+        doc_id: str,
+        text: str,
+        chunk_tokens: int,
+        overlap_tokens: int
+    ) -> Dict:
+        """Load a document checkpoint, discarding it if text or chunking changed"""
+        fingerprint = hashlib.sha1(
+            f"{chunk_tokens}:{overlap_tokens}:{text}".encode('utf-8')
+        ).hexdigest()
+        fresh = {'doc_id': doc_id, 'fingerprint': fingerprint, 'completed': {}, 'complete': False}
+
+        if not checkpoint_dir:
+            return fresh
+
+        path = self._checkpoint_path(checkpoint_dir, doc_id)
+        if not os.path.exists(path):
+            return fresh
+
+        try:
+            with open(path, 'r') as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return fresh
+
+        if checkpoint.get('fingerprint') != fingerprint:
+            return fresh
+
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint_dir: Optional[str], doc_id: str, checkpoint: Dict):
+        """Atomically write a document checkpoint"""
+        if not checkpoint_dir:
+            return
+
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        path = self._checkpoint_path(checkpoint_dir, doc_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
 
     def extract_events(
         self,
@@ -148,7 +389,8 @@ Events (JSON):"""
             response = self.client.generate_text(
                 prompt=prompt,
                 max_tokens=2048,
-                temperature=0.1
+                temperature=0.1,
+                metrics_site='triplet_extractor.extract_events'
             )
 
             events = self._parse_json_response(response['text'])
@@ -212,7 +454,8 @@ Entities (JSON):"""
             response = self.client.generate_text(
                 prompt=prompt,
                 max_tokens=1024,
-                temperature=0.1
+                temperature=0.1,
+                metrics_site='triplet_extractor.extract_entities'
             )
 
             entities = self._parse_json_response(response['text'])
@@ -306,8 +549,11 @@ JSON triplets:"""
         Returns:
             Enriched triplet or None if invalid
         """
-        # Check required fields
-        if not all(k in triplet for k in ['subject', 'predicate', 'object']):
+        # Check required fields (non-empty strings)
+        if not isinstance(triplet, dict):
+            return None
+        if not all(isinstance(triplet.get(k), str) and triplet[k].strip()
+                   for k in ['subject', 'predicate', 'object']):
             return None
 
         # Normalize predicate
@@ -346,6 +592,10 @@ JSON triplets:"""
         # Simple heuristic: events are usually lowercase/phrases, entities are proper nouns
         event_keywords = ['crisis', 'default', 'downgrade', 'pressure', 'sale', 'restructuring']
 
+        node_text = node_text.strip()
+        if not node_text:
+            return 'event'
+
         text_lower = node_text.lower()
         if any(kw in text_lower for kw in event_keywords):
             return 'event'
@@ -408,6 +658,11 @@ JSON triplets:"""
         return 'unknown'
 
 
+def _normalize_node(text: str) -> str:
+    """Normalize a subject/object for cross-chunk deduplication"""
+    return ' '.join(text.lower().split()).strip(' .,;:"\'')
+
+
 # Example usage
 if __name__ == '__main__':
     # Sample financial news text
@@ -7,6 +7,7 @@ Provides high-performance query functions optimized for graph visualization:
 - Time-window filtering for focused views
 - Degree-based filtering for showing key nodes first
 - Caching for repeated queries
+- Named-graph partitions: time-window scans touch only overlapping periods
 
 Time Complexity Improvements:
 - Full graph load: O(n) → O(k) where k << n (paginated)
@@ -14,16 +15,60 @@ Time Complexity Improvements:
 - Degree filtering: O(n) → O(k log k) (sorted subset)
 """
 
-import requests
 import os
+import sys
 import time
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from functools import lru_cache
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config.graph_partitions import parse_graph, graphs_in_window
+from config.sparql_session import sparql_query
+from config.async_sparql import query_all
+
 load_dotenv()
 
+# Named-graph partitions per repository URL: (partitions, fetched at), shared
+# by all backends (the API creates one OptimizedGraphBackend per request)
+_partitions_cache: Dict[str, Tuple[List[str], float]] = {}
+
+# Graph statistics: independent queries, sent together by get_graph_stats_cached
+STATS_QUERIES = {
+    'total_events': """
+PREFIX feekg: <http://feekg.org/ontology#>
+
+SELECT (COUNT(?event) as ?count)
+WHERE {
+    ?event a feekg:Event .
+}
+""",
+    'total_entities': """
+PREFIX feekg: <http://feekg.org/ontology#>
+SELECT (COUNT(DISTINCT ?entity) as ?count)
+WHERE { ?entity a feekg:Entity . }
+""",
+    'total_links': """
+PREFIX feekg: <http://feekg.org/ontology#>
+SELECT (COUNT(?link) as ?count)
+WHERE { ?from feekg:evolvesTo ?to . }
+""",
+    'date_range': """
+PREFIX feekg: <http://feekg.org/ontology#>
+SELECT (MIN(?date) as ?start) (MAX(?date) as ?end)
+WHERE { ?event feekg:date ?date . }
+""",
+    'event_type_distribution': """
+PREFIX feekg: <http://feekg.org/ontology#>
+SELECT ?type (COUNT(?event) as ?count)
+WHERE { ?event feekg:eventType ?type . }
+GROUP BY ?type
+ORDER BY DESC(?count)
+"""
+}
+
 
 class OptimizedGraphBackend:
     """
@@ -50,22 +95,29 @@ class OptimizedGraphBackend:
         self.cache = {}
         self.cache_ttl = 300  # 5 minutes
 
-    def _query_sparql(self, query: str, timeout: int = 30) -> Optional[Dict]:
-        """Execute SPARQL query and return JSON results"""
+    def _query_sparql(self, query: str, timeout: Optional[int] = None) -> Optional[Dict]:
+        """Execute SPARQL query and return JSON results (shared keep-alive session)"""
         try:
-            response = requests.get(
-                self.repo_url,
-                params={'query': query},
-                headers={'Accept': 'application/sparql-results+json'},
-                auth=self.auth,
-                timeout=timeout
-            )
-            response.raise_for_status()
+            response = sparql_query(self.repo_url, query, auth=self.auth, timeout=timeout)
             return response.json()
         except Exception as e:
             print(f"Query error: {e}")
             return None
 
+    def _query_sparql_many(self, queries: Dict[str, str]) -> Dict[str, Optional[Dict]]:
+        """
+        Execute independent SPARQL queries concurrently
+
+        Takes as long as the slowest query instead of their sum. Failed
+        queries come back as None, as with _query_sparql.
+        """
+        results = query_all(self.repo_url, queries, auth=self.auth, return_exceptions=True)
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                print(f"Query error ({name}): {result}")
+                results[name] = None
+        return results
+
     def get_events_paginated(
         self,
         offset: int = 0,
@@ -148,25 +200,36 @@ OFFSET {offset}
 
         Time Complexity: O(1) after first call
         """
-        query = """
-PREFIX feekg: <http://feekg.org/ontology#>
+        return self._parse_count(self._query_sparql(STATS_QUERIES['total_events']))
 
-SELECT (COUNT(?event) as ?count)
-WHERE {
-    ?event a feekg:Event .
-}
-"""
-        result = self._query_sparql(query)
-        if result:
-            return int(result['results']['bindings'][0]['count']['value'])
-        return 0
+    def get_partitions(self) -> List[str]:
+        """
+        Named-graph partitions in the store (see config/graph_partitions.py)
+
+        Cached per repository for cache_ttl across backend instances; empty
+        for stores loaded without --partition.
+        """
+        cached = _partitions_cache.get(self.repo_url)
+        if cached and time.time() - cached[1] < self.cache_ttl:
+            return cached[0]
+
+        result = self._query_sparql("SELECT DISTINCT ?g WHERE { GRAPH ?g { } }")
+        if result is None:
+            return []
+        partitions = sorted(
+            binding['g']['value'] for binding in result['results']['bindings']
+            if parse_graph(binding['g']['value'])
+        )
+        _partitions_cache[self.repo_url] = (partitions, time.time())
+        return partitions
 
     def get_events_by_timewindow(
         self,
         start_date: str,
         end_date: str,
         entity_filter: Optional[str] = None,
-        limit: int = 500
+        limit: int = 500,
+        dataset: Optional[str] = None
     ) -> List[Dict]:
         """
         Get events in specific time window
@@ -174,11 +237,16 @@ WHERE {
         Time Complexity: O(k) where k << n (only matching events)
         vs O(n) for full table scan
 
+        On a partitioned store only the year/quarter graphs overlapping the
+        window are scanned (FROM NAMED + GRAPH); otherwise the whole
+        default graph is filtered by date.
+
         Args:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             entity_filter: Optional entity ID to filter by
             limit: Max results
+            dataset: Only this dataset's partitions (e.g. 'lehman_v4_deduped')
 
         Returns:
             List of events with full metadata
@@ -187,14 +255,9 @@ WHERE {
             # Sept 2008 (Lehman crisis) → ~300 events instead of 4,398
             events = backend.get_events_by_timewindow('2008-09-01', '2008-09-30')
         """
-        entity_clause = f'?event feekg:involves <feekg:{entity_filter}> .' if entity_filter else ''
+        entity_clause = f'?event feekg:involves feekg:{entity_filter} .' if entity_filter else ''
 
-        query = f"""
-PREFIX feekg: <http://feekg.org/ontology#>
-PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-SELECT ?event ?eventId ?type ?date ?label ?severity ?actor
-WHERE {{
+        pattern = f"""
     ?event a feekg:Event .
     ?event feekg:eventType ?type .
     ?event feekg:date ?date .
@@ -205,6 +268,27 @@ WHERE {{
     FILTER(?date >= "{start_date}"^^xsd:date && ?date <= "{end_date}"^^xsd:date)
 
     {entity_clause}
+"""
+
+        partitions = self.get_partitions()
+        if partitions:
+            graphs = graphs_in_window(partitions, start_date, end_date, dataset)
+            if not graphs:
+                return []
+            dataset_clause = "\n".join(f"FROM NAMED <{graph}>" for graph in graphs)
+            pattern = f"GRAPH ?g {{{pattern}}}"
+        else:
+            dataset_clause = ""
+
+        query = f"""
+PREFIX feekg: <http://feekg.org/ontology#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+
+SELECT ?event ?eventId ?type ?date ?label ?severity ?actor
+{dataset_clause}
+WHERE {{
+    {pattern}
 
     BIND(STRAFTER(STR(?event), "#") AS ?eventId)
 }}
@@ -305,6 +389,9 @@ LIMIT {limit}
         Time Complexity: O(d^k) where d = avg degree, k = hops
         Returns local subgraph instead of full graph
 
+        Reads the link nodes' from/to/score directly (no evolvesTo join), so
+        both the reified and the compact link encoding of the loader work.
+
         Args:
             event_id: Central event ID
             max_hops: Number of hops to traverse
@@ -327,16 +414,14 @@ SELECT ?neighbor ?neighborId ?label ?score ?direction
 WHERE {{
     {{
         # Outgoing links
-        <feekg:{event_id}> feekg:evolvesTo ?neighbor .
-        ?linkNode feekg:from <feekg:{event_id}> .
+        ?linkNode feekg:from feekg:{event_id} .
         ?linkNode feekg:to ?neighbor .
         ?linkNode feekg:score ?score .
         BIND("out" AS ?direction)
     }} UNION {{
         # Incoming links
-        ?neighbor feekg:evolvesTo <feekg:{event_id}> .
+        ?linkNode feekg:to feekg:{event_id} .
         ?linkNode feekg:from ?neighbor .
-        ?linkNode feekg:to <feekg:{event_id}> .
         ?linkNode feekg:score ?score .
         BIND("in" AS ?direction)
     }}
@@ -396,6 +481,9 @@ WHERE {{
         Time Complexity: O(1) after first computation
         vs O(n) for computing on every request
 
+        The five statistics queries run concurrently (one round trip of
+        latency instead of five).
+
         Returns:
             {
                 'total_events': int,
@@ -415,12 +503,13 @@ WHERE {{
                 return cached_data
 
         # Compute stats
+        results = self._query_sparql_many(STATS_QUERIES)
         stats = {
-            'total_events': self.get_total_event_count(),
-            'total_entities': self._get_entity_count(),
-            'total_links': self._get_link_count(),
-            'date_range': self._get_date_range(),
-            'event_type_distribution': self._get_event_type_distribution(),
+            'total_events': self._parse_count(results['total_events']),
+            'total_entities': self._parse_count(results['total_entities']),
+            'total_links': self._parse_count(results['total_links']),
+            'date_range': self._parse_date_range(results['date_range']),
+            'event_type_distribution': self._parse_type_distribution(results['event_type_distribution']),
             'timestamp': time.time()
         }
 
@@ -431,36 +520,28 @@ WHERE {{
 
     def _get_entity_count(self) -> int:
         """Get total entity count"""
-        query = """
-PREFIX feekg: <http://feekg.org/ontology#>
-SELECT (COUNT(DISTINCT ?entity) as ?count)
-WHERE { ?entity a feekg:Entity . }
-"""
-        result = self._query_sparql(query)
-        if result:
-            return int(result['results']['bindings'][0]['count']['value'])
-        return 0
+        return self._parse_count(self._query_sparql(STATS_QUERIES['total_entities']))
 
     def _get_link_count(self) -> int:
         """Get total evolution link count"""
-        query = """
-PREFIX feekg: <http://feekg.org/ontology#>
-SELECT (COUNT(?link) as ?count)
-WHERE { ?from feekg:evolvesTo ?to . }
-"""
-        result = self._query_sparql(query)
+        return self._parse_count(self._query_sparql(STATS_QUERIES['total_links']))
+
+    def _get_date_range(self) -> Dict:
+        """Get earliest and latest event dates"""
+        return self._parse_date_range(self._query_sparql(STATS_QUERIES['date_range']))
+
+    def _get_event_type_distribution(self) -> Dict:
+        """Get event counts by type"""
+        return self._parse_type_distribution(self._query_sparql(STATS_QUERIES['event_type_distribution']))
+
+    @staticmethod
+    def _parse_count(result: Optional[Dict]) -> int:
         if result:
             return int(result['results']['bindings'][0]['count']['value'])
         return 0
 
-    def _get_date_range(self) -> Dict:
-        """Get earliest and latest event dates"""
-        query = """
-PREFIX feekg: <http://feekg.org/ontology#>
-SELECT (MIN(?date) as ?start) (MAX(?date) as ?end)
-WHERE { ?event feekg:date ?date . }
-"""
-        result = self._query_sparql(query)
+    @staticmethod
+    def _parse_date_range(result: Optional[Dict]) -> Dict:
         if result and result['results']['bindings']:
             binding = result['results']['bindings'][0]
             return {
@@ -469,16 +550,8 @@ WHERE { ?event feekg:date ?date . }
             }
         return {}
 
-    def _get_event_type_distribution(self) -> Dict:
-        """Get event counts by type"""
-        query = """
-PREFIX feekg: <http://feekg.org/ontology#>
-SELECT ?type (COUNT(?event) as ?count)
-WHERE { ?event feekg:eventType ?type . }
-GROUP BY ?type
-ORDER BY DESC(?count)
-"""
-        result = self._query_sparql(query)
+    @staticmethod
+    def _parse_type_distribution(result: Optional[Dict]) -> Dict:
         if result:
             distribution = {}
             for binding in result['results']['bindings']:
@@ -610,10 +683,10 @@ def get_paginated_events(offset=0, limit=100):
     return backend.get_events_paginated(offset, limit)
 
 
-def get_timewindow_events(start, end, entity=None):
+def get_timewindow_events(start, end, entity=None, dataset=None):
     """Quick access for API endpoints"""
     backend = OptimizedGraphBackend()
-    return backend.get_events_by_timewindow(start, end, entity)
+    return backend.get_events_by_timewindow(start, end, entity, dataset=dataset)
 
 
 def get_high_impact_events(min_degree=5, limit=100):
@@ -22,6 +22,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ingestion.process_capital_iq_v2 import CapitalIQProcessorV2
+from ingestion.capital_iq_cache import load_capital_iq, DEFAULT_CACHE_DIR
 
 
 def analyze_raw_csv(csv_file):
@@ -33,22 +34,13 @@ def analyze_raw_csv(csv_file):
     print(f"\nAnalyzing: {csv_file}")
     print()
 
-    # Load CSV
+    # Load CSV (typed columnar cache; parsed once per file version)
     print("1. Loading CSV...")
-    try:
-        df = pd.read_csv(csv_file, encoding='utf-8', on_bad_lines='skip', low_memory=False)
-    except:
-        df = pd.read_csv(csv_file, encoding='latin-1', on_bad_lines='skip', low_memory=False)
-
-    # Normalize columns
-    df.columns = df.columns.str.lower().str.strip()
+    df = load_capital_iq(csv_file, columns=['announcedate', 'headline', 'eventtype'], cache_dir=DEFAULT_CACHE_DIR)
 
     print(f"   ✓ Loaded {len(df):,} total events")
     print()
 
-    # Convert date
-    df['announcedate'] = pd.to_datetime(df['announcedate'], errors='coerce')
-
     # Filter to crisis period
     print("2. Filtering to crisis period (2007-2009)...")
     crisis_df = df[(df['announcedate'] >= '2007-01-01') &
@@ -59,6 +51,7 @@ def analyze_raw_csv(csv_file):
     # Analyze Capital IQ event types
     print("3. Analyzing Capital IQ event types...")
     eventtype_counts = crisis_df['eventtype'].value_counts()
+    eventtype_counts = eventtype_counts[eventtype_counts > 0]  # Categorical: drop types outside the period
 
     print(f"   ✓ Found {len(eventtype_counts)} unique event types")
     print(f"\n   Top 20 Capital IQ Event Types:")
@@ -70,7 +63,7 @@ def analyze_raw_csv(csv_file):
 
     # Test current processor
     print("4. Testing current classification logic...")
-    processor = CapitalIQProcessorV2(csv_file)
+    processor = CapitalIQProcessorV2(csv_file, cache_dir=DEFAULT_CACHE_DIR)
 
     # Sample classifications
     sample_size = min(1000, len(crisis_df))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Evolution Link Encoding Benchmark
+
+Loads the same events and evolution links twice into a local rdflib-backed
+stand-in SPARQL endpoint, once per link encoding:
+- reified: evolvesTo + blank-node EvolutionLink (type/from/to/score/*Score)
+- compact: evolvesTo + link IRI with from/to/score + packed componentScores
+
+and compares link upload time, store size (triples) and
+OptimizedGraphBackend.get_event_neighborhood latency over the best-connected
+events. Both encodings must return the same neighborhoods.
+
+Absolute numbers are rdflib's, not AllegroGraph's; the ratios between the
+encodings are the interesting part.
+
+Usage:
+    python scripts/utils/benchmark_link_encoding.py
+    python scripts/utils/benchmark_link_encoding.py --events 1000 --queries 100
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from rdflib import Graph
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# The loader imports config, which requires AllegroGraph credentials
+for var in ('AG_URL', 'AG_USER', 'AG_PASS'):
+    os.environ.setdefault(var, 'http://127.0.0.1' if var == 'AG_URL' else 'benchmark')
+
+from ingestion.event_store import load_event_data
+from evolution.methods import compute_all_evolution_links
+
+
+class StandInSPARQLEndpoint(BaseHTTPRequestHandler):
+    """Repository endpoint over an in-memory rdflib graph"""
+
+    protocol_version = 'HTTP/1.1'
+    graph = Graph()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: bytes = b'', content_type: str = 'text/plain'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with self.lock:
+            self.graph.parse(data=body.decode('utf-8'), format='turtle')
+        self._reply(204)
+
+    def do_DELETE(self):
+        with self.lock:
+            self.__class__.graph = Graph()
+        self._reply(204)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.endswith('/size'):
+            self._reply(200, str(len(self.graph)).encode('utf-8'))
+            return
+        query = parse_qs(url.query)['query'][0]
+        with self.lock:
+            result = self.graph.query(query)
+        self._reply(200, result.serialize(format='json'), 'application/sparql-results+json')
+
+
+def neighborhood_key(neighborhood: dict) -> list:
+    return sorted((link['from'], link['to'], round(link['score'], 4)) for link in neighborhood['links'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark reified vs compact evolution link encodings')
+    parser.add_argument('--input', default='data/capital_iq_processed/lehman_v3_traced.json',
+                        help='Processed JSON file or *.evstore')
+    parser.add_argument('--events', type=int, default=500, help='Events to load (links grow ~quadratically)')
+    parser.add_argument('--queries', type=int, default=50, help='Neighborhood queries per encoding')
+    parser.add_argument('--min-score', type=float, default=0.3, help='get_event_neighborhood min_score')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInSPARQLEndpoint)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ['AG_URL'] = f"http://127.0.0.1:{server.server_port}"
+    from ingestion.load_capital_iq_to_allegrograph import AllegroGraphRDFLoader, LINK_ENCODINGS
+    from query.optimized_graph_queries import OptimizedGraphBackend
+
+    data = load_event_data(args.input)
+    data['events'] = data['events'][:args.events]
+
+    print("\n" + "=" * 70)
+    print("  Evolution Link Encoding Benchmark")
+    print("=" * 70)
+    print(f"\n📊 {args.input}: {len(data['events']):,} events, {len(data['entities'])} entities")
+
+    links = compute_all_evolution_links(data['events'], data['entities'], threshold=0.2)
+    degree = Counter()
+    for link in links:
+        degree[link['from']] += 1
+        degree[link['to']] += 1
+    centers = [event_id for event_id, _ in degree.most_common(args.queries)]
+    print(f"   {len(links):,} evolution links; querying the {len(centers)} best-connected events\n")
+
+    results = []
+    for encoding in LINK_ENCODINGS:
+        loader = AllegroGraphRDFLoader(link_encoding=encoding)
+        backend = OptimizedGraphBackend()
+
+        StandInSPARQLEndpoint.graph = Graph()
+        for batch in loader.iter_turtle_batches(data):
+            loader.upload_turtle(batch)
+        base_triples = loader.get_triple_count()
+
+        start = time.time()
+        for batch in loader.iter_evolution_link_batches(links):
+            loader.upload_turtle(batch)
+        load_seconds = time.time() - start
+        link_triples = loader.get_triple_count() - base_triples
+
+        latencies, answers = [], {}
+        for event_id in centers:
+            start = time.perf_counter()
+            answers[event_id] = neighborhood_key(backend.get_event_neighborhood(event_id, min_score=args.min_score))
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+
+        result = {
+            'encoding': encoding,
+            'load_seconds': load_seconds,
+            'link_triples': link_triples,
+            'total_triples': base_triples + link_triples,
+            'median_ms': latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+            'p95_ms': latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+            'answers': answers
+        }
+        results.append(result)
+        print(f"   {encoding:8} load {load_seconds:6.2f}s  {link_triples:8,} link triples "
+              f"({link_triples / max(len(links), 1):.1f}/link)  {result['total_triples']:8,} total  "
+              f"neighborhood p50 {result['median_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms")
+
+    server.shutdown()
+
+    reified, compact = results
+    print(f"\n   compact vs reified: {reified['link_triples'] / max(compact['link_triples'], 1):.1f}x fewer link triples, "
+          f"{reified['load_seconds'] / max(compact['load_seconds'], 1e-9):.1f}x faster link load, "
+          f"{reified['median_ms'] / max(compact['median_ms'], 1e-9):.1f}x neighborhood speed (p50)")
+
+    if reified['answers'] != compact['answers']:
+        print("\n❌ Neighborhoods differ between encodings")
+        sys.exit(1)
+    edges = sum(len(answer) for answer in compact['answers'].values())
+    print(f"\n✅ Both encodings returned the same {edges:,} neighborhood links")
+    print("=" * 70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+RDF Upload Path Benchmark
+
+Uploads one processed Capital IQ file to a local stand-in statements
+endpoint and compares:
+- Turtle, serial (upload_turtle_with_retry per batch, the original path)
+- Turtle, parallel (BatchUploader)
+- gzip N-Triples sized by bytes, chunked transfer encoding
+
+The endpoint reads the body as sent (Content-Length or chunked), counts
+bytes on the wire, decompresses gzip and counts received triples. Optional
+per-request latency and bandwidth throttling approximate a remote server.
+
+With --fuseki the same paths load into a real triple store instead: the
+dataset's Graph Store Protocol endpoint (cleared before each path, triples
+counted with SPARQL afterwards), which parses and indexes like AllegroGraph
+does. Start one with scripts/setup_fuseki.sh.
+
+Usage:
+    python scripts/utils/benchmark_rdf_upload.py
+    python scripts/utils/benchmark_rdf_upload.py \\
+        --input data/capital_iq_processed/lehman_v3_traced.json --bandwidth-mbps 20 --latency-ms 50
+    python scripts/utils/benchmark_rdf_upload.py --fuseki http://localhost:3030 --dataset feekg
+"""
+
+import os
+import sys
+import gzip
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# The loader imports config, which requires AllegroGraph credentials
+for var in ('AG_URL', 'AG_USER', 'AG_PASS'):
+    os.environ.setdefault(var, 'http://127.0.0.1' if var == 'AG_URL' else 'benchmark')
+
+from ingestion.event_store import load_event_data
+
+
+class StandInEndpoint(BaseHTTPRequestHandler):
+    """Statements endpoint that accepts and counts uploads"""
+
+    protocol_version = 'HTTP/1.1'
+    stats = {'requests': 0, 'wire_bytes': 0, 'triples': 0}
+    lock = threading.Lock()
+    latency = 0.0
+    bandwidth = None   # bytes per second
+
+    def log_message(self, *args):
+        pass
+
+    def _read_body(self) -> bytes:
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            parts = []
+            while True:
+                size = int(self.rfile.readline().strip().split(b';')[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                parts.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b''.join(parts)
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def do_POST(self):
+        body = self._read_body()
+        wire_bytes = len(body)
+
+        delay = self.latency + (wire_bytes / self.bandwidth if self.bandwidth else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        text = body.decode('utf-8')
+        if 'turtle' in self.headers.get('Content-Type', ''):
+            triples = sum(1 for line in text.splitlines() if line and not line.startswith('@prefix'))
+        else:
+            triples = text.count('\n')
+
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats['wire_bytes'] += wire_bytes
+            self.stats['triples'] += triples
+
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        body = str(self.stats['triples']).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Turtle vs gzip N-Triples uploads')
+    parser.add_argument('--input', default='data/capital_iq_processed/lehman_v3_traced.json',
+                        help='Processed JSON file or *.evstore')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent uploads for the parallel paths')
+    parser.add_argument('--batch-mb', type=int, default=8, help='Uncompressed MB per N-Triples batch')
+    parser.add_argument('--latency-ms', type=float, default=20, help='Simulated per-request latency')
+    parser.add_argument('--bandwidth-mbps', type=float, default=50,
+                        help='Simulated upstream bandwidth in Mbit/s (0 = unthrottled)')
+    parser.add_argument('--fuseki', help='Load into this Fuseki server instead of the stand-in endpoint')
+    parser.add_argument('--dataset', default='feekg', help='Fuseki dataset (cleared before each path)')
+    args = parser.parse_args()
+
+    server = fuseki = None
+    if args.fuseki:
+        from config.fuseki_backend import FusekiBackend
+        fuseki = FusekiBackend(args.fuseki, args.dataset)
+        if not fuseki.test_connection():
+            print(f"❌ Fuseki not accessible at {args.fuseki}")
+            sys.exit(1)
+    else:
+        StandInEndpoint.latency = args.latency_ms / 1000
+        StandInEndpoint.bandwidth = args.bandwidth_mbps * 1e6 / 8 if args.bandwidth_mbps else None
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StandInEndpoint)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        os.environ['AG_URL'] = f"http://127.0.0.1:{server.server_port}"
+
+    from ingestion.load_capital_iq_to_allegrograph import AllegroGraphRDFLoader
+    loader = AllegroGraphRDFLoader()
+    if fuseki:
+        loader.statements_url = f"{fuseki.data_endpoint}?default"
+        loader.auth = fuseki.auth
+
+    data = load_event_data(args.input)
+
+    print("\n" + "=" * 70)
+    print("  RDF Upload Benchmark")
+    print("=" * 70)
+    print(f"\n📊 {args.input}: {len(data['events']):,} events, {len(data['entities'])} entities")
+    if fuseki:
+        print(f"   Fuseki: {fuseki.data_endpoint}\n")
+    else:
+        print(f"   Stand-in endpoint: {args.latency_ms:.0f} ms latency, "
+              f"{f'{args.bandwidth_mbps:.0f} Mbit/s' if args.bandwidth_mbps else 'unthrottled'}\n")
+
+    def turtle_serial():
+        for batch in loader.iter_turtle_batches(data):
+            loader.upload_turtle_with_retry(batch)
+
+    def turtle_parallel():
+        loader.create_uploader(workers=args.workers).upload(
+            loader.iter_turtle_batches(data), label='Turtle batch'
+        )
+
+    def ntriples_gzip():
+        loader.upload_compressed(data, loader.create_uploader(workers=args.workers), batch_bytes=args.batch_mb << 20)
+
+    # Progress lines from the uploaders are suppressed
+    results = []
+    for label, upload in (('Turtle (serial)', turtle_serial),
+                          (f'Turtle ({args.workers} workers)', turtle_parallel),
+                          (f'gzip N-Triples ({args.workers} workers)', ntriples_gzip)):
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            if fuseki:
+                fuseki.clear_dataset()
+            StandInEndpoint.stats.update(requests=0, wire_bytes=0, triples=0)
+            start = time.time()
+            upload()
+            elapsed = time.time() - start
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        if fuseki:
+            # Request and byte counts are only known to the stand-in endpoint
+            result = {'triples': fuseki.get_stats()['total_triples'], 'label': label, 'seconds': elapsed}
+            print(f"   {label:32} {result['triples']:9,} triples  {elapsed:6.2f}s")
+        else:
+            result = dict(StandInEndpoint.stats, label=label, seconds=elapsed)
+            print(f"   {label:32} {result['requests']:5,} req  {result['wire_bytes'] / 1e6:8.2f} MB  "
+                  f"{result['triples']:9,} triples  {elapsed:6.2f}s")
+        results.append(result)
+
+    if server:
+        server.shutdown()
+
+    baseline = results[0]
+    print()
+    for result in results[1:]:
+        fewer_bytes = '' if fuseki else f"{baseline['wire_bytes'] / max(result['wire_bytes'], 1):.1f}x fewer bytes, "
+        print(f"   {result['label']}: {fewer_bytes}"
+              f"{baseline['seconds'] / max(result['seconds'], 1e-9):.1f}x faster than {baseline['label']}")
+
+    if len({result['triples'] for result in results}) != 1:
+        print("\n❌ Triple counts differ between paths")
+        sys.exit(1)
+    print(f"\n✅ All paths delivered {baseline['triples']:,} triples")
+    print("=" * 70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,9 +3,13 @@
 Check if loaded data follows FE-EKG ontology structure
 """
 import os
-import requests
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.sparql_session import sparql_query
+
 load_dotenv()
 
 base_url = os.getenv('AG_URL', 'https://qa-agraph.nelumbium.ai/').rstrip('/')
@@ -20,15 +24,7 @@ auth = (user, password)
 def run_query(query):
     """Run SPARQL query"""
     try:
-        response = requests.get(
-            repo_url,
-            params={'query': query},
-            headers={'Accept': 'application/sparql-results+json'},
-            auth=auth,
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
+        return sparql_query(repo_url, query, auth=auth).json()
     except Exception as e:
         print(f"Query failed: {e}")
         return None
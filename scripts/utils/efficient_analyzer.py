@@ -5,12 +5,16 @@ Efficient FEEKG Analyzer - Fast queries and analysis
 Provides pre-built queries for common analysis tasks
 """
 import os
-import requests
+import sys
 import json
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.sparql_session import sparql_query
+
 load_dotenv()
 
 class FEEKGAnalyzer:
@@ -29,14 +33,7 @@ class FEEKGAnalyzer:
     def query(self, sparql: str) -> List[Dict]:
         """Execute SPARQL query and return results"""
         try:
-            response = requests.get(
-                self.repo_url,
-                params={'query': sparql},
-                headers={'Accept': 'application/sparql-results+json'},
-                auth=self.auth,
-                timeout=30
-            )
-            response.raise_for_status()
+            response = sparql_query(self.repo_url, sparql, auth=self.auth)
             result = response.json()
             return result.get('results', {}).get('bindings', [])
         except Exception as e:
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Vectorized Classification Parity Check
+
+Compares the column-wise classifier (CapitalIQProcessorV3.classify_events_frame)
+against the row-wise path it replaces:
+- classify_event_type_with_confidence() → type, confidence
+- confidence thresholds → method
+- infer_event_severity() → severity
+- classify_event_type() vs classify_event_type_series() (v2 legacy path)
+
+Runs on built-in edge cases (missing headlines/types, mapped and legacy
+Capital IQ types, every headline pattern) and optionally on a real CSV.
+
+Usage:
+    python scripts/utils/verify_vectorized_classification.py
+    python scripts/utils/verify_vectorized_classification.py \\
+        --input data/capital_iq_raw/capital_iq_download.csv --sample 200000
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from ingestion.process_capital_iq_v3 import CapitalIQProcessorV3
+
+
+def build_edge_case_csv(path: str):
+    """Write a small CSV covering every rule branch"""
+    processor_cls = CapitalIQProcessorV3
+
+    headlines = [None, '', 'Quarterly update', 'LEHMAN FILES CHAPTER 11', 'S&P cuts rating on bank']
+    for patterns in processor_cls.EVENT_PATTERNS.values():
+        headlines.extend(f"Company {pattern} announced" for pattern in patterns)
+    for _, keywords in processor_cls.SEVERITY_KEYWORDS:
+        headlines.extend(f"Neutral note on {keyword}" for keyword in keywords)
+
+    eventtypes = [None, '']
+    eventtypes.extend(list(processor_cls.COMPREHENSIVE_CAPITAL_IQ_MAPPING)[:50])
+    for _, terms in processor_cls.CAPITAL_IQ_TYPE_RULES:
+        eventtypes.extend(f"Other {term.title()} Event" for term in terms)
+
+    rows = [
+        {'announcedate': '2008-09-15', 'headline': headline, 'eventtype': eventtype}
+        for headline in headlines
+        for eventtype in eventtypes
+    ]
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def row_wise(processor: CapitalIQProcessorV3, df: pd.DataFrame) -> pd.DataFrame:
+    """Reference labels from the original per-row methods"""
+    records = []
+    for df_idx, row in df.iterrows():
+        headline = row.get('headline', '')
+        capital_iq_type = row.get('eventtype', '')
+        event_type, confidence = processor.classify_event_type_with_confidence(headline, capital_iq_type, df_idx)
+        method = 'pattern_match' if confidence >= 0.95 else 'capital_iq_mapping' if confidence >= 0.75 else 'fallback'
+        records.append({
+            'type': event_type,
+            'confidence': confidence,
+            'method': method,
+            'severity': processor.infer_event_severity(event_type, headline),
+            'legacy_type': processor.classify_event_type(headline, capital_iq_type)
+        })
+    return pd.DataFrame(records, index=df.index)
+
+
+def compare(processor: CapitalIQProcessorV3, df: pd.DataFrame, label: str) -> bool:
+    """Print per-column mismatches; return True on exact parity"""
+    print(f"\n🔍 {label}: {len(df):,} rows")
+
+    expected = row_wise(processor, df)
+    actual = processor.classify_events_frame(df)
+    eventtypes = df['eventtype'] if 'eventtype' in df else pd.Series('', index=df.index)
+    actual['legacy_type'] = processor.classify_event_type_series(df['headline'], eventtypes)
+
+    ok = True
+    for column in ['type', 'confidence', 'method', 'severity', 'legacy_type']:
+        mismatches = (expected[column].values != actual[column].values).sum()
+        status = "✅" if mismatches == 0 else "❌"
+        print(f"   {status} {column:12}: {mismatches} mismatches")
+        if mismatches:
+            ok = False
+            diff = expected[column].values != actual[column].values
+            sample = df[diff].head(5)
+            for (df_idx, row), exp, act in zip(sample.iterrows(), expected[column][diff], actual[column][diff]):
+                print(f"      row {df_idx}: {row.get('headline')!r} / {row.get('eventtype')!r} → expected {exp!r}, got {act!r}")
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify vectorized event classification parity')
+    parser.add_argument('--input', help='Capital IQ CSV to check in addition to edge cases')
+    parser.add_argument('--sample', type=int, default=100000, help='Rows to sample from --input')
+    args = parser.parse_args()
+
+    print("\n" + "=" * 70)
+    print("  Vectorized Classification Parity Check")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'edge_cases.csv')
+        build_edge_case_csv(path)
+        processor = CapitalIQProcessorV3(path)
+        ok = compare(processor, processor.df, 'Edge cases')
+
+    if args.input:
+        processor = CapitalIQProcessorV3(args.input)
+        df = processor.df
+        if len(df) > args.sample:
+            df = df.sample(args.sample, random_state=42)
+        ok = compare(processor, df, os.path.basename(args.input)) and ok
+
+    print("\n" + "=" * 70)
+    print("✅ Exact parity" if ok else "❌ Parity check FAILED")
+    print("=" * 70 + "\n")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -74,27 +74,6 @@ class OptimizedVisualizer:
         }
         ORDER BY ?label
         """
-        entities = self.backend.execute_query(entity_query)
-
-        # Clean and deduplicate entities
-        entity_nodes = {}
-        for e in entities:
-            label = clean_rdf_literal(e.get('label', ''))
-            if not label:
-                continue
-
-            entity_type = clean_rdf_literal(e.get('type', 'unknown')).lower()
-
-            if label not in entity_nodes:
-                entity_nodes[label] = {
-                    'id': label,
-                    'label': label,
-                    'type': entity_type,
-                    'group': 'entity',
-                    'uri': e['entity']
-                }
-
-        print(f"  ✓ Loaded {len(entity_nodes)} clean entities")
 
         # Fetch events with CSV metadata - prioritize events involving our entities
         event_query = f"""
@@ -118,7 +97,60 @@ class OptimizedVisualizer:
         ORDER BY ?date
         LIMIT {max_events}
         """
-        events = self.backend.execute_query(event_query)
+
+        # Event → Entity relationships (involves/hasTarget, actor)
+        involves_query = """
+        PREFIX feekg: <http://feekg.org/ontology#>
+        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+        SELECT ?event ?entity ?entityLabel ?eventType
+        WHERE {
+          ?event feekg:involves ?entity .
+          ?entity rdfs:label ?entityLabel .
+          ?event feekg:eventType ?eventType .
+        }
+        LIMIT 2000
+        """
+
+        actor_query = """
+        PREFIX feekg: <http://feekg.org/ontology#>
+
+        SELECT ?event ?actor
+        WHERE {
+          ?event a feekg:Event .
+          ?event feekg:actor ?actor .
+        }
+        LIMIT 2000
+        """
+
+        # The four queries are independent: send them together
+        entities, events, involves, actors = self.backend.execute_queries(
+            [entity_query, event_query, involves_query, actor_query],
+            return_exceptions=True
+        )
+        for result in (entities, events):
+            if isinstance(result, Exception):
+                raise result
+
+        # Clean and deduplicate entities
+        entity_nodes = {}
+        for e in entities:
+            label = clean_rdf_literal(e.get('label', ''))
+            if not label:
+                continue
+
+            entity_type = clean_rdf_literal(e.get('type', 'unknown')).lower()
+
+            if label not in entity_nodes:
+                entity_nodes[label] = {
+                    'id': label,
+                    'label': label,
+                    'type': entity_type,
+                    'group': 'entity',
+                    'uri': e['entity']
+                }
+
+        print(f"  ✓ Loaded {len(entity_nodes)} clean entities")
 
         event_nodes = {}
         event_uri_to_id = {}
@@ -154,23 +186,11 @@ class OptimizedVisualizer:
 
         print(f"  ✓ Loaded {len(event_nodes)} events with provenance")
 
-        # Fetch relationships
+        # Relationships
         links = []
 
-        # Event → Entity (involves/hasTarget) - fetch ALL for our events
+        # Event → Entity (involves/hasTarget) - ALL for our events
         # Distinguish between "involves" and "hasTarget" based on event type
-        involves_query = """
-        PREFIX feekg: <http://feekg.org/ontology#>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-        SELECT ?event ?entity ?entityLabel ?eventType
-        WHERE {
-          ?event feekg:involves ?entity .
-          ?entity rdfs:label ?entityLabel .
-          ?event feekg:eventType ?eventType .
-        }
-        LIMIT 2000
-        """
 
         # Event types where "involves" means "target" (affected entity)
         target_event_types = {
@@ -179,7 +199,8 @@ class OptimizedVisualizer:
         }
 
         try:
-            involves = self.backend.execute_query(involves_query)
+            if isinstance(involves, Exception):
+                raise involves
             involves_count = 0
             target_count = 0
             for rel in involves:
@@ -208,19 +229,10 @@ class OptimizedVisualizer:
             print(f"  ⚠ 'involves/hasTarget' relationship loading: {str(e)[:100]}")
 
         # Event → Entity (actor) - stored as literal, need to match to entities
-        actor_query = """
-        PREFIX feekg: <http://feekg.org/ontology#>
-
-        SELECT ?event ?actor
-        WHERE {
-          ?event a feekg:Event .
-          ?event feekg:actor ?actor .
-        }
-        LIMIT 2000
-        """
 
         try:
-            actors = self.backend.execute_query(actor_query)
+            if isinstance(actors, Exception):
+                raise actors
             actor_count = 0
             for rel in actors:
                 event_uri = rel['event']